@@ -1,9542 +1,959 @@
 window.QUOTES_DATA = [
   {
-    "text": "I don't recognize my face anymore",
     "song": "Bucket Listener",
     "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Was it always this strange-looking and why can't I just live?",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Why do I have to be this way?",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I just want to be a person again",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I just want to feel real again",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I want to crack jokes and dance under the stars with my friends again",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I would like to bankrupt the casino accidentally",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "There's so much I still want to do",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I want to hit the road with you again",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Rome, Paris, London, Cairo, Cape Town, Bangkok, Hong Kong, Los Angeles",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Bangkok again, Cartagena for ceviche and a swim",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I wanna watch you sleeping and get high off how beautiful you are",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I don't want this life anymore",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I don't wanna see that big black dog in the corner of my room every night",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I want to tan naked with you right next to me",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Also naked",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I want to feel pеace",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I wanna see you in the black dress again",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "With your hair up, looking at mе",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Telling me that you think we shouldn't pay for the meal we just had because it really wasn't very good",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "My head hurts, but I know what I have to do",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I need to stop being cool and start being hot",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I need to mix the blue with the yellow",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I need to call her back",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I know what to say when the robot asks me for my name",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I know that love is the only thought and pain is the only feeling",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I don't recognize my face anymore / Was it always this strange-looking and why can't I just live?",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Was it always this strange-looking and why can't I just live? / Why do I have to be this way?",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Why do I have to be this way? / I just want to be a person again",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I just want to be a person again / I just want to feel real again",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I just want to feel real again / I want to crack jokes and dance under the stars with my friends again",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I want to crack jokes and dance under the stars with my friends again / I would like to bankrupt the casino accidentally",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I would like to bankrupt the casino accidentally / There's so much I still want to do",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "There's so much I still want to do / I want to hit the road with you again",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I want to hit the road with you again / Rome, Paris, London, Cairo, Cape Town, Bangkok, Hong Kong, Los Angeles",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Rome, Paris, London, Cairo, Cape Town, Bangkok, Hong Kong, Los Angeles / Bangkok again, Cartagena for ceviche and a swim",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Bangkok again, Cartagena for ceviche and a swim / I wanna watch you sleeping and get high off how beautiful you are",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I wanna watch you sleeping and get high off how beautiful you are / I don't want this life anymore",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I don't want this life anymore / I don't wanna see that big black dog in the corner of my room every night",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I don't wanna see that big black dog in the corner of my room every night / I want to tan naked with you right next to me",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I want to tan naked with you right next to me / Also naked",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Also naked / I want to feel pеace",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I want to feel pеace / I wanna see you in the black dress again",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I wanna see you in the black dress again / With your hair up, looking at mе",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "With your hair up, looking at mе / Telling me that you think we shouldn't pay for the meal we just had because it really wasn't very good",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Telling me that you think we shouldn't pay for the meal we just had because it really wasn't very good / My head hurts, but I know what I have to do",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "My head hurts, but I know what I have to do / I need to stop being cool and start being hot",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I need to stop being cool and start being hot / I need to mix the blue with the yellow",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I need to mix the blue with the yellow / I need to call her back",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I need to call her back / I know what to say when the robot asks me for my name",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I know what to say when the robot asks me for my name / I know that love is the only thought and pain is the only feeling",
-    "song": "Bucket Listener",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "It was mostly peaceful, chaotic, but mostly peaceful chaos",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I took my shoes off",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I got ready with how I was feeling",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I ate the apple and lost myself to paradise",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But the thing they don't tell you is that it's your body that leaves your soul",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Not the other way around",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "You can literally feel your heart stop beating",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And it's not, it's not even that strange",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "You know what's gonna happen, but you aren't angry that you do know",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And in fact, the fact that you do know gives you some secret feeling of bliss",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And it's not in any way diminished",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "When that thing that you know is going to happen does eventually happen",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "That's how I felt",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I felt happy in a secret way",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Naked, obviously",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Angry that I could hear voices",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But really, like, I was at peace with everything",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Just me and my slowly slowing heart in a crowd of faces asking me for my name and what the date was",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And whether or not we were in a time of national crisis",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I don't know, kindness is so strange",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "The shame doesn't really capture the feeling, you know",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "How it felt to be in front of them like that",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Blinking like a cat who just found out the mouse he's been trying to kill for the last ten years just ate his last piece of cheese",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "The only strange thing was that I could see anything at all, let alone their faces",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I definitely wasn't supposed to be seeing anything",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Demetria promised me I wouldn't",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I felt very, very cold",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "It gets cold up there in the winter",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Even colder if you've got nothing on",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I remember saying that I hadn't taken much",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Which was a lie, of course",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "They were all looking at me like I was the perfect example of everything that was wrong with being general",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And my generation in particular",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Why was the first thing I said when I came back an incredibly obvious lie?",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I guess that says a lot about me, doesn't it?",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "God, it was miserable",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I remember them asking me if I had anywhere to stay",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And me pausing for way too long",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "While knowing that the answer was obviously no",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And then saying no",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And how terribly quiet they all got standing there",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Staring at me on that very cold winter morning",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "This one goes out to the concept of luck",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "That pure, blind luck that makes the women's netball team walk back a different route around the meadows",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "A route that takes them past whatever I was at that point",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "That kind of luck",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Monica brought that fact up to me later while I was lying in her bed",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Trying to figure out if there was a way to intercept the suicide notes I had mailed to ten different international news media conglomerates",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "She said, a little too triumphantly, I think",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "That if she hadn't ordered that eighth round of shots, then they would have left early and I wouldn't have been there",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And that if she hadn't decided",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "In her, as I was soon to discover, classically whimsical way",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "To lead the gang after that eight round of shots back around a different way just because she felt like it",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Then she wouldn't have found me at all",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "She found that that was all very relevant",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "So do I, I guess",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "When we slept together that night for the first time, I saw stars",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "It was beautiful",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "So, yeah, this one goes out to luck",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And drunk, mad women",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "It was mostly peaceful, chaotic, but mostly peaceful chaos / I took my shoes off",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I took my shoes off / I got ready with how I was feeling",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I got ready with how I was feeling / I ate the apple and lost myself to paradise",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I ate the apple and lost myself to paradise / But the thing they don't tell you is that it's your body that leaves your soul",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But the thing they don't tell you is that it's your body that leaves your soul / Not the other way around",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Not the other way around / You can literally feel your heart stop beating",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "You can literally feel your heart stop beating / And it's not, it's not even that strange",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And it's not, it's not even that strange / You know what's gonna happen, but you aren't angry that you do know",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "You know what's gonna happen, but you aren't angry that you do know / And in fact, the fact that you do know gives you some secret feeling of bliss",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And in fact, the fact that you do know gives you some secret feeling of bliss / And it's not in any way diminished",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And it's not in any way diminished / When that thing that you know is going to happen does eventually happen",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "When that thing that you know is going to happen does eventually happen / That's how I felt",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "That's how I felt / I felt happy in a secret way",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I felt happy in a secret way / Naked, obviously",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Naked, obviously / Angry that I could hear voices",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Angry that I could hear voices / But really, like, I was at peace with everything",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But really, like, I was at peace with everything / Just me and my slowly slowing heart in a crowd of faces asking me for my name and what the date was",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Just me and my slowly slowing heart in a crowd of faces asking me for my name and what the date was / And whether or not we were in a time of national crisis",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And whether or not we were in a time of national crisis / I don't know, kindness is so strange",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I don't know, kindness is so strange / The shame doesn't really capture the feeling, you know",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "The shame doesn't really capture the feeling, you know / How it felt to be in front of them like that",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "How it felt to be in front of them like that / Blinking like a cat who just found out the mouse he's been trying to kill for the last ten years just ate his last piece of cheese",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "The only strange thing was that I could see anything at all, let alone their faces / I definitely wasn't supposed to be seeing anything",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I definitely wasn't supposed to be seeing anything / Demetria promised me I wouldn't",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Demetria promised me I wouldn't / I felt very, very cold",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I felt very, very cold / It gets cold up there in the winter",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "It gets cold up there in the winter / Even colder if you've got nothing on",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Even colder if you've got nothing on / I remember saying that I hadn't taken much",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I remember saying that I hadn't taken much / Which was a lie, of course",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Which was a lie, of course / They were all looking at me like I was the perfect example of everything that was wrong with being general",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "They were all looking at me like I was the perfect example of everything that was wrong with being general / And my generation in particular",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And my generation in particular / Why was the first thing I said when I came back an incredibly obvious lie?",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Why was the first thing I said when I came back an incredibly obvious lie? / I guess that says a lot about me, doesn't it?",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I guess that says a lot about me, doesn't it? / God, it was miserable",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "God, it was miserable / I remember them asking me if I had anywhere to stay",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I remember them asking me if I had anywhere to stay / And me pausing for way too long",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And me pausing for way too long / While knowing that the answer was obviously no",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "While knowing that the answer was obviously no / And then saying no",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And then saying no / And how terribly quiet they all got standing there",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And how terribly quiet they all got standing there / Staring at me on that very cold winter morning",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Staring at me on that very cold winter morning / This one goes out to the concept of luck",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "This one goes out to the concept of luck / That pure, blind luck that makes the women's netball team walk back a different route around the meadows",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "That pure, blind luck that makes the women's netball team walk back a different route around the meadows / A route that takes them past whatever I was at that point",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "A route that takes them past whatever I was at that point / That kind of luck",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "That kind of luck / Monica brought that fact up to me later while I was lying in her bed",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Trying to figure out if there was a way to intercept the suicide notes I had mailed to ten different international news media conglomerates / She said, a little too triumphantly, I think",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "She said, a little too triumphantly, I think / That if she hadn't ordered that eighth round of shots, then they would have left early and I wouldn't have been there",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "That if she hadn't ordered that eighth round of shots, then they would have left early and I wouldn't have been there / And that if she hadn't decided",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And that if she hadn't decided / In her, as I was soon to discover, classically whimsical way",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "In her, as I was soon to discover, classically whimsical way / To lead the gang after that eight round of shots back around a different way just because she felt like it",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "To lead the gang after that eight round of shots back around a different way just because she felt like it / Then she wouldn't have found me at all",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Then she wouldn't have found me at all / She found that that was all very relevant",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "She found that that was all very relevant / So do I, I guess",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "So do I, I guess / When we slept together that night for the first time, I saw stars",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "When we slept together that night for the first time, I saw stars / It was beautiful",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "It was beautiful / So, yeah, this one goes out to luck",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "So, yeah, this one goes out to luck / And drunk, mad women",
-    "song": "Business Opportunities",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "What should we steal tonight?",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Another hour, another year?",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I wish us all the best",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "The only way out is through, we've got to live it through",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Night falls and the wind rises",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I've pushed through the gates and whistled at the stars",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "All we have are words, the kindness of animals, the flash of an earring in the dark",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Remember, we only ever smell like ourselves",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "This need to live",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Drink it up, feel it in your eyes, show them how to really smile",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Earlier today, a policeman asked me for my name and I told him: \"I'm sorry but I'm seeing someone at the moment\"",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Neither the past, the present or the future matter to me",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "What matters to me is love, art and money",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I'm running down the street and my arms are in the air and I'm shouting to them: \"You can't make me care\"",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And I'm calling things that are be not as though they were",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And I'm not trying and neither are you and neither is anybody else",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "We're just dancing",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "There's no feeling in the world like riding at 150 miles-an-hour into the sunset",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And not being able to remember what you had for lunch",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "You wanna know what's next? More apocalypse",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Even if you could escape it, why would you want to?",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "It's all so beautifully modern",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I'm not leaving, I'm here for good",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I won't lie to you, I was scared",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I was scared when my life put me on a boat that I knew would sink but then I still got on",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And while the whole setup was fantastic",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And I was basically having the single greatest time of my young life",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I still got the feeling",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Call it intuition, call it luck",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Call it whatever the word is for when you heat stroke twice in a week and start speaking Sanskrit",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "That that ship wreck, once it happened, it would not be cinematic at all",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "It would not be heroic",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I would not end up doing the great things that I can't remember now that I've dreamt of doing when I was little",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But I still knew, back there in the dark and peaceful cave where most of my important thoughts were living at the time",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "That I would end up, ironically enough, like that guy did in the movie",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Betrayed by his adored object, more naked than it's possible for a person to be and lost in the grey and frozen confusion of being left alone to die",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And I also knew that if some part of me did",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "However incredibly, survive",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "That all that would be left of me",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Of everything that could've ever been thought of definitely as me",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Would just be some faded memory",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And that, if you allow me to speak metaphorically for a moment",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "It would end up being just like some old-leather jacket",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Made out of indifference and cynicism",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "That I would have to then shrug on and lug around on my back for the rest of my fucking life",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "That's how I felt then and I don't think that I was wrong then either",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I'll spare you of the gory details",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But I will just say this",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "They gave the doctors that worked on me awards for exemplary performance in circumstances of extreme stress",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "All I really have to say is that I'm not scared anymore",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I'm happy to be here with you all",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And I feel extremely, extremely lucky to be alive",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And if me and The Big Man upstairs didn't have such a complicated history",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I'd kiss his hand right now",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Because that shit there",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "That shit there was downright miraculous, ok?",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "What should we steal tonight? / Another hour, another year?",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Another hour, another year? / I wish us all the best",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I wish us all the best / The only way out is through, we've got to live it through",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "The only way out is through, we've got to live it through / Night falls and the wind rises",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Night falls and the wind rises / I've pushed through the gates and whistled at the stars",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I've pushed through the gates and whistled at the stars / All we have are words, the kindness of animals, the flash of an earring in the dark",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "All we have are words, the kindness of animals, the flash of an earring in the dark / Remember, we only ever smell like ourselves",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Remember, we only ever smell like ourselves / This need to live",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "This need to live / Drink it up, feel it in your eyes, show them how to really smile",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Drink it up, feel it in your eyes, show them how to really smile / Earlier today, a policeman asked me for my name and I told him: \"I'm sorry but I'm seeing someone at the moment\"",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Earlier today, a policeman asked me for my name and I told him: \"I'm sorry but I'm seeing someone at the moment\" / Neither the past, the present or the future matter to me",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Neither the past, the present or the future matter to me / What matters to me is love, art and money",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "What matters to me is love, art and money / I'm running down the street and my arms are in the air and I'm shouting to them: \"You can't make me care\"",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I'm running down the street and my arms are in the air and I'm shouting to them: \"You can't make me care\" / And I'm calling things that are be not as though they were",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And I'm calling things that are be not as though they were / And I'm not trying and neither are you and neither is anybody else",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And I'm not trying and neither are you and neither is anybody else / We're just dancing",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "We're just dancing / There's no feeling in the world like riding at 150 miles-an-hour into the sunset",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "There's no feeling in the world like riding at 150 miles-an-hour into the sunset / And not being able to remember what you had for lunch",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And not being able to remember what you had for lunch / You wanna know what's next? More apocalypse",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "You wanna know what's next? More apocalypse / Even if you could escape it, why would you want to?",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Even if you could escape it, why would you want to? / It's all so beautifully modern",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "It's all so beautifully modern / I'm not leaving, I'm here for good",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I'm not leaving, I'm here for good / I won't lie to you, I was scared",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I won't lie to you, I was scared / I was scared when my life put me on a boat that I knew would sink but then I still got on",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I was scared when my life put me on a boat that I knew would sink but then I still got on / And while the whole setup was fantastic",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And while the whole setup was fantastic / And I was basically having the single greatest time of my young life",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And I was basically having the single greatest time of my young life / I still got the feeling",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I still got the feeling / Call it intuition, call it luck",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Call it intuition, call it luck / Call it whatever the word is for when you heat stroke twice in a week and start speaking Sanskrit",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Call it whatever the word is for when you heat stroke twice in a week and start speaking Sanskrit / That that ship wreck, once it happened, it would not be cinematic at all",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "That that ship wreck, once it happened, it would not be cinematic at all / It would not be heroic",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "It would not be heroic / I would not end up doing the great things that I can't remember now that I've dreamt of doing when I was little",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But I still knew, back there in the dark and peaceful cave where most of my important thoughts were living at the time / That I would end up, ironically enough, like that guy did in the movie",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Betrayed by his adored object, more naked than it's possible for a person to be and lost in the grey and frozen confusion of being left alone to die / And I also knew that if some part of me did",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And I also knew that if some part of me did / However incredibly, survive",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "However incredibly, survive / That all that would be left of me",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "That all that would be left of me / Of everything that could've ever been thought of definitely as me",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Of everything that could've ever been thought of definitely as me / Would just be some faded memory",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Would just be some faded memory / And that, if you allow me to speak metaphorically for a moment",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And that, if you allow me to speak metaphorically for a moment / It would end up being just like some old-leather jacket",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "It would end up being just like some old-leather jacket / Made out of indifference and cynicism",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Made out of indifference and cynicism / That I would have to then shrug on and lug around on my back for the rest of my fucking life",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "That I would have to then shrug on and lug around on my back for the rest of my fucking life / That's how I felt then and I don't think that I was wrong then either",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "That's how I felt then and I don't think that I was wrong then either / I'll spare you of the gory details",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I'll spare you of the gory details / But I will just say this",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But I will just say this / They gave the doctors that worked on me awards for exemplary performance in circumstances of extreme stress",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "They gave the doctors that worked on me awards for exemplary performance in circumstances of extreme stress / All I really have to say is that I'm not scared anymore",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "All I really have to say is that I'm not scared anymore / I'm happy to be here with you all",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I'm happy to be here with you all / And I feel extremely, extremely lucky to be alive",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And I feel extremely, extremely lucky to be alive / And if me and The Big Man upstairs didn't have such a complicated history",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And if me and The Big Man upstairs didn't have such a complicated history / I'd kiss his hand right now",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I'd kiss his hand right now / Because that shit there",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Because that shit there / That shit there was downright miraculous, ok?",
-    "song": "Dodge This!",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Often found in the quiet hands of people from all walks",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Rich, poor, humble, or grand",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "A treasure for those who explore far and wide",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I carry their fortunes with wealth as my guide",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I speak of great cities, power, and fame",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Or honour divine in a more sacred name",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "The wise cherish my silent way of revealing knowledge in truth, without ever speaking",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Though many chase after the path I've paved, sometimes the footprints I leave can fade",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Today, I'm sixteen years old",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I have half of a ham sandwich in my pocket",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I forget my phone number",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I remember instead the etymology of the word 'person'",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "The snowflakes falling on my face feel like ambulances",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I realise, that if I was to die here, nobody would know for a really long time",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Because of the largeness of this least likely of all possible worlds",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "On the drive out, we don't see anything for hours",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Not a single thing, living or dead",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Just a road going through an endless desert",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "With grey mountains in the distance, that never get closer",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "For some reason, I sing Christmas carols to myself and cry without tears",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "What am I doing here?",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "What is that car doing there, and why is it on fire?",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "My friend, whose name I've forgotten, and who I think has since moved on, is recording a video for his wife",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "He is describing everything he sees as if he's seeing it for the first time in his life",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Out of the blue, he tells me that he thinks she is sleeping with her ski instructor",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I decide then, that I should become a ski instructor",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I smoke a cigarette, and feel the future with my nose",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "It is still attached to my face",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I see long nights in cheap hotels",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I hear quotes taken out of context",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I see laughter and loneliness",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I see boredom and anxiety",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I must stop being a ghost",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I must sneak back onto Earth",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I don't like the fact that God moves in mysterious ways",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Today, I am nineteen years old",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Julio comes up to me in a club in Paris and tells me that the sky is blue, and the dead are coming back to life",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "He goes back to the bathroom to do more coke",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And his girlfriend, whose father produces a very popular film franchise, asks me if I wanna sleep with her",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I feel disgusted",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I am twelve years old, in a long ballroom full of people older than me",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "They are staring at me and clapping",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I climb down off the stage",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "My cousin Chris finds me, and gives me my first cigarette, and laughs, and ruffles my hair, and tells me that a man that likes to lie down is happy, and brags about all the money he's making",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I am the pizza and gravy from my school cafeteria",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I am the burger bar coleslaw",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "For where is my tree?",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Where exactly is the window in my prison cell?",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I dream, but when I wake, will I still be here?",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Am I the chihuahua walking on the plates and glasses on my table",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Will I eat cucumber salad tomorrow?",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Is that why I'm so happy?",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Today I feel old",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Today I sat in the sun and told myself secrets I won't remember",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Today, it is possible to survive",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Often found in the quiet hands of people from all walks / Rich, poor, humble, or grand",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Rich, poor, humble, or grand / A treasure for those who explore far and wide",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "A treasure for those who explore far and wide / I carry their fortunes with wealth as my guide",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I carry their fortunes with wealth as my guide / I speak of great cities, power, and fame",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I speak of great cities, power, and fame / Or honour divine in a more sacred name",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Or honour divine in a more sacred name / The wise cherish my silent way of revealing knowledge in truth, without ever speaking",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "The wise cherish my silent way of revealing knowledge in truth, without ever speaking / Though many chase after the path I've paved, sometimes the footprints I leave can fade",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Though many chase after the path I've paved, sometimes the footprints I leave can fade / Today, I'm sixteen years old",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Today, I'm sixteen years old / I have half of a ham sandwich in my pocket",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I have half of a ham sandwich in my pocket / I forget my phone number",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I forget my phone number / I remember instead the etymology of the word 'person'",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I remember instead the etymology of the word 'person' / The snowflakes falling on my face feel like ambulances",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "The snowflakes falling on my face feel like ambulances / I realise, that if I was to die here, nobody would know for a really long time",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I realise, that if I was to die here, nobody would know for a really long time / Because of the largeness of this least likely of all possible worlds",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Because of the largeness of this least likely of all possible worlds / On the drive out, we don't see anything for hours",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "On the drive out, we don't see anything for hours / Not a single thing, living or dead",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Not a single thing, living or dead / Just a road going through an endless desert",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Just a road going through an endless desert / With grey mountains in the distance, that never get closer",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "With grey mountains in the distance, that never get closer / For some reason, I sing Christmas carols to myself and cry without tears",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "For some reason, I sing Christmas carols to myself and cry without tears / What am I doing here?",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "What am I doing here? / What is that car doing there, and why is it on fire?",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "What is that car doing there, and why is it on fire? / My friend, whose name I've forgotten, and who I think has since moved on, is recording a video for his wife",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "My friend, whose name I've forgotten, and who I think has since moved on, is recording a video for his wife / He is describing everything he sees as if he's seeing it for the first time in his life",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "He is describing everything he sees as if he's seeing it for the first time in his life / Out of the blue, he tells me that he thinks she is sleeping with her ski instructor",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Out of the blue, he tells me that he thinks she is sleeping with her ski instructor / I decide then, that I should become a ski instructor",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I decide then, that I should become a ski instructor / I smoke a cigarette, and feel the future with my nose",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I smoke a cigarette, and feel the future with my nose / It is still attached to my face",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "It is still attached to my face / I see long nights in cheap hotels",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I see long nights in cheap hotels / I hear quotes taken out of context",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I hear quotes taken out of context / I see laughter and loneliness",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I see laughter and loneliness / I see boredom and anxiety",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I see boredom and anxiety / I must stop being a ghost",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I must stop being a ghost / I must sneak back onto Earth",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I must sneak back onto Earth / I don't like the fact that God moves in mysterious ways",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I don't like the fact that God moves in mysterious ways / Today, I am nineteen years old",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Today, I am nineteen years old / Julio comes up to me in a club in Paris and tells me that the sky is blue, and the dead are coming back to life",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Julio comes up to me in a club in Paris and tells me that the sky is blue, and the dead are coming back to life / He goes back to the bathroom to do more coke",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "He goes back to the bathroom to do more coke / And his girlfriend, whose father produces a very popular film franchise, asks me if I wanna sleep with her",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And his girlfriend, whose father produces a very popular film franchise, asks me if I wanna sleep with her / I feel disgusted",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I feel disgusted / I am twelve years old, in a long ballroom full of people older than me",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I am twelve years old, in a long ballroom full of people older than me / They are staring at me and clapping",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "They are staring at me and clapping / I climb down off the stage",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I am the pizza and gravy from my school cafeteria / I am the burger bar coleslaw",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I am the burger bar coleslaw / For where is my tree?",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "For where is my tree? / Where exactly is the window in my prison cell?",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Where exactly is the window in my prison cell? / I dream, but when I wake, will I still be here?",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I dream, but when I wake, will I still be here? / Am I the chihuahua walking on the plates and glasses on my table",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Am I the chihuahua walking on the plates and glasses on my table / Will I eat cucumber salad tomorrow?",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Will I eat cucumber salad tomorrow? / Is that why I'm so happy?",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Is that why I'm so happy? / Today I feel old",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Today I feel old / Today I sat in the sun and told myself secrets I won't remember",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Today I sat in the sun and told myself secrets I won't remember / Today, it is possible to survive",
-    "song": "His Story",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "When my grandmother was sick, I used to carry her groceries home for her",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "To get there, I had to climb this hill with a park on it",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I walked the same way every day",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "You will know how this feels",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "One day, because I wanted the best for myself",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I tried out a new route through the park",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "It went underneath this bridge decorated with statues of famous Italian poets",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And bits of graffiti on it that said shit like: \"end back pain\"",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Underneath the bridge, which was basically 500 years old, was this enormous puddle that covered the whole path",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I jumped over it",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Time passed",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And I started to hate the new route as much as I hated the old one",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I hated it because it seemed like such a waste of energy",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And I hated myself because I'd chosen to live my life like this",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But I still use the route even after my grandmother died",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I don't know why, really",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I was into detours and compulsive behaviours, I guess",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Do you get the picture?",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "One day, around the time that we are moving back to London",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I took that route again",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But the crazy thing is- is that the puddle wasn't there",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And I just stood like a stunned chicken, high for the first time in my life, and jumped",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I wanted the best for myself, you see?",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "The wind blew me all around the world",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "It was loathsome",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And I loved it",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I loved to die, and to be undone",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I ignored letters that said \"do not ignore\"",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I waggled my cup and asked for more",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I ran laughing into the fire, but I didn't burn",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Because the fire inside me burned brighter than the fire around me",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Every time I had a thought of any sort at all",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I asked myself the same questions",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Is any of this real?",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Is any of this true?",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Is it going to be like this forever?",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "The answers were no, of course",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Summer came eventually",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Autumn after that",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Then winter, then spring, then summer again",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "You get the picture",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Since being told to abandon all hope of rescue",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I have decided to rescue myself",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "If divided in two, cannot survive",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But the mind can",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "God grants my eyes the grip",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And my soul takes care of the rest",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Time turns our lies into truth",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And they fit",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Not like a boot, but more like a glove",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "You see the door is behind you, and it opens if you turn the handle",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "You break in, and then you break out, and then you break up",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And the gentle sort of pain that follows you, is just the part of you that is still listening to the music",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Don't let go of it",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "If you don't have to, don't leave it all behind",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "When my grandmother was sick, I used to carry her groceries home for her / To get there, I had to climb this hill with a park on it",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "To get there, I had to climb this hill with a park on it / I walked the same way every day",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I walked the same way every day / You will know how this feels",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "You will know how this feels / One day, because I wanted the best for myself",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "One day, because I wanted the best for myself / I tried out a new route through the park",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I tried out a new route through the park / It went underneath this bridge decorated with statues of famous Italian poets",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "It went underneath this bridge decorated with statues of famous Italian poets / And bits of graffiti on it that said shit like: \"end back pain\"",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And bits of graffiti on it that said shit like: \"end back pain\" / Underneath the bridge, which was basically 500 years old, was this enormous puddle that covered the whole path",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Underneath the bridge, which was basically 500 years old, was this enormous puddle that covered the whole path / I jumped over it",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I jumped over it / Time passed",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Time passed / And I started to hate the new route as much as I hated the old one",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And I started to hate the new route as much as I hated the old one / I hated it because it seemed like such a waste of energy",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I hated it because it seemed like such a waste of energy / And I hated myself because I'd chosen to live my life like this",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And I hated myself because I'd chosen to live my life like this / But I still use the route even after my grandmother died",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But I still use the route even after my grandmother died / I don't know why, really",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I don't know why, really / I was into detours and compulsive behaviours, I guess",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I was into detours and compulsive behaviours, I guess / Do you get the picture?",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Do you get the picture? / One day, around the time that we are moving back to London",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "One day, around the time that we are moving back to London / I took that route again",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I took that route again / But the crazy thing is- is that the puddle wasn't there",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But the crazy thing is- is that the puddle wasn't there / And I just stood like a stunned chicken, high for the first time in my life, and jumped",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And I just stood like a stunned chicken, high for the first time in my life, and jumped / Time passed",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Time passed / I wanted the best for myself, you see?",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I wanted the best for myself, you see? / The wind blew me all around the world",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "The wind blew me all around the world / It was loathsome",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "It was loathsome / And I loved it",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And I loved it / I loved to die, and to be undone",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I loved to die, and to be undone / I ignored letters that said \"do not ignore\"",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I ignored letters that said \"do not ignore\" / I waggled my cup and asked for more",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I waggled my cup and asked for more / I ran laughing into the fire, but I didn't burn",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I ran laughing into the fire, but I didn't burn / Because the fire inside me burned brighter than the fire around me",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Because the fire inside me burned brighter than the fire around me / Every time I had a thought of any sort at all",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Every time I had a thought of any sort at all / I asked myself the same questions",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I asked myself the same questions / Is any of this real?",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Is any of this real? / Is any of this true?",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Is any of this true? / Is it going to be like this forever?",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Is it going to be like this forever? / The answers were no, of course",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "The answers were no, of course / Summer came eventually",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Summer came eventually / Autumn after that",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Autumn after that / Then winter, then spring, then summer again",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Then winter, then spring, then summer again / You get the picture",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "You get the picture / Since being told to abandon all hope of rescue",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Since being told to abandon all hope of rescue / I have decided to rescue myself",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I have decided to rescue myself / If divided in two, cannot survive",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "If divided in two, cannot survive / But the mind can",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But the mind can / God grants my eyes the grip",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "God grants my eyes the grip / And my soul takes care of the rest",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And my soul takes care of the rest / Time turns our lies into truth",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Time turns our lies into truth / And they fit",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And they fit / Not like a boot, but more like a glove",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Not like a boot, but more like a glove / You see the door is behind you, and it opens if you turn the handle",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "You see the door is behind you, and it opens if you turn the handle / You break in, and then you break out, and then you break up",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "You break in, and then you break out, and then you break up / And the gentle sort of pain that follows you, is just the part of you that is still listening to the music",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And the gentle sort of pain that follows you, is just the part of you that is still listening to the music / Don't let go of it",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Don't let go of it / If you don't have to, don't leave it all behind",
-    "song": "I Appreciate You",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "When I'm standing around in the kitchen, ignoring my life and grilling courgettes",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I can move my head and body",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I can turn into an easter egg, or a music box, or a piece of cake",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But when I'm sat in the sun, doing absolutely nothing, absolutely everything is possible",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Because, like Uncle Mario always used to say: \"If you want to really see Delft, you have to go to The Hague\"",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Art reduces the immediate contingency in which an object exists to a state in which the object assumes the form and quality of freedom",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Don't take breaks, take snacks",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And while there has to be some way of saying \"what's your name, Sasha?\" that is both a statement and a question at the same time",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "When I wake up at 1:30 PM on a Wednesday",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "You, you will still definitely be you",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And I will still somehow feel the need to live",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "'Cause you will still be you",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And I will still remember how you apologized to me when you kicked me out of your restaurant for doing my newest dance move",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And how you smiled when I told you that it was called \"going crazy in a restaurant\"",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Here and now are images at best",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I am gone where I get moved to go",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I am a man, a thing, a dream",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Dry cleaning, strong feelings",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Tie your sandbag to the smoke alarm and smoke",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Our hopes have run away forever",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Look instead for the horse that comes first, and the knowledge that laughter is always right next door",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Hey universe, do you want to play dice?",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Peace is where Earth meets heaven",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And it is a chemical wedding",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Beauty need not be just",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But justice is often beautiful",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And yes, I drink the Jugo de Coco",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And yes, I think about the world",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Yes, I look at the sky, and yes, I cough a lot",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And to quote the late great Sinéad O'Connor: \"It is no measure of health to be well adjusted to a profoundly sick society\"",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But I see no difference",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "The world is the world",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I eat paper instead of food",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "The door is right in front of you, and it opens if you turn the handle",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "You must go out, go in, go through to get out, go down to go through",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I went in, I went out",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I went to where they said I couldn't go",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And I sat in the shade, with Michelle",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And we ate grilled fish, and argued",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "The girls working there gave me a discount when I went to pay and giggled at me",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "While flamingoes stood, pink and balletic, in the rolling surf",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "When I'm standing around in the kitchen, ignoring my life and grilling courgettes / I can move my head and body",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I can move my head and body / I can turn into an easter egg, or a music box, or a piece of cake",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I can turn into an easter egg, or a music box, or a piece of cake / But when I'm sat in the sun, doing absolutely nothing, absolutely everything is possible",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But when I'm sat in the sun, doing absolutely nothing, absolutely everything is possible / Because, like Uncle Mario always used to say: \"If you want to really see Delft, you have to go to The Hague\"",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Art reduces the immediate contingency in which an object exists to a state in which the object assumes the form and quality of freedom / Don't take breaks, take snacks",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Don't take breaks, take snacks / And while there has to be some way of saying \"what's your name, Sasha?\" that is both a statement and a question at the same time",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And while there has to be some way of saying \"what's your name, Sasha?\" that is both a statement and a question at the same time / When I wake up at 1:30 PM on a Wednesday",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "When I wake up at 1:30 PM on a Wednesday / You, you will still definitely be you",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "You, you will still definitely be you / And I will still somehow feel the need to live",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And I will still somehow feel the need to live / 'Cause you will still be you",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "'Cause you will still be you / And I will still remember how you apologized to me when you kicked me out of your restaurant for doing my newest dance move",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And how you smiled when I told you that it was called \"going crazy in a restaurant\" / Here and now are images at best",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Here and now are images at best / I am gone where I get moved to go",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I am gone where I get moved to go / I am a man, a thing, a dream",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I am a man, a thing, a dream / Dry cleaning, strong feelings",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Dry cleaning, strong feelings / Tie your sandbag to the smoke alarm and smoke",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Tie your sandbag to the smoke alarm and smoke / Our hopes have run away forever",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Our hopes have run away forever / Look instead for the horse that comes first, and the knowledge that laughter is always right next door",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Look instead for the horse that comes first, and the knowledge that laughter is always right next door / Hey universe, do you want to play dice?",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Hey universe, do you want to play dice? / Peace is where Earth meets heaven",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Peace is where Earth meets heaven / And it is a chemical wedding",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And it is a chemical wedding / Beauty need not be just",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Beauty need not be just / But justice is often beautiful",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But justice is often beautiful / And yes, I drink the Jugo de Coco",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And yes, I drink the Jugo de Coco / And yes, I think about the world",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And yes, I think about the world / Yes, I look at the sky, and yes, I cough a lot",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Yes, I look at the sky, and yes, I cough a lot / And to quote the late great Sinéad O'Connor: \"It is no measure of health to be well adjusted to a profoundly sick society\"",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And to quote the late great Sinéad O'Connor: \"It is no measure of health to be well adjusted to a profoundly sick society\" / But I see no difference",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But I see no difference / The world is the world",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "The world is the world / I eat paper instead of food",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I eat paper instead of food / The door is right in front of you, and it opens if you turn the handle",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "The door is right in front of you, and it opens if you turn the handle / You must go out, go in, go through to get out, go down to go through",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "You must go out, go in, go through to get out, go down to go through / I went in, I went out",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I went in, I went out / I went to where they said I couldn't go",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I went to where they said I couldn't go / And I sat in the shade, with Michelle",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And I sat in the shade, with Michelle / And we ate grilled fish, and argued",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And we ate grilled fish, and argued / The girls working there gave me a discount when I went to pay and giggled at me",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "The girls working there gave me a discount when I went to pay and giggled at me / While flamingoes stood, pink and balletic, in the rolling surf",
-    "song": "It Opens if You Turn the Handle",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "This is the sound of orange juice and milk",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "This is the ringing in your ears after you hear me screaming",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "This is the fact of your eyes with tears in them",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And your body naked in the pool",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "My body is different",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "My body is made up of a tiny million little pieces of rope",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And all I need you to do is tie me up again",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I need to move",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I want to hear the ideas that leave you only just enough room to breathe",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "This city can hear it all, the lips just want lips",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "The face just wants to face the mirror and scream",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But listen, thеre's more than enough hеartbreak going around",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "It's all just smoke, the past is dead and it's not nighttime yet",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "We are the birds and we are the stars",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "We can tell the night to fuck off",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I mean, look at me",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I had the right of way and now I'm dead",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "How do you think that makes me feel?",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "They had to stop me",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "My mind had started to distort reality",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But, baby, if you don't kill me again, I really am going to die",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Just love me",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Who knows? We might both like it",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Remember, you're nobody till somebody loves you",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And there's no blue without the yellow",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Just walk with me, wild thing",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I remember that house",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I used to have some stuff in there",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "A hill, a medium-sized lake, a woman, a gun, various drugs",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Various awards given for excellence in literature",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "It can't have been that bad If I don't remember anything else, right?",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I can feel it",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "This heart is about to start beating",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "High energy resolves into smaller structures",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "We cannot tile an infinite plane",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Stand back",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I stole the fire and I'm about to start smoking",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I don't talk English, I talk Toyota",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Both when sad and not",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "In the clown nursery, it's always time to dance",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "We want free drinks and then more free drinks",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "The apples will speak for themselves",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And I wasn't talking to you",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I said stay there, it's fine to have all still alive",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Who cares what happens after this?",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "The ambassador is on the dance floor, the bride has a headache",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And everyone else has their legs in the air",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "There are things that can be done",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "After all, we've all been guilty of a few accidents once in a while",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "We walked on water, we was yelling, there was glee",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I've spent a little too long squatting naked in the dark",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "It's taken me a while to get back up above the clouds and out of the ocean of infinite nonthings",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Now, now I just try to be as bad of a person as possible",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I have a big debt to pay off",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "That's how it works, right?",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "My soul is like a factory, but all it makes is shit",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "A place where light is pain, where my desires fear and my fears desire",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "This is the sound of orange juice and milk / This is the ringing in your ears after you hear me screaming",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "This is the ringing in your ears after you hear me screaming / This is the fact of your eyes with tears in them",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "This is the fact of your eyes with tears in them / And your body naked in the pool",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And your body naked in the pool / My body is different",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "My body is different / My body is made up of a tiny million little pieces of rope",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "My body is made up of a tiny million little pieces of rope / And all I need you to do is tie me up again",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And all I need you to do is tie me up again / I need to move",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I need to move / I want to hear the ideas that leave you only just enough room to breathe",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I want to hear the ideas that leave you only just enough room to breathe / This city can hear it all, the lips just want lips",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "This city can hear it all, the lips just want lips / The face just wants to face the mirror and scream",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "The face just wants to face the mirror and scream / But listen, thеre's more than enough hеartbreak going around",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But listen, thеre's more than enough hеartbreak going around / It's all just smoke, the past is dead and it's not nighttime yet",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "It's all just smoke, the past is dead and it's not nighttime yet / We are the birds and we are the stars",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "We are the birds and we are the stars / We can tell the night to fuck off",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "We can tell the night to fuck off / I mean, look at me",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I mean, look at me / I had the right of way and now I'm dead",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I had the right of way and now I'm dead / How do you think that makes me feel?",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "How do you think that makes me feel? / They had to stop me",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "They had to stop me / My mind had started to distort reality",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "My mind had started to distort reality / But, baby, if you don't kill me again, I really am going to die",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But, baby, if you don't kill me again, I really am going to die / Just love me",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Just love me / Who knows? We might both like it",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Who knows? We might both like it / Remember, you're nobody till somebody loves you",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Remember, you're nobody till somebody loves you / And there's no blue without the yellow",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And there's no blue without the yellow / Just walk with me, wild thing",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Just walk with me, wild thing / I remember that house",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I remember that house / I used to have some stuff in there",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I used to have some stuff in there / A hill, a medium-sized lake, a woman, a gun, various drugs",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "A hill, a medium-sized lake, a woman, a gun, various drugs / Various awards given for excellence in literature",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Various awards given for excellence in literature / It can't have been that bad If I don't remember anything else, right?",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "It can't have been that bad If I don't remember anything else, right? / I can feel it",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I can feel it / This heart is about to start beating",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "This heart is about to start beating / High energy resolves into smaller structures",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "High energy resolves into smaller structures / We cannot tile an infinite plane",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "We cannot tile an infinite plane / Stand back",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Stand back / I stole the fire and I'm about to start smoking",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I stole the fire and I'm about to start smoking / I don't talk English, I talk Toyota",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I don't talk English, I talk Toyota / Both when sad and not",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Both when sad and not / In the clown nursery, it's always time to dance",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "In the clown nursery, it's always time to dance / We want free drinks and then more free drinks",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "We want free drinks and then more free drinks / The apples will speak for themselves",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "The apples will speak for themselves / And I wasn't talking to you",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And I wasn't talking to you / I said stay there, it's fine to have all still alive",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I said stay there, it's fine to have all still alive / Who cares what happens after this?",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Who cares what happens after this? / The ambassador is on the dance floor, the bride has a headache",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "The ambassador is on the dance floor, the bride has a headache / And everyone else has their legs in the air",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And everyone else has their legs in the air / There are things that can be done",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "There are things that can be done / After all, we've all been guilty of a few accidents once in a while",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "After all, we've all been guilty of a few accidents once in a while / We walked on water, we was yelling, there was glee",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "We walked on water, we was yelling, there was glee / I've spent a little too long squatting naked in the dark",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I've spent a little too long squatting naked in the dark / It's taken me a while to get back up above the clouds and out of the ocean of infinite nonthings",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "It's taken me a while to get back up above the clouds and out of the ocean of infinite nonthings / Now, now I just try to be as bad of a person as possible",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Now, now I just try to be as bad of a person as possible / I have a big debt to pay off",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I have a big debt to pay off / That's how it works, right?",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "That's how it works, right? / My soul is like a factory, but all it makes is shit",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "My soul is like a factory, but all it makes is shit / A place where light is pain, where my desires fear and my fears desire",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "A place where light is pain, where my desires fear and my fears desire / My head hurts, but I know what I have to do",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "My head hurts, but I know what I have to do / I know that love is the only thought and pain is the only feeling",
-    "song": "Mission Impossible III",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Ladies and gentlemen of the jury, I am in the wrong place",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "This is the cherished format, this is the true and original copy",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "First, you scream, then you grunt, then grab the sexy thing and tell them: \"Hey, cut that out\"",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "We don't need to know much to know that",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "An obvious lie, over a totally blue sea",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And a green sunset",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Seabirds, gliding high and dry",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "The heart going jingle jangle",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "We have nothing else to do",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Peel away, and start the scene",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "A busy world",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "A crowded mirror",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Everything else in its right placе",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "A laugh that sounds plausibly like tears",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "This is not a question of tastе, but love",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "We bite down on the magic, find out it's actually our tongues, and work on that for a change",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "We might be mad, what a mess we made and laid down in, what a happy coincidence, what a life",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "How about that?",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "How about the sudden change in circumstances?",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "How about palm trees and wet sand, sensational, real, ready, planning",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I don't want to die, I want to live",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I want a lot of things",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I want to sit here with you alone",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And wait for the world to end",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I want you to need me so much the world ends",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I want to leave a mark",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I just need you to be nicer to me",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I'd like you to be nicer to me",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I'd like you to dream about me",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "At least as much as I dream about you",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I finally feel free",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I have everything I need",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Olives, extra-large condoms, cheese",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I don't eat butterflies, so I don't get butterflies",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But an elephant did try to eat me once",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I don't blame her, really",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I was wearing yellow, and I smelled like a banana",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "You know, on cloudy days, I sometimes wish she had succeeded",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I sometimes wish she had succeeded",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Which reminds me by the way, of how, when I was younger, I used to say that green was an unnatural colour",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "What was I thinking?",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Green is the color of nuclear waste",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "These are not cigarettes we smoke",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "These are not smokes",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "They are a brief spark for our brief lives",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "An antidote to our tired souls",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "The ashes of childhood dreams",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I was eccentric, but I am now dead",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Sure, I've had harsh days and hardships",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Endured journeys and endless jargon",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I've worn rings",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Went from good to greed",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But I abide the bitter shit",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And weather the hold of winter",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I dare the world to delight in me",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Loudness is my laughter",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And there's always the beauty of blueberries, you know",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "There's always fields and shit",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Fairness, disease, age, good moods",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "The days can be unendurable, but the world holds",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I've lost friends, and watched their troubled tombs",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I've ate the sweet, and felt the sorry",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I will wait for you, and I will smile again",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But the world holds",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And while my face is pale, it faces the sun",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Ladies and gentlemen of the jury, I am in the wrong place / This is the cherished format, this is the true and original copy",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "This is the cherished format, this is the true and original copy / First, you scream, then you grunt, then grab the sexy thing and tell them: \"Hey, cut that out\"",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "First, you scream, then you grunt, then grab the sexy thing and tell them: \"Hey, cut that out\" / We don't need to know much to know that",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "We don't need to know much to know that / An obvious lie, over a totally blue sea",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "An obvious lie, over a totally blue sea / And a green sunset",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And a green sunset / Seabirds, gliding high and dry",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Seabirds, gliding high and dry / The heart going jingle jangle",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "The heart going jingle jangle / We have nothing else to do",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "We have nothing else to do / Peel away, and start the scene",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Peel away, and start the scene / A busy world",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "A busy world / A crowded mirror",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "A crowded mirror / Everything else in its right placе",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Everything else in its right placе / A laugh that sounds plausibly like tears",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "A laugh that sounds plausibly like tears / This is not a question of tastе, but love",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "This is not a question of tastе, but love / We bite down on the magic, find out it's actually our tongues, and work on that for a change",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "We bite down on the magic, find out it's actually our tongues, and work on that for a change / We might be mad, what a mess we made and laid down in, what a happy coincidence, what a life",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "We might be mad, what a mess we made and laid down in, what a happy coincidence, what a life / How about that?",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "How about that? / How about the sudden change in circumstances?",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "How about the sudden change in circumstances? / How about palm trees and wet sand, sensational, real, ready, planning",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "How about palm trees and wet sand, sensational, real, ready, planning / I don't want to die, I want to live",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I don't want to die, I want to live / I want a lot of things",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I want a lot of things / I want to sit here with you alone",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I want to sit here with you alone / And wait for the world to end",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And wait for the world to end / I want you to need me so much the world ends",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I want you to need me so much the world ends / I want to leave a mark",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I want to leave a mark / I just need you to be nicer to me",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I just need you to be nicer to me / I'd like you to be nicer to me",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I'd like you to be nicer to me / I'd like you to dream about me",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I'd like you to dream about me / At least as much as I dream about you",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "At least as much as I dream about you / I finally feel free",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I finally feel free / I have everything I need",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I have everything I need / Olives, extra-large condoms, cheese",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Olives, extra-large condoms, cheese / I don't eat butterflies, so I don't get butterflies",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I don't eat butterflies, so I don't get butterflies / But an elephant did try to eat me once",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But an elephant did try to eat me once / I don't blame her, really",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I don't blame her, really / I was wearing yellow, and I smelled like a banana",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I was wearing yellow, and I smelled like a banana / You know, on cloudy days, I sometimes wish she had succeeded",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "You know, on cloudy days, I sometimes wish she had succeeded / I sometimes wish she had succeeded",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I sometimes wish she had succeeded / Which reminds me by the way, of how, when I was younger, I used to say that green was an unnatural colour",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Which reminds me by the way, of how, when I was younger, I used to say that green was an unnatural colour / What was I thinking?",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "What was I thinking? / Green is the color of nuclear waste",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Green is the color of nuclear waste / These are not cigarettes we smoke",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "These are not cigarettes we smoke / These are not smokes",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "These are not smokes / They are a brief spark for our brief lives",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "They are a brief spark for our brief lives / An antidote to our tired souls",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "An antidote to our tired souls / The ashes of childhood dreams",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "The ashes of childhood dreams / I was eccentric, but I am now dead",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I was eccentric, but I am now dead / Sure, I've had harsh days and hardships",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Sure, I've had harsh days and hardships / Endured journeys and endless jargon",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Endured journeys and endless jargon / I've worn rings",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I've worn rings / Went from good to greed",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Went from good to greed / But I abide the bitter shit",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But I abide the bitter shit / And weather the hold of winter",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And weather the hold of winter / I dare the world to delight in me",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I dare the world to delight in me / Loudness is my laughter",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Loudness is my laughter / And there's always the beauty of blueberries, you know",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And there's always the beauty of blueberries, you know / There's always fields and shit",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "There's always fields and shit / Fairness, disease, age, good moods",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Fairness, disease, age, good moods / The days can be unendurable, but the world holds",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "The days can be unendurable, but the world holds / I've lost friends, and watched their troubled tombs",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I've lost friends, and watched their troubled tombs / I've ate the sweet, and felt the sorry",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I've ate the sweet, and felt the sorry / I will wait for you, and I will smile again",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I will wait for you, and I will smile again / But the world holds",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But the world holds / And while my face is pale, it faces the sun",
-    "song": "Most Undo Tomorrow",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Good evening",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "This is Headache speaking",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Please remember to breathe",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "The numbers are: 11, 13, 21, 26, 36, and 108",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "The colours are: blue, yellow, red, and purple",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "When I was young, the moon used to walk me to school",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And I would eat my cereal with a spoon",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But now that I'm older, I like to eat it with a fork",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Do I have to?",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Do I want to?",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Sometimes life is just hard for no reason",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Sometimes you need to feel the weight of something pointless on your shouldеrs",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Listen to me",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I know how cool it would be if Sunday lastеd the whole damn week",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I know that if you want to know how paradise really feels",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "You have to try somehow to be a little like a god",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And if you're still here, remember, I'm not real",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And neither are your dreams",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And I'm sorry to break it to you",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But, if that ever mattered to you at all",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "It was over for you from the start",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "We smoke 5.2 trillion cigarettes a year",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Are you honestly trying to tell me that we couldn't manage a few more?",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "There are 100 trillion synapses in our brains",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "30 trillion cells in our lovely bodies",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And there are 400 billion stars in the Milky Way",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "There are mad different types of fruit, which are somehow basically all delicious",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "There are different styles of insects",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Of flowers, of birds, of bees, of reptiles, of trees, of mountains, of mammals, of rivers, of deserts, of oceans, of jungles, of lakes, of glaciers, of geysers, of volcanoes, and so, so much more",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But quite amazingly, we have 34 thousand distinct emotions",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And I'm currently experiencing one",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "What about you?",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I can't tell you mine",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "That's for me to know",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And you to try to find out",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Good evening / This is Headache speaking",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "This is Headache speaking / Please remember to breathe",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Please remember to breathe / The numbers are: 11, 13, 21, 26, 36, and 108",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "The numbers are: 11, 13, 21, 26, 36, and 108 / The colours are: blue, yellow, red, and purple",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "The colours are: blue, yellow, red, and purple / When I was young, the moon used to walk me to school",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "When I was young, the moon used to walk me to school / And I would eat my cereal with a spoon",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And I would eat my cereal with a spoon / But now that I'm older, I like to eat it with a fork",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But now that I'm older, I like to eat it with a fork / Do I have to?",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Do I have to? / Do I want to?",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Do I want to? / Sometimes life is just hard for no reason",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Sometimes life is just hard for no reason / Sometimes you need to feel the weight of something pointless on your shouldеrs",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Sometimes you need to feel the weight of something pointless on your shouldеrs / Listen to me",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Listen to me / I know how cool it would be if Sunday lastеd the whole damn week",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I know how cool it would be if Sunday lastеd the whole damn week / I know that if you want to know how paradise really feels",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I know that if you want to know how paradise really feels / You have to try somehow to be a little like a god",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "You have to try somehow to be a little like a god / And if you're still here, remember, I'm not real",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And if you're still here, remember, I'm not real / And neither are your dreams",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And neither are your dreams / And I'm sorry to break it to you",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And I'm sorry to break it to you / But, if that ever mattered to you at all",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But, if that ever mattered to you at all / It was over for you from the start",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "It was over for you from the start / We smoke 5.2 trillion cigarettes a year",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "We smoke 5.2 trillion cigarettes a year / Are you honestly trying to tell me that we couldn't manage a few more?",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Are you honestly trying to tell me that we couldn't manage a few more? / There are 100 trillion synapses in our brains",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "There are 100 trillion synapses in our brains / 30 trillion cells in our lovely bodies",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "30 trillion cells in our lovely bodies / And there are 400 billion stars in the Milky Way",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And there are 400 billion stars in the Milky Way / There are mad different types of fruit, which are somehow basically all delicious",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "There are mad different types of fruit, which are somehow basically all delicious / There are different styles of insects",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But quite amazingly, we have 34 thousand distinct emotions / And I'm currently experiencing one",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And I'm currently experiencing one / What about you?",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "What about you? / I can't tell you mine",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I can't tell you mine / That's for me to know",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "That's for me to know / And you to try to find out",
-    "song": "Nineteen Sixty Five",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Make some noise right now for the voices in your head",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "The thing is I'm not just a nose with legs",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But the desire to fall in is so strong, listen to me",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Do you need some lip balm?",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I shouldn't be responsible for what I say",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Someone else should be responsible for what I say",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "There will always be baskets and benches",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "The cow is for land and the horse is for water",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But can you really feel the sound of two hundred people eating?",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I was in ancient Egypt with thе rabbit",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I saw the whole thing, I exist likе cocaine",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And I just wish stuff would stop happening so fast",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I just want to catch my breath and feel that I exist in a moment within a moment",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Inside this time right now",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But I know life doesn't work like that",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Everything is changing all the time",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And if I keep eating this delusional garbage, it'll stick to the roof of my mouth",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And I'll be walking along the street trying to go to the bank or something",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And my tongue will be doing bits and my phone will ring",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And it's someone calling themselves grandma, which is weird because all my grandmas are dead",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "God rest their souls",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But she's telling me about the fact she's taken a plane to Algeria",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And she doesn't know why",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And I'm so baffled I walk into a lamppost",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And on the other side of the street is the most beautiful woman in the world",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And she's laughing at me",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And everyone is staring at you, but not in a good way",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "In that scary way that you sometimes get in those dreams",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Where everyone is looking at you and you look down at your feet",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And you realize they aren't, strictly speaking, feet",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But what are you supposed to do because",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Because you just walked into a fucking lamppost?",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And now you're rolling around on the floor",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And you're still trying to get the dang words out of your mouth, but they're stuck to your tongue",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And the music playing in the car, which the beautiful woman is getting into",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Sounds a lot like an album you used to listen to when you were younger",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "That soundtracked some of your first sexual experiences",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And the car is maroon",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And maybe that's actually exactly the same color that your car is",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And you start to get really freaked out because your head has been on the floor for a long time now",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And if it starts to get any longer, there may be some major social and medical implications",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And so you start to feel a little bit funny all over",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And you try to reach down to touch your toes, but your lips start to tingle",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Because they are right there resting up against the pile of all your hopes and dreams",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And there's the ambulance",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And there are some nice concerned-looking faces ready to take you somewhere",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Where stuff will be injected into your central nervous system",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Using techniques which seem to revolve around getting the ghost of your aunt's mother-in-law",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "To sing lullabies in a language you don't understand",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Until you really, really start to forget who and what you are",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Knock, knock, who's there? Thanks for watching",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Make some noise right now for the voices in your head / The thing is I'm not just a nose with legs",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "The thing is I'm not just a nose with legs / But the desire to fall in is so strong, listen to me",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But the desire to fall in is so strong, listen to me / Do you need some lip balm?",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Do you need some lip balm? / I shouldn't be responsible for what I say",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I shouldn't be responsible for what I say / Someone else should be responsible for what I say",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Someone else should be responsible for what I say / There will always be baskets and benches",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "There will always be baskets and benches / The cow is for land and the horse is for water",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "The cow is for land and the horse is for water / But can you really feel the sound of two hundred people eating?",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But can you really feel the sound of two hundred people eating? / I was in ancient Egypt with thе rabbit",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I was in ancient Egypt with thе rabbit / I saw the whole thing, I exist likе cocaine",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I saw the whole thing, I exist likе cocaine / And I just wish stuff would stop happening so fast",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And I just wish stuff would stop happening so fast / I just want to catch my breath and feel that I exist in a moment within a moment",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I just want to catch my breath and feel that I exist in a moment within a moment / Inside this time right now",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Inside this time right now / But I know life doesn't work like that",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But I know life doesn't work like that / Everything is changing all the time",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Everything is changing all the time / And if I keep eating this delusional garbage, it'll stick to the roof of my mouth",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And if I keep eating this delusional garbage, it'll stick to the roof of my mouth / And I'll be walking along the street trying to go to the bank or something",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And I'll be walking along the street trying to go to the bank or something / And my tongue will be doing bits and my phone will ring",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And my tongue will be doing bits and my phone will ring / And it's someone calling themselves grandma, which is weird because all my grandmas are dead",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And it's someone calling themselves grandma, which is weird because all my grandmas are dead / God rest their souls",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "God rest their souls / But she's telling me about the fact she's taken a plane to Algeria",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But she's telling me about the fact she's taken a plane to Algeria / And she doesn't know why",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And she doesn't know why / And I'm so baffled I walk into a lamppost",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And I'm so baffled I walk into a lamppost / And on the other side of the street is the most beautiful woman in the world",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And on the other side of the street is the most beautiful woman in the world / And she's laughing at me",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And she's laughing at me / And everyone is staring at you, but not in a good way",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And everyone is staring at you, but not in a good way / In that scary way that you sometimes get in those dreams",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "In that scary way that you sometimes get in those dreams / Where everyone is looking at you and you look down at your feet",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Where everyone is looking at you and you look down at your feet / And you realize they aren't, strictly speaking, feet",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And you realize they aren't, strictly speaking, feet / But what are you supposed to do because",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But what are you supposed to do because / Because you just walked into a fucking lamppost?",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Because you just walked into a fucking lamppost? / And now you're rolling around on the floor",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And now you're rolling around on the floor / And you're still trying to get the dang words out of your mouth, but they're stuck to your tongue",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And you're still trying to get the dang words out of your mouth, but they're stuck to your tongue / And the music playing in the car, which the beautiful woman is getting into",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And the music playing in the car, which the beautiful woman is getting into / Sounds a lot like an album you used to listen to when you were younger",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Sounds a lot like an album you used to listen to when you were younger / That soundtracked some of your first sexual experiences",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "That soundtracked some of your first sexual experiences / And the car is maroon",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And the car is maroon / And maybe that's actually exactly the same color that your car is",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And maybe that's actually exactly the same color that your car is / And you start to get really freaked out because your head has been on the floor for a long time now",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And you start to get really freaked out because your head has been on the floor for a long time now / And if it starts to get any longer, there may be some major social and medical implications",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And if it starts to get any longer, there may be some major social and medical implications / And so you start to feel a little bit funny all over",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And so you start to feel a little bit funny all over / And you try to reach down to touch your toes, but your lips start to tingle",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And you try to reach down to touch your toes, but your lips start to tingle / Because they are right there resting up against the pile of all your hopes and dreams",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Because they are right there resting up against the pile of all your hopes and dreams / And there's the ambulance",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And there's the ambulance / And there are some nice concerned-looking faces ready to take you somewhere",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And there are some nice concerned-looking faces ready to take you somewhere / Where stuff will be injected into your central nervous system",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Where stuff will be injected into your central nervous system / Using techniques which seem to revolve around getting the ghost of your aunt's mother-in-law",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Using techniques which seem to revolve around getting the ghost of your aunt's mother-in-law / To sing lullabies in a language you don't understand",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "To sing lullabies in a language you don't understand / Until you really, really start to forget who and what you are",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Until you really, really start to forget who and what you are / Knock, knock, who's there? Thanks for watching",
-    "song": "That Thing with the Rabbit",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Have you ever woken up and wondered where you are and why you're naked?",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "You are now listening to Headache",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I used to take my breakfast off of a mirror",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Now I just walk around and stare at people in the park",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "You think I care about what's happening to me?",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Even my demons have demons",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "When I last saw Monica, she told me she never wanted to see or speak to me ever again in her life",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "She doesn't get it, nobody gets it",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I can't remember the last time I got a good night's sleep",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "If you really think about it, life shouldn't feel this strange",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "If I could just figure out what the old woman wearing that salmon-pink snakeskin jacket wants from me",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I'd feel a whole lot better",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Doesn't she have a job?",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Do I have a job?",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "It's not normal to sit outside someone's apartment the whole night long",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But then again, what is normal?",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Do you think I'm normal?",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Say I'm normal",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Please, for fuck's sake, please say I'm normal",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I don't know what you want from me",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I could never do that contemplation shit",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Someone told me once that if you have more than three major concussions before the age of seven, you're fucked",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I had eight",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And anyway I'm not interested in knowing",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I'm just tired, so tired",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Something went wrong",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Something went really wrong a long way back",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And now I don't know, now I'm just doing this",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "One morning, you wake and you want to shave your head because the insects living up there have started to throw parties they aren't inviting you to",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And you tell me I'm crazy?",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I just want to live, I just want to feel something",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Anything, anything",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "There's so much shit in the world",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "There's good, bad, mad, sad, ugly, happy",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But I just love beauty",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I think about my friends sometimes",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Their lives, their failures",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "They don't know where I am",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I wonder if they miss me",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I miss their stories, the stuff they leave unfinished",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "The words they leave behind, the good they drag after them",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And the destruction they create",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But above all, above all, I remember the love",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I remember sitting on my uncle Mario's knee",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "While he told me about the man he killed in the Embarcadero in August 1999",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I remember the girl with pigtails in her hair asking me why I look so sad when I was supposed to be feeling happy",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I remember climbing on a statue in my grandmother's garden while serious guys in suits walked around talking to each other",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "There was a lot of blood around back then",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "A lot of laughter, but a lot of blood too",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And I mistook the laughter for love",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I forgot the color where I came from",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Now my taste is me",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And sometimes it's a little too sour",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "The streets are so dead",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "How is it so easy to leave this world behind?",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "It feels like the world's a dream",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Right up until I remember the smell of her hair blowing in the wind",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "You aim for my eyes, but you forgot that the heart is where all the action is",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "This one goes out to all the ghosts",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I love you",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Have you ever woken up and wondered where you are and why you're naked? / You are now listening to Headache",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "You are now listening to Headache / I used to take my breakfast off of a mirror",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I used to take my breakfast off of a mirror / Now I just walk around and stare at people in the park",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Now I just walk around and stare at people in the park / You think I care about what's happening to me?",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "You think I care about what's happening to me? / Even my demons have demons",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Even my demons have demons / When I last saw Monica, she told me she never wanted to see or speak to me ever again in her life",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "When I last saw Monica, she told me she never wanted to see or speak to me ever again in her life / She doesn't get it, nobody gets it",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "She doesn't get it, nobody gets it / I can't remember the last time I got a good night's sleep",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I can't remember the last time I got a good night's sleep / If you really think about it, life shouldn't feel this strange",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "If you really think about it, life shouldn't feel this strange / If I could just figure out what the old woman wearing that salmon-pink snakeskin jacket wants from me",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "If I could just figure out what the old woman wearing that salmon-pink snakeskin jacket wants from me / I'd feel a whole lot better",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I'd feel a whole lot better / Doesn't she have a job?",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Doesn't she have a job? / Do I have a job?",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Do I have a job? / It's not normal to sit outside someone's apartment the whole night long",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "It's not normal to sit outside someone's apartment the whole night long / But then again, what is normal?",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But then again, what is normal? / Do you think I'm normal?",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Do you think I'm normal? / Say I'm normal",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Say I'm normal / Please, for fuck's sake, please say I'm normal",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Please, for fuck's sake, please say I'm normal / I don't know what you want from me",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I don't know what you want from me / I could never do that contemplation shit",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I could never do that contemplation shit / Someone told me once that if you have more than three major concussions before the age of seven, you're fucked",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Someone told me once that if you have more than three major concussions before the age of seven, you're fucked / I had eight",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I had eight / And anyway I'm not interested in knowing",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And anyway I'm not interested in knowing / I'm just tired, so tired",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I'm just tired, so tired / Something went wrong",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Something went wrong / Something went really wrong a long way back",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Something went really wrong a long way back / And now I don't know, now I'm just doing this",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And now I don't know, now I'm just doing this / One morning, you wake and you want to shave your head because the insects living up there have started to throw parties they aren't inviting you to",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "One morning, you wake and you want to shave your head because the insects living up there have started to throw parties they aren't inviting you to / And you tell me I'm crazy?",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And you tell me I'm crazy? / I just want to live, I just want to feel something",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I just want to live, I just want to feel something / Anything, anything",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Anything, anything / There's so much shit in the world",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "There's so much shit in the world / There's good, bad, mad, sad, ugly, happy",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "There's good, bad, mad, sad, ugly, happy / But I just love beauty",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But I just love beauty / I think about my friends sometimes",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I think about my friends sometimes / Their lives, their failures",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Their lives, their failures / They don't know where I am",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "They don't know where I am / I wonder if they miss me",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I wonder if they miss me / I miss their stories, the stuff they leave unfinished",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I miss their stories, the stuff they leave unfinished / The words they leave behind, the good they drag after them",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "The words they leave behind, the good they drag after them / And the destruction they create",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And the destruction they create / But above all, above all, I remember the love",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But above all, above all, I remember the love / I remember sitting on my uncle Mario's knee",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I remember sitting on my uncle Mario's knee / While he told me about the man he killed in the Embarcadero in August 1999",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "While he told me about the man he killed in the Embarcadero in August 1999 / I remember the girl with pigtails in her hair asking me why I look so sad when I was supposed to be feeling happy",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I remember climbing on a statue in my grandmother's garden while serious guys in suits walked around talking to each other / There was a lot of blood around back then",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "There was a lot of blood around back then / A lot of laughter, but a lot of blood too",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "A lot of laughter, but a lot of blood too / And I mistook the laughter for love",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And I mistook the laughter for love / I forgot the color where I came from",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I forgot the color where I came from / Now my taste is me",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Now my taste is me / And sometimes it's a little too sour",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And sometimes it's a little too sour / The streets are so dead",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "The streets are so dead / How is it so easy to leave this world behind?",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "How is it so easy to leave this world behind? / It feels like the world's a dream",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "It feels like the world's a dream / Right up until I remember the smell of her hair blowing in the wind",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Right up until I remember the smell of her hair blowing in the wind / You aim for my eyes, but you forgot that the heart is where all the action is",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "You aim for my eyes, but you forgot that the heart is where all the action is / This one goes out to all the ghosts",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "This one goes out to all the ghosts / I love you",
-    "song": "The Beginning of the End",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I'd like to save my skin",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "It covers my entire body",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I'll put it this way:",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "If I've got to, I've got to",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But if I can’t, I can’t",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Last night, I fell asleep standing up in the corner of a party",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Into the corner runs the hare, as they say",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "They do say that, right?",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "How easily it all comes apart, what was hardly even together",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "When the sky is raining, don't we sit raining too, basically?",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Joy is ours then, along with a little pain as well, of course",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But must always must",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And the way of the world is an open book",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Behind everything, there is some other thing forever",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "You ask yourself if one weary mind can weather this shit storm alone",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "If one heart can set itself free",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But I've spent so many winters sleeping as Santa",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And they could always swim away those we need, couldn't they?",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And afterwards, it would be almost as if they never were",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "That money was a loan",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "That line was a quote",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Thank you for almost everything",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "It's six in the morning",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I walk into the basement apartment of a city I should not have been born in, slowly",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Since I do not live there",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I sit down, I stand still",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I dig in the trash, wait, and listen",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "The worst part of heaven is how long it takes to get there",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "You have no idea",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "In the haze of concrete stained black by the rain",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I stand still and listen",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Last night, in an alley, I accidentally saw a ghost which tried to rob me",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "The Earth is what holds all of us up",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "The people who love me fight me in their sleep",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But I forgive them, since I used to do that too",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "You can pray for me anytime you want",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "People ask me what happened, and who is who?",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I'm not crying because I'm sad",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I'm crying because I don't want to be here",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I want to die at home",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I don't want to die here",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I'm standing still",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I'm not holding anything",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "My electricity bill is going up",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And we are all going to die",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I, for one, am going to suck my thumb and go back to sleep",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Thank you, for almost everything",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Forms are temporary",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Feelings are temporary",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Consciousness is temporary",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Remember, you are dust",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And unto dust, you will return",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I'd like to save my skin / It covers my entire body",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "It covers my entire body / I'll put it this way:",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I'll put it this way: / If I've got to, I've got to",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "If I've got to, I've got to / But if I can’t, I can’t",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But if I can’t, I can’t / Last night, I fell asleep standing up in the corner of a party",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Last night, I fell asleep standing up in the corner of a party / Into the corner runs the hare, as they say",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Into the corner runs the hare, as they say / They do say that, right?",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "They do say that, right? / How easily it all comes apart, what was hardly even together",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "How easily it all comes apart, what was hardly even together / When the sky is raining, don't we sit raining too, basically?",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "When the sky is raining, don't we sit raining too, basically? / Joy is ours then, along with a little pain as well, of course",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Joy is ours then, along with a little pain as well, of course / But must always must",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But must always must / And the way of the world is an open book",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And the way of the world is an open book / Behind everything, there is some other thing forever",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Behind everything, there is some other thing forever / You ask yourself if one weary mind can weather this shit storm alone",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "You ask yourself if one weary mind can weather this shit storm alone / If one heart can set itself free",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "If one heart can set itself free / But I've spent so many winters sleeping as Santa",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But I've spent so many winters sleeping as Santa / And they could always swim away those we need, couldn't they?",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And they could always swim away those we need, couldn't they? / And afterwards, it would be almost as if they never were",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And afterwards, it would be almost as if they never were / That money was a loan",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "That money was a loan / That line was a quote",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "That line was a quote / Thank you for almost everything",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Thank you for almost everything / It's six in the morning",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "It's six in the morning / I walk into the basement apartment of a city I should not have been born in, slowly",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I walk into the basement apartment of a city I should not have been born in, slowly / Since I do not live there",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Since I do not live there / I sit down, I stand still",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I sit down, I stand still / I dig in the trash, wait, and listen",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I dig in the trash, wait, and listen / The worst part of heaven is how long it takes to get there",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "The worst part of heaven is how long it takes to get there / You have no idea",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "You have no idea / In the haze of concrete stained black by the rain",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "In the haze of concrete stained black by the rain / I stand still and listen",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I stand still and listen / Last night, in an alley, I accidentally saw a ghost which tried to rob me",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Last night, in an alley, I accidentally saw a ghost which tried to rob me / The Earth is what holds all of us up",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "The Earth is what holds all of us up / The people who love me fight me in their sleep",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "The people who love me fight me in their sleep / But I forgive them, since I used to do that too",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But I forgive them, since I used to do that too / You can pray for me anytime you want",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "You can pray for me anytime you want / People ask me what happened, and who is who?",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "People ask me what happened, and who is who? / I'm not crying because I'm sad",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I'm not crying because I'm sad / I'm crying because I don't want to be here",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I'm crying because I don't want to be here / I want to die at home",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I want to die at home / I don't want to die here",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I don't want to die here / I'm standing still",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I'm standing still / I'm not holding anything",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I'm not holding anything / My electricity bill is going up",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "My electricity bill is going up / And we are all going to die",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And we are all going to die / I, for one, am going to suck my thumb and go back to sleep",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I, for one, am going to suck my thumb and go back to sleep / Thank you, for almost everything",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Thank you, for almost everything / Forms are temporary",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Forms are temporary / Feelings are temporary",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Feelings are temporary / Consciousness is temporary",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Consciousness is temporary / Remember, you are dust",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Remember, you are dust / And unto dust, you will return",
-    "song": "The Joy Is Ours",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "When I was five years old, I fell off a boat in my godmother's lake",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Because I was holding on to the rail too hard",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "My older sister says I was underwater for only enough time to just about avoid death by drowning",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But I remember sinking all the way down to the bottom",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Where I saw creatures I still don't recognize to this day",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Some of them spoke to me",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I don't think I was the same thing I was before by the time they pulled me out",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But maybe that's not such a bad thing",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I've rеalized recently that it doеsn't really matter",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I've been running for a long, long time",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I know I can't find what I'm looking for",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And I've wasted so much time",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But I don't regret a thing",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I've changed",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I've done so much, seen so much",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I've slept weeping, and weeping I've waked",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Tears like you wouldn't believe",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But laughter too",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "So much laughter, so much love",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I thought my body was different",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I thought I could never die",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But now I know, I know the truth",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "My head hurts, but I know the truth",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And I'm ready to dance",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I don't know what happened to me",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But I don't really care anymore",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "One day, I was asleep, another awake",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "All I've ever wanted was to move to the music",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "To be at a party that never ended",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "They used to chase me with hammers down the street",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Boo-hoo, right? But I'm okay",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I would have liked to lose it all with you",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I would have liked to lose myself",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Lose myself the way I used to long ago",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Back when I still had some life left in me",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I would close my eyes and be in a great big forest",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Or on an empty beach at sunrise",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Or in some strange and beautiful city",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "It's nighttime, but the birds are singing",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "The streets are dead, but they look great in the moonlight",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And I'm just walking along them",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I'm looking for something to love, but it's not that big a deal",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "It's raining, but I'm alright",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I'm just walking, I'm ready",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I'm ready to move",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I'll always love you",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But I've got to go now",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "They're all waiting for me",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "It's been real",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "When I was five years old, I fell off a boat in my godmother's lake / Because I was holding on to the rail too hard",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Because I was holding on to the rail too hard / My older sister says I was underwater for only enough time to just about avoid death by drowning",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "My older sister says I was underwater for only enough time to just about avoid death by drowning / But I remember sinking all the way down to the bottom",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But I remember sinking all the way down to the bottom / Where I saw creatures I still don't recognize to this day",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Where I saw creatures I still don't recognize to this day / Some of them spoke to me",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Some of them spoke to me / I don't think I was the same thing I was before by the time they pulled me out",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I don't think I was the same thing I was before by the time they pulled me out / But maybe that's not such a bad thing",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But maybe that's not such a bad thing / I've rеalized recently that it doеsn't really matter",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I've rеalized recently that it doеsn't really matter / I've been running for a long, long time",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I've been running for a long, long time / I know I can't find what I'm looking for",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I know I can't find what I'm looking for / And I've wasted so much time",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And I've wasted so much time / But I don't regret a thing",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But I don't regret a thing / I've changed",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I've changed / I've done so much, seen so much",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I've done so much, seen so much / I've slept weeping, and weeping I've waked",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I've slept weeping, and weeping I've waked / Tears like you wouldn't believe",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Tears like you wouldn't believe / But laughter too",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But laughter too / So much laughter, so much love",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "So much laughter, so much love / I thought my body was different",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I thought my body was different / I thought I could never die",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I thought I could never die / But now I know, I know the truth",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But now I know, I know the truth / My head hurts, but I know the truth",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "My head hurts, but I know the truth / I know that love is the only thought and pain is the only feeling",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I know that love is the only thought and pain is the only feeling / And I'm ready to dance",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And I'm ready to dance / I don't know what happened to me",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I don't know what happened to me / But I don't really care anymore",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But I don't really care anymore / One day, I was asleep, another awake",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "One day, I was asleep, another awake / All I've ever wanted was to move to the music",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "All I've ever wanted was to move to the music / To be at a party that never ended",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "To be at a party that never ended / They used to chase me with hammers down the street",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "They used to chase me with hammers down the street / Boo-hoo, right? But I'm okay",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Boo-hoo, right? But I'm okay / I would have liked to lose it all with you",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I would have liked to lose it all with you / I would have liked to lose myself",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I would have liked to lose myself / Lose myself the way I used to long ago",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Lose myself the way I used to long ago / Back when I still had some life left in me",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Back when I still had some life left in me / I would close my eyes and be in a great big forest",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I would close my eyes and be in a great big forest / Or on an empty beach at sunrise",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Or on an empty beach at sunrise / Or in some strange and beautiful city",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Or in some strange and beautiful city / It's nighttime, but the birds are singing",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "It's nighttime, but the birds are singing / The streets are dead, but they look great in the moonlight",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "The streets are dead, but they look great in the moonlight / And I'm just walking along them",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And I'm just walking along them / I'm looking for something to love, but it's not that big a deal",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I'm looking for something to love, but it's not that big a deal / It's raining, but I'm alright",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "It's raining, but I'm alright / I'm just walking, I'm ready",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I'm just walking, I'm ready / I'm ready to move",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I'm ready to move / I'll always love you",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I'll always love you / But I've got to go now",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But I've got to go now / They're all waiting for me",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "They're all waiting for me / It's been real",
-    "song": "The Party that Never Ends",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Have you ever woken up one day and realised that everything you thought you knew was wrong?",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "That every single decision you have ever made in your entire life was also wrong?",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Well, I have",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And it feels really good",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "You don't need to sleep in your bed every night, the street is just as comfortable",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Life is not all, you know, funky shit and funny faces that you pull in the mirror",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "It's deep, but it's not that deep",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "The blue skies are for good vibes",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "The grey skies are for when you want to die",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "There is nothing darker than the sunlight when your eyes are closed",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Trust me, I know, I wear my sunglasses in the shower",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And I'm starting to feel a whole lot better",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Life gave me love and I made life out of it",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "My head hurts, but my heart knows the truth",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I've remembered how to laugh again",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I've become irresistible to the people to whom I want to be irresistible",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I know now that everything will work out for us",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "We will occupy spaces",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "We will make sound",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "We will go absolutely fucking crazy",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "We will think thoughts that will be thoughts we would have never imagined we could think",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Not in any past that any thought of ours could ever reach",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But thoughts whispering the first glimpse of the future",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Where somebody, maybe you, maybe not",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But somebody in a high, bright place",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Somebody wondering whether or not to jump",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Decides at last that the only thing left to do",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Have you ever woken up one day and realised that everything you thought you knew was wrong? / That every single decision you have ever made in your entire life was also wrong?",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "That every single decision you have ever made in your entire life was also wrong? / Well, I have",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Well, I have / And it feels really good",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And it feels really good / You don't need to sleep in your bed every night, the street is just as comfortable",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "You don't need to sleep in your bed every night, the street is just as comfortable / Life is not all, you know, funky shit and funny faces that you pull in the mirror",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Life is not all, you know, funky shit and funny faces that you pull in the mirror / It's deep, but it's not that deep",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "It's deep, but it's not that deep / The blue skies are for good vibes",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "The blue skies are for good vibes / The grey skies are for when you want to die",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "The grey skies are for when you want to die / There is nothing darker than the sunlight when your eyes are closed",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "There is nothing darker than the sunlight when your eyes are closed / Trust me, I know, I wear my sunglasses in the shower",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Trust me, I know, I wear my sunglasses in the shower / And I'm starting to feel a whole lot better",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And I'm starting to feel a whole lot better / Life gave me love and I made life out of it",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Life gave me love and I made life out of it / My head hurts, but my heart knows the truth",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "My head hurts, but my heart knows the truth / I've remembered how to laugh again",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I've remembered how to laugh again / I've become irresistible to the people to whom I want to be irresistible",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I've become irresistible to the people to whom I want to be irresistible / I know that love is the only thought and pain is the only feeling",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I know that love is the only thought and pain is the only feeling / I know now that everything will work out for us",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I know now that everything will work out for us / We will occupy spaces",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "We will occupy spaces / We will make sound",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "We will make sound / We will go absolutely fucking crazy",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "We will go absolutely fucking crazy / We will think thoughts that will be thoughts we would have never imagined we could think",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "We will think thoughts that will be thoughts we would have never imagined we could think / Not in any past that any thought of ours could ever reach",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Not in any past that any thought of ours could ever reach / But thoughts whispering the first glimpse of the future",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But thoughts whispering the first glimpse of the future / Where somebody, maybe you, maybe not",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Where somebody, maybe you, maybe not / But somebody in a high, bright place",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But somebody in a high, bright place / Somebody wondering whether or not to jump",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Somebody wondering whether or not to jump / Decides at last that the only thing left to do",
-    "song": "The Pavement is my Pillow Talk",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Eyes, ears, nose, tongue, body, mind",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "This is a love and mascara lesson",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "This is a make-up session",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "If someone is dead, why would you ask them if they are alive?",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "This is Headache",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I'll buy you nothing if you want",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I am one of the first people to have neither a heart, or a brain",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "All I am is whatever is not up for debate right now",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And all I did to make that happen was make something out of what had already been made of me",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I remember when I was still stuck on stick figures",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "When I fell in the ditch and could not find the stars",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I ran through the fog in pride",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Much in the same way that dancers run to rehearsal",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But I should've been having rare and tender beef with my friend",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And making jokes with punchlines like \"Merry Christmas\"",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I put salt in my coffee and said nothing, and then I found the sugar and cried laughing",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And now I have the purple",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Now I have the itch, that is the message enough",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "The comic strip life that floats away speaking about Spring",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And the benefits of a high vitamin diet",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Will it come true this year?",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "It will only be a half an hour of what exactly waiting",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I will go in the empty room you cannot leave and burn it before it burns us",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I will swim to the nearest floating object and wait there until the water leaves",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I will be louder than actors and children, and let my body grow wherever it wants",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Because I have found the \"you are here now\"",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "It was behind the shelf, and not even that far away",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And now that I know where I am, my life is going well",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "My life is going well",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "People's mouths move in time with what they are saying",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And I love life",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And I don't mind that she makes rags of my favorite t-shirt",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And then blows her nose in my towel",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I love her",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Even when she successfully confuses me about what colour my eyes are, and then tells me about the time she was attacked by a seal on a beach in Cape Town",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And while it is almost impossible to sleep next to someone who is snoring, almost all of the people who complain about the people they sleep with snoring also snore",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Don't worry about the fact that we have inscrutable hair",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And that we live in an inscrutable world",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "We are whole, and we are laughing",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "That is the message enough",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Eyes, ears, nose, tongue, body, mind / This is a love and mascara lesson",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "This is a love and mascara lesson / This is a make-up session",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "This is a make-up session / If someone is dead, why would you ask them if they are alive?",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "If someone is dead, why would you ask them if they are alive? / This is Headache",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "This is Headache / I'll buy you nothing if you want",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I'll buy you nothing if you want / I am one of the first people to have neither a heart, or a brain",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I am one of the first people to have neither a heart, or a brain / All I am is whatever is not up for debate right now",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "All I am is whatever is not up for debate right now / And all I did to make that happen was make something out of what had already been made of me",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And all I did to make that happen was make something out of what had already been made of me / I remember when I was still stuck on stick figures",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I remember when I was still stuck on stick figures / When I fell in the ditch and could not find the stars",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "When I fell in the ditch and could not find the stars / I ran through the fog in pride",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I ran through the fog in pride / Much in the same way that dancers run to rehearsal",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Much in the same way that dancers run to rehearsal / But I should've been having rare and tender beef with my friend",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But I should've been having rare and tender beef with my friend / And making jokes with punchlines like \"Merry Christmas\"",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And making jokes with punchlines like \"Merry Christmas\" / I put salt in my coffee and said nothing, and then I found the sugar and cried laughing",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I put salt in my coffee and said nothing, and then I found the sugar and cried laughing / And now I have the purple",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And now I have the purple / Now I have the itch, that is the message enough",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Now I have the itch, that is the message enough / The comic strip life that floats away speaking about Spring",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "The comic strip life that floats away speaking about Spring / And the benefits of a high vitamin diet",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And the benefits of a high vitamin diet / Will it come true this year?",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Will it come true this year? / It will only be a half an hour of what exactly waiting",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "It will only be a half an hour of what exactly waiting / I will go in the empty room you cannot leave and burn it before it burns us",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I will go in the empty room you cannot leave and burn it before it burns us / I will swim to the nearest floating object and wait there until the water leaves",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I will swim to the nearest floating object and wait there until the water leaves / I will be louder than actors and children, and let my body grow wherever it wants",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I will be louder than actors and children, and let my body grow wherever it wants / Because I have found the \"you are here now\"",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Because I have found the \"you are here now\" / It was behind the shelf, and not even that far away",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "It was behind the shelf, and not even that far away / And now that I know where I am, my life is going well",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And now that I know where I am, my life is going well / My life is going well",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "My life is going well / People's mouths move in time with what they are saying",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "People's mouths move in time with what they are saying / And I love life",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And I love life / And I don't mind that she makes rags of my favorite t-shirt",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And I don't mind that she makes rags of my favorite t-shirt / And then blows her nose in my towel",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And then blows her nose in my towel / I love her",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I love her / Even when she successfully confuses me about what colour my eyes are, and then tells me about the time she was attacked by a seal on a beach in Cape Town",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Don't worry about the fact that we have inscrutable hair / And that we live in an inscrutable world",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And that we live in an inscrutable world / We are whole, and we are laughing",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "We are whole, and we are laughing / That is the message enough",
-    "song": "Trophy Life",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Beautiful things, beautiful people",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "This is what it's all about",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "If you think the world looks good",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Guess what, it does",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "The arctic tern travels an average of seventy-one thousand kilometres a year",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And though fish are not animals, they do have feeling",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "So think about that the next time you take a shit in the sea",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I have no obligation to say I love you if you say you love me",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "It's not my fault you love me",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "It's not anybody's fault that love is the only thought and pain is the only feeling",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "If you ask me, that doesn't sound like such a bad situation",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Existence is innocent, plеase don't try to think otherwise",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "So chargе it to the game and blame it on the DJ that fell asleep at the decks",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "At this point, I feel like I'm almost one hundred percent pure angel",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "My history starts right now and I'm sorry for being late again",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I just didn't know I have to be on time every single time",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I really did love you and I'm sorry that we couldn't make it work",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I wish you all the best in your life and I'm sorry for always trying to see the funny side",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "It just made everything in my life easier",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "People need to stop trying to be cool and they need to start trying to be hot",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Because, remember, the enemy is yourself posed as a question",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I don't know much about anything really",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But I do know how life makes me feel",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "It makes me feel both dead and alive, just not at the same time",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But you know what the weirdest part is?",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Of all the onions in the world, I like spring onions the best",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "They give me hope",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Everything I said was true",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Apart from that last part",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And although the head hurts",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "The heart knows the truth",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Beautiful things, beautiful people / This is what it's all about",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "This is what it's all about / If you think the world looks good",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "If you think the world looks good / Guess what, it does",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Guess what, it does / The arctic tern travels an average of seventy-one thousand kilometres a year",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "The arctic tern travels an average of seventy-one thousand kilometres a year / And though fish are not animals, they do have feeling",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And though fish are not animals, they do have feeling / So think about that the next time you take a shit in the sea",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "So think about that the next time you take a shit in the sea / I have no obligation to say I love you if you say you love me",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I have no obligation to say I love you if you say you love me / It's not my fault you love me",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "It's not my fault you love me / It's not anybody's fault that love is the only thought and pain is the only feeling",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "It's not anybody's fault that love is the only thought and pain is the only feeling / If you ask me, that doesn't sound like such a bad situation",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "If you ask me, that doesn't sound like such a bad situation / Existence is innocent, plеase don't try to think otherwise",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Existence is innocent, plеase don't try to think otherwise / So chargе it to the game and blame it on the DJ that fell asleep at the decks",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "So chargе it to the game and blame it on the DJ that fell asleep at the decks / At this point, I feel like I'm almost one hundred percent pure angel",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "At this point, I feel like I'm almost one hundred percent pure angel / My history starts right now and I'm sorry for being late again",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "My history starts right now and I'm sorry for being late again / I just didn't know I have to be on time every single time",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I just didn't know I have to be on time every single time / I really did love you and I'm sorry that we couldn't make it work",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I really did love you and I'm sorry that we couldn't make it work / I wish you all the best in your life and I'm sorry for always trying to see the funny side",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I wish you all the best in your life and I'm sorry for always trying to see the funny side / It just made everything in my life easier",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "It just made everything in my life easier / People need to stop trying to be cool and they need to start trying to be hot",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "People need to stop trying to be cool and they need to start trying to be hot / Because, remember, the enemy is yourself posed as a question",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Because, remember, the enemy is yourself posed as a question / I don't know much about anything really",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "I don't know much about anything really / But I do know how life makes me feel",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But I do know how life makes me feel / It makes me feel both dead and alive, just not at the same time",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "It makes me feel both dead and alive, just not at the same time / But you know what the weirdest part is?",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "But you know what the weirdest part is? / Of all the onions in the world, I like spring onions the best",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Of all the onions in the world, I like spring onions the best / They give me hope",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "They give me hope / Everything I said was true",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Everything I said was true / Apart from that last part",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "Apart from that last part / And although the head hurts",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "And although the head hurts / The heart knows the truth",
-    "song": "Truisms 4 Dummies",
-    "artist": "Headache (PLZ)",
-    "album": "The Head Hurts but the Heart Knows the Truth"
-  },
-  {
-    "text": "This is me",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I ask the world the price",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And then I multiply that price by 1.5 using this very simple formula",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I hear what I want to hear",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And see what I want to see",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I see two anchovies running towards me",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Two anchovies could never hurt me; they're too delicious",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I pull out a bag from my bag",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Inside of it is a sign that reads: \"cheating is wrong\"",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "There's nothing I can't do",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Except what I can't do, or what you don't want me to do",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But sometimes all I want to do is nothing",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Merrill tells us that the least thing our self-love longs for most",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Others instinctively withhold",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And that only when time has slain desire is its wish granted",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "To a smiling ghost, neither harmed nor warmed now by the fire",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "At a small family-owned beach resort",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I eat a BBLT and drink pond water",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "My astrologer calls me and says I will die in a body of water",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "That's not a problem for me; I'm an Aquarius",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And isn't the Earth basically a body of water anyway?",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Life is but a place of brief incarceration",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I used to enjoy hearing what I had to say to myself",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "It used to make me laugh",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Now it just makes me stare at myself in the mirror",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And do Brazilian dances",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I dry my dishes on my clothes line",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "My bug bites take a year to heal",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "My favorite meal is sandwiches",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "A girl wearing frayed jean shorts asks me how I feel",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I don't answer",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "When she walks away, I notice she has \"game over\" tattooed on the back of her thighs in the Tetris font",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Surfers of the world's spirit unite",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "You know I walked through Paris while that church burned",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And though I saw an ember in the dirt",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "It was actually a flower",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Old women melt in the street and prayed",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And I asked the rain how long the rain would fall",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And nothing changed or answered",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Mayhem is the coming together of friends",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Pandemonium, a perfect, free lunch",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And remember that though your head might hurt",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Your heart still knows the truth",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "The dinner plans can always be successfully enlarged",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "At the end, they will take me out on my stretcher",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And I will be in good spirits",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Buckle up, you may want to survive this one",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "This is me / I ask the world the price",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I ask the world the price / And then I multiply that price by 1.5 using this very simple formula",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And then I multiply that price by 1.5 using this very simple formula / I hear what I want to hear",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I hear what I want to hear / And see what I want to see",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And see what I want to see / I see two anchovies running towards me",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I see two anchovies running towards me / Two anchovies could never hurt me; they're too delicious",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Two anchovies could never hurt me; they're too delicious / I pull out a bag from my bag",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I pull out a bag from my bag / Inside of it is a sign that reads: \"cheating is wrong\"",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Inside of it is a sign that reads: \"cheating is wrong\" / There's nothing I can't do",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "There's nothing I can't do / Except what I can't do, or what you don't want me to do",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Except what I can't do, or what you don't want me to do / But sometimes all I want to do is nothing",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "But sometimes all I want to do is nothing / Merrill tells us that the least thing our self-love longs for most",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Merrill tells us that the least thing our self-love longs for most / Others instinctively withhold",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Others instinctively withhold / And that only when time has slain desire is its wish granted",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And that only when time has slain desire is its wish granted / To a smiling ghost, neither harmed nor warmed now by the fire",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "To a smiling ghost, neither harmed nor warmed now by the fire / At a small family-owned beach resort",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "At a small family-owned beach resort / I eat a BBLT and drink pond water",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I eat a BBLT and drink pond water / My astrologer calls me and says I will die in a body of water",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "My astrologer calls me and says I will die in a body of water / That's not a problem for me; I'm an Aquarius",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "That's not a problem for me; I'm an Aquarius / And isn't the Earth basically a body of water anyway?",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And isn't the Earth basically a body of water anyway? / Life is but a place of brief incarceration",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Life is but a place of brief incarceration / I used to enjoy hearing what I had to say to myself",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I used to enjoy hearing what I had to say to myself / It used to make me laugh",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "It used to make me laugh / Now it just makes me stare at myself in the mirror",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Now it just makes me stare at myself in the mirror / And do Brazilian dances",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And do Brazilian dances / I dry my dishes on my clothes line",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I dry my dishes on my clothes line / My bug bites take a year to heal",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "My bug bites take a year to heal / My favorite meal is sandwiches",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "My favorite meal is sandwiches / A girl wearing frayed jean shorts asks me how I feel",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "A girl wearing frayed jean shorts asks me how I feel / I don't answer",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "I don't answer / When she walks away, I notice she has \"game over\" tattooed on the back of her thighs in the Tetris font",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "When she walks away, I notice she has \"game over\" tattooed on the back of her thighs in the Tetris font / Surfers of the world's spirit unite",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Surfers of the world's spirit unite / You know I walked through Paris while that church burned",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "You know I walked through Paris while that church burned / And though I saw an ember in the dirt",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And though I saw an ember in the dirt / It was actually a flower",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "It was actually a flower / Old women melt in the street and prayed",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Old women melt in the street and prayed / And I asked the rain how long the rain would fall",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And I asked the rain how long the rain would fall / And nothing changed or answered",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And nothing changed or answered / Mayhem is the coming together of friends",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Mayhem is the coming together of friends / Pandemonium, a perfect, free lunch",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Pandemonium, a perfect, free lunch / And remember that though your head might hurt",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And remember that though your head might hurt / Your heart still knows the truth",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Your heart still knows the truth / The dinner plans can always be successfully enlarged",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "The dinner plans can always be successfully enlarged / Thank you for almost everything",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "Thank you for almost everything / At the end, they will take me out on my stretcher",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "At the end, they will take me out on my stretcher / And I will be in good spirits",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
-  },
-  {
-    "text": "And I will be in good spirits / Buckle up, you may want to survive this one",
-    "song": "Wholesale Anthem",
-    "artist": "Headache (PLZ)",
-    "album": "Thank You for Almost Everything"
+    "album": "The Head Hurts but the Heart Knows the Truth",
+    "lines": [
+      "I don't recognize my face anymore",
+      "Was it always this strange-looking and why can't I just live?",
+      "Why do I have to be this way?",
+      "I just want to be a person again",
+      "I just want to feel real again",
+      "I want to crack jokes and dance under the stars with my friends again",
+      "I would like to bankrupt the casino accidentally",
+      "There's so much I still want to do",
+      "I want to hit the road with you again",
+      "Rome, Paris, London, Cairo, Cape Town, Bangkok, Hong Kong, Los Angeles",
+      "Bangkok again, Cartagena for ceviche and a swim",
+      "I wanna watch you sleeping and get high off how beautiful you are",
+      "I don't want this life anymore",
+      "I don't wanna see that big black dog in the corner of my room every night",
+      "I want to tan naked with you right next to me",
+      "Also naked",
+      "I want to feel pеace",
+      "I wanna see you in the black dress again",
+      "With your hair up, looking at mе",
+      "Telling me that you think we shouldn't pay for the meal we just had because it really wasn't very good",
+      "My head hurts, but I know what I have to do",
+      "I need to stop being cool and start being hot",
+      "I need to mix the blue with the yellow",
+      "I need to call her back",
+      "I know what to say when the robot asks me for my name",
+      "I know that love is the only thought and pain is the only feeling"
+    ],
+    "quotes": [[0,1],[1,1],[2,1],[3,1],[4,1],[5,1],[6,1],[7,1],[8,1],[9,1],[10,1],[11,1],[12,1],[13,1],[14,1],[15,1],[16,1],[17,1],[18,1],[19,1],[20,1],[21,1],[22,1],[23,1],[24,1],[25,1],[0,2],[1,2],[2,2],[3,2],[4,2],[5,2],[6,2],[7,2],[8,2],[9,2],[10,2],[11,2],[12,2],[13,2],[14,2],[15,2],[16,2],[17,2],[18,2],[19,2],[20,2],[21,2],[22,2],[23,2],[24,2]]
+  },
+  {
+    "song": "Business Opportunities",
+    "artist": "Headache (PLZ)",
+    "album": "The Head Hurts but the Heart Knows the Truth",
+    "lines": [
+      "It was mostly peaceful, chaotic, but mostly peaceful chaos",
+      "I took my shoes off",
+      "I got ready with how I was feeling",
+      "I ate the apple and lost myself to paradise",
+      "But the thing they don't tell you is that it's your body that leaves your soul",
+      "Not the other way around",
+      "You can literally feel your heart stop beating",
+      "And it's not, it's not even that strange",
+      "You know what's gonna happen, but you aren't angry that you do know",
+      "And in fact, the fact that you do know gives you some secret feeling of bliss",
+      "And it's not in any way diminished",
+      "When that thing that you know is going to happen does eventually happen",
+      "That's how I felt",
+      "I felt happy in a secret way",
+      "Naked, obviously",
+      "Angry that I could hear voices",
+      "But really, like, I was at peace with everything",
+      "Just me and my slowly slowing heart in a crowd of faces asking me for my name and what the date was",
+      "And whether or not we were in a time of national crisis",
+      "I don't know, kindness is so strange",
+      "The shame doesn't really capture the feeling, you know",
+      "How it felt to be in front of them like that",
+      "Blinking like a cat who just found out the mouse he's been trying to kill for the last ten years just ate his last piece of cheese",
+      "The only strange thing was that I could see anything at all, let alone their faces",
+      "I definitely wasn't supposed to be seeing anything",
+      "Demetria promised me I wouldn't",
+      "I felt very, very cold",
+      "It gets cold up there in the winter",
+      "Even colder if you've got nothing on",
+      "I remember saying that I hadn't taken much",
+      "Which was a lie, of course",
+      "They were all looking at me like I was the perfect example of everything that was wrong with being general",
+      "And my generation in particular",
+      "Why was the first thing I said when I came back an incredibly obvious lie?",
+      "I guess that says a lot about me, doesn't it?",
+      "God, it was miserable",
+      "I remember them asking me if I had anywhere to stay",
+      "And me pausing for way too long",
+      "While knowing that the answer was obviously no",
+      "And then saying no",
+      "And how terribly quiet they all got standing there",
+      "Staring at me on that very cold winter morning",
+      "This one goes out to the concept of luck",
+      "That pure, blind luck that makes the women's netball team walk back a different route around the meadows",
+      "A route that takes them past whatever I was at that point",
+      "That kind of luck",
+      "Monica brought that fact up to me later while I was lying in her bed",
+      "Trying to figure out if there was a way to intercept the suicide notes I had mailed to ten different international news media conglomerates",
+      "She said, a little too triumphantly, I think",
+      "That if she hadn't ordered that eighth round of shots, then they would have left early and I wouldn't have been there",
+      "And that if she hadn't decided",
+      "In her, as I was soon to discover, classically whimsical way",
+      "To lead the gang after that eight round of shots back around a different way just because she felt like it",
+      "Then she wouldn't have found me at all",
+      "She found that that was all very relevant",
+      "So do I, I guess",
+      "When we slept together that night for the first time, I saw stars",
+      "It was beautiful",
+      "So, yeah, this one goes out to luck",
+      "And drunk, mad women"
+    ],
+    "quotes": [[0,1],[1,1],[2,1],[3,1],[4,1],[5,1],[6,1],[7,1],[8,1],[9,1],[10,1],[11,1],[12,1],[13,1],[14,1],[15,1],[16,1],[17,1],[18,1],[19,1],[20,1],[21,1],[22,1],[23,1],[24,1],[25,1],[26,1],[27,1],[28,1],[29,1],[30,1],[31,1],[32,1],[33,1],[34,1],[35,1],[36,1],[37,1],[38,1],[39,1],[40,1],[41,1],[42,1],[43,1],[44,1],[45,1],[46,1],[47,1],[48,1],[49,1],[50,1],[51,1],[52,1],[53,1],[54,1],[55,1],[56,1],[57,1],[58,1],[59,1],[0,2],[1,2],[2,2],[3,2],[4,2],[5,2],[6,2],[7,2],[8,2],[9,2],[10,2],[11,2],[12,2],[13,2],[14,2],[15,2],[16,2],[17,2],[18,2],[19,2],[20,2],[21,2],[23,2],[24,2],[25,2],[26,2],[27,2],[28,2],[29,2],[30,2],[31,2],[32,2],[33,2],[34,2],[35,2],[36,2],[37,2],[38,2],[39,2],[40,2],[41,2],[42,2],[43,2],[44,2],[45,2],[47,2],[48,2],[49,2],[50,2],[51,2],[52,2],[53,2],[54,2],[55,2],[56,2],[57,2],[58,2]]
+  },
+  {
+    "song": "Dodge This!",
+    "artist": "Headache (PLZ)",
+    "album": "Thank You for Almost Everything",
+    "lines": [
+      "What should we steal tonight?",
+      "Another hour, another year?",
+      "I wish us all the best",
+      "The only way out is through, we've got to live it through",
+      "Night falls and the wind rises",
+      "I've pushed through the gates and whistled at the stars",
+      "All we have are words, the kindness of animals, the flash of an earring in the dark",
+      "Remember, we only ever smell like ourselves",
+      "This need to live",
+      "Drink it up, feel it in your eyes, show them how to really smile",
+      "Earlier today, a policeman asked me for my name and I told him: \"I'm sorry but I'm seeing someone at the moment\"",
+      "Neither the past, the present or the future matter to me",
+      "What matters to me is love, art and money",
+      "I'm running down the street and my arms are in the air and I'm shouting to them: \"You can't make me care\"",
+      "And I'm calling things that are be not as though they were",
+      "And I'm not trying and neither are you and neither is anybody else",
+      "We're just dancing",
+      "There's no feeling in the world like riding at 150 miles-an-hour into the sunset",
+      "And not being able to remember what you had for lunch",
+      "You wanna know what's next? More apocalypse",
+      "Even if you could escape it, why would you want to?",
+      "It's all so beautifully modern",
+      "I'm not leaving, I'm here for good",
+      "I won't lie to you, I was scared",
+      "I was scared when my life put me on a boat that I knew would sink but then I still got on",
+      "And while the whole setup was fantastic",
+      "And I was basically having the single greatest time of my young life",
+      "I still got the feeling",
+      "Call it intuition, call it luck",
+      "Call it whatever the word is for when you heat stroke twice in a week and start speaking Sanskrit",
+      "That that ship wreck, once it happened, it would not be cinematic at all",
+      "It would not be heroic",
+      "I would not end up doing the great things that I can't remember now that I've dreamt of doing when I was little",
+      "But I still knew, back there in the dark and peaceful cave where most of my important thoughts were living at the time",
+      "That I would end up, ironically enough, like that guy did in the movie",
+      "Betrayed by his adored object, more naked than it's possible for a person to be and lost in the grey and frozen confusion of being left alone to die",
+      "And I also knew that if some part of me did",
+      "However incredibly, survive",
+      "That all that would be left of me",
+      "Of everything that could've ever been thought of definitely as me",
+      "Would just be some faded memory",
+      "And that, if you allow me to speak metaphorically for a moment",
+      "It would end up being just like some old-leather jacket",
+      "Made out of indifference and cynicism",
+      "That I would have to then shrug on and lug around on my back for the rest of my fucking life",
+      "That's how I felt then and I don't think that I was wrong then either",
+      "I'll spare you of the gory details",
+      "But I will just say this",
+      "They gave the doctors that worked on me awards for exemplary performance in circumstances of extreme stress",
+      "All I really have to say is that I'm not scared anymore",
+      "I'm happy to be here with you all",
+      "And I feel extremely, extremely lucky to be alive",
+      "And if me and The Big Man upstairs didn't have such a complicated history",
+      "I'd kiss his hand right now",
+      "Because that shit there",
+      "That shit there was downright miraculous, ok?"
+    ],
+    "quotes": [[0,1],[1,1],[2,1],[3,1],[4,1],[5,1],[6,1],[7,1],[8,1],[9,1],[10,1],[11,1],[12,1],[13,1],[14,1],[15,1],[16,1],[17,1],[18,1],[19,1],[20,1],[21,1],[22,1],[23,1],[24,1],[25,1],[26,1],[27,1],[28,1],[29,1],[30,1],[31,1],[32,1],[33,1],[34,1],[35,1],[36,1],[37,1],[38,1],[39,1],[40,1],[41,1],[42,1],[43,1],[44,1],[45,1],[46,1],[47,1],[48,1],[49,1],[50,1],[51,1],[52,1],[53,1],[54,1],[55,1],[0,2],[1,2],[2,2],[3,2],[4,2],[5,2],[6,2],[7,2],[8,2],[9,2],[10,2],[11,2],[12,2],[13,2],[14,2],[15,2],[16,2],[17,2],[18,2],[19,2],[20,2],[21,2],[22,2],[23,2],[24,2],[25,2],[26,2],[27,2],[28,2],[29,2],[30,2],[31,2],[33,2],[35,2],[36,2],[37,2],[38,2],[39,2],[40,2],[41,2],[42,2],[43,2],[44,2],[45,2],[46,2],[47,2],[48,2],[49,2],[50,2],[51,2],[52,2],[53,2],[54,2]]
+  },
+  {
+    "song": "His Story",
+    "artist": "Headache (PLZ)",
+    "album": "Thank You for Almost Everything",
+    "lines": [
+      "Often found in the quiet hands of people from all walks",
+      "Rich, poor, humble, or grand",
+      "A treasure for those who explore far and wide",
+      "I carry their fortunes with wealth as my guide",
+      "I speak of great cities, power, and fame",
+      "Or honour divine in a more sacred name",
+      "The wise cherish my silent way of revealing knowledge in truth, without ever speaking",
+      "Though many chase after the path I've paved, sometimes the footprints I leave can fade",
+      "Today, I'm sixteen years old",
+      "I have half of a ham sandwich in my pocket",
+      "I forget my phone number",
+      "I remember instead the etymology of the word 'person'",
+      "The snowflakes falling on my face feel like ambulances",
+      "I realise, that if I was to die here, nobody would know for a really long time",
+      "Because of the largeness of this least likely of all possible worlds",
+      "On the drive out, we don't see anything for hours",
+      "Not a single thing, living or dead",
+      "Just a road going through an endless desert",
+      "With grey mountains in the distance, that never get closer",
+      "For some reason, I sing Christmas carols to myself and cry without tears",
+      "What am I doing here?",
+      "What is that car doing there, and why is it on fire?",
+      "My friend, whose name I've forgotten, and who I think has since moved on, is recording a video for his wife",
+      "He is describing everything he sees as if he's seeing it for the first time in his life",
+      "Out of the blue, he tells me that he thinks she is sleeping with her ski instructor",
+      "I decide then, that I should become a ski instructor",
+      "I smoke a cigarette, and feel the future with my nose",
+      "It is still attached to my face",
+      "I see long nights in cheap hotels",
+      "I hear quotes taken out of context",
+      "I see laughter and loneliness",
+      "I see boredom and anxiety",
+      "I must stop being a ghost",
+      "I must sneak back onto Earth",
+      "I don't like the fact that God moves in mysterious ways",
+      "Today, I am nineteen years old",
+      "Julio comes up to me in a club in Paris and tells me that the sky is blue, and the dead are coming back to life",
+      "He goes back to the bathroom to do more coke",
+      "And his girlfriend, whose father produces a very popular film franchise, asks me if I wanna sleep with her",
+      "I feel disgusted",
+      "I am twelve years old, in a long ballroom full of people older than me",
+      "They are staring at me and clapping",
+      "I climb down off the stage",
+      "My cousin Chris finds me, and gives me my first cigarette, and laughs, and ruffles my hair, and tells me that a man that likes to lie down is happy, and brags about all the money he's making",
+      "I am the pizza and gravy from my school cafeteria",
+      "I am the burger bar coleslaw",
+      "For where is my tree?",
+      "Where exactly is the window in my prison cell?",
+      "I dream, but when I wake, will I still be here?",
+      "Am I the chihuahua walking on the plates and glasses on my table",
+      "Will I eat cucumber salad tomorrow?",
+      "Is that why I'm so happy?",
+      "Today I feel old",
+      "Today I sat in the sun and told myself secrets I won't remember",
+      "Today, it is possible to survive"
+    ],
+    "quotes": [[0,1],[1,1],[2,1],[3,1],[4,1],[5,1],[6,1],[7,1],[8,1],[9,1],[10,1],[11,1],[12,1],[13,1],[14,1],[15,1],[16,1],[17,1],[18,1],[19,1],[20,1],[21,1],[22,1],[23,1],[24,1],[25,1],[26,1],[27,1],[28,1],[29,1],[30,1],[31,1],[32,1],[33,1],[34,1],[35,1],[36,1],[37,1],[38,1],[39,1],[40,1],[41,1],[42,1],[43,1],[44,1],[45,1],[46,1],[47,1],[48,1],[49,1],[50,1],[51,1],[52,1],[53,1],[54,1],[0,2],[1,2],[2,2],[3,2],[4,2],[5,2],[6,2],[7,2],[8,2],[9,2],[10,2],[11,2],[12,2],[13,2],[14,2],[15,2],[16,2],[17,2],[18,2],[19,2],[20,2],[21,2],[22,2],[23,2],[24,2],[25,2],[26,2],[27,2],[28,2],[29,2],[30,2],[31,2],[32,2],[33,2],[34,2],[35,2],[36,2],[37,2],[38,2],[39,2],[40,2],[41,2],[44,2],[45,2],[46,2],[47,2],[48,2],[49,2],[50,2],[51,2],[52,2],[53,2]]
+  },
+  {
+    "song": "I Appreciate You",
+    "artist": "Headache (PLZ)",
+    "album": "Thank You for Almost Everything",
+    "lines": [
+      "When my grandmother was sick, I used to carry her groceries home for her",
+      "To get there, I had to climb this hill with a park on it",
+      "I walked the same way every day",
+      "You will know how this feels",
+      "One day, because I wanted the best for myself",
+      "I tried out a new route through the park",
+      "It went underneath this bridge decorated with statues of famous Italian poets",
+      "And bits of graffiti on it that said shit like: \"end back pain\"",
+      "Underneath the bridge, which was basically 500 years old, was this enormous puddle that covered the whole path",
+      "I jumped over it",
+      "Time passed",
+      "And I started to hate the new route as much as I hated the old one",
+      "I hated it because it seemed like such a waste of energy",
+      "And I hated myself because I'd chosen to live my life like this",
+      "But I still use the route even after my grandmother died",
+      "I don't know why, really",
+      "I was into detours and compulsive behaviours, I guess",
+      "Do you get the picture?",
+      "One day, around the time that we are moving back to London",
+      "I took that route again",
+      "But the crazy thing is- is that the puddle wasn't there",
+      "And I just stood like a stunned chicken, high for the first time in my life, and jumped",
+      "I wanted the best for myself, you see?",
+      "The wind blew me all around the world",
+      "It was loathsome",
+      "And I loved it",
+      "I loved to die, and to be undone",
+      "I ignored letters that said \"do not ignore\"",
+      "I waggled my cup and asked for more",
+      "I ran laughing into the fire, but I didn't burn",
+      "Because the fire inside me burned brighter than the fire around me",
+      "Every time I had a thought of any sort at all",
+      "I asked myself the same questions",
+      "Is any of this real?",
+      "Is any of this true?",
+      "Is it going to be like this forever?",
+      "The answers were no, of course",
+      "Summer came eventually",
+      "Autumn after that",
+      "Then winter, then spring, then summer again",
+      "You get the picture",
+      "Since being told to abandon all hope of rescue",
+      "I have decided to rescue myself",
+      "If divided in two, cannot survive",
+      "But the mind can",
+      "God grants my eyes the grip",
+      "And my soul takes care of the rest",
+      "Time turns our lies into truth",
+      "And they fit",
+      "Not like a boot, but more like a glove",
+      "You see the door is behind you, and it opens if you turn the handle",
+      "You break in, and then you break out, and then you break up",
+      "And the gentle sort of pain that follows you, is just the part of you that is still listening to the music",
+      "Don't let go of it",
+      "If you don't have to, don't leave it all behind",
+      "And I just stood like a stunned chicken, high for the first time in my life, and jumped",
+      "Time passed",
+      "I wanted the best for myself, you see?"
+    ],
+    "quotes": [[0,1],[1,1],[2,1],[3,1],[4,1],[5,1],[6,1],[7,1],[8,1],[9,1],[10,1],[11,1],[12,1],[13,1],[14,1],[15,1],[16,1],[17,1],[18,1],[19,1],[20,1],[21,1],[22,1],[23,1],[24,1],[25,1],[26,1],[27,1],[28,1],[29,1],[30,1],[31,1],[32,1],[33,1],[34,1],[35,1],[36,1],[37,1],[38,1],[39,1],[40,1],[41,1],[42,1],[43,1],[44,1],[45,1],[46,1],[47,1],[48,1],[49,1],[50,1],[51,1],[52,1],[53,1],[54,1],[0,2],[1,2],[2,2],[3,2],[4,2],[5,2],[6,2],[7,2],[8,2],[9,2],[10,2],[11,2],[12,2],[13,2],[14,2],[15,2],[16,2],[17,2],[18,2],[19,2],[20,2],[55,2],[56,2],[22,2],[23,2],[24,2],[25,2],[26,2],[27,2],[28,2],[29,2],[30,2],[31,2],[32,2],[33,2],[34,2],[35,2],[36,2],[37,2],[38,2],[39,2],[40,2],[41,2],[42,2],[43,2],[44,2],[45,2],[46,2],[47,2],[48,2],[49,2],[50,2],[51,2],[52,2],[53,2]]
+  },
+  {
+    "song": "It Opens if You Turn the Handle",
+    "artist": "Headache (PLZ)",
+    "album": "Thank You for Almost Everything",
+    "lines": [
+      "When I'm standing around in the kitchen, ignoring my life and grilling courgettes",
+      "I can move my head and body",
+      "I can turn into an easter egg, or a music box, or a piece of cake",
+      "But when I'm sat in the sun, doing absolutely nothing, absolutely everything is possible",
+      "Because, like Uncle Mario always used to say: \"If you want to really see Delft, you have to go to The Hague\"",
+      "Art reduces the immediate contingency in which an object exists to a state in which the object assumes the form and quality of freedom",
+      "Don't take breaks, take snacks",
+      "And while there has to be some way of saying \"what's your name, Sasha?\" that is both a statement and a question at the same time",
+      "When I wake up at 1:30 PM on a Wednesday",
+      "You, you will still definitely be you",
+      "And I will still somehow feel the need to live",
+      "'Cause you will still be you",
+      "And I will still remember how you apologized to me when you kicked me out of your restaurant for doing my newest dance move",
+      "And how you smiled when I told you that it was called \"going crazy in a restaurant\"",
+      "Here and now are images at best",
+      "I am gone where I get moved to go",
+      "I am a man, a thing, a dream",
+      "Dry cleaning, strong feelings",
+      "Tie your sandbag to the smoke alarm and smoke",
+      "Our hopes have run away forever",
+      "Look instead for the horse that comes first, and the knowledge that laughter is always right next door",
+      "Hey universe, do you want to play dice?",
+      "Peace is where Earth meets heaven",
+      "And it is a chemical wedding",
+      "Beauty need not be just",
+      "But justice is often beautiful",
+      "And yes, I drink the Jugo de Coco",
+      "And yes, I think about the world",
+      "Yes, I look at the sky, and yes, I cough a lot",
+      "And to quote the late great Sinéad O'Connor: \"It is no measure of health to be well adjusted to a profoundly sick society\"",
+      "But I see no difference",
+      "The world is the world",
+      "I eat paper instead of food",
+      "The door is right in front of you, and it opens if you turn the handle",
+      "You must go out, go in, go through to get out, go down to go through",
+      "I went in, I went out",
+      "I went to where they said I couldn't go",
+      "And I sat in the shade, with Michelle",
+      "And we ate grilled fish, and argued",
+      "The girls working there gave me a discount when I went to pay and giggled at me",
+      "While flamingoes stood, pink and balletic, in the rolling surf"
+    ],
+    "quotes": [[0,1],[1,1],[2,1],[3,1],[4,1],[5,1],[6,1],[7,1],[8,1],[9,1],[10,1],[11,1],[12,1],[13,1],[14,1],[15,1],[16,1],[17,1],[18,1],[19,1],[20,1],[21,1],[22,1],[23,1],[24,1],[25,1],[26,1],[27,1],[28,1],[29,1],[30,1],[31,1],[32,1],[33,1],[34,1],[35,1],[36,1],[37,1],[38,1],[39,1],[40,1],[0,2],[1,2],[2,2],[3,2],[5,2],[6,2],[7,2],[8,2],[9,2],[10,2],[11,2],[13,2],[14,2],[15,2],[16,2],[17,2],[18,2],[19,2],[20,2],[21,2],[22,2],[23,2],[24,2],[25,2],[26,2],[27,2],[28,2],[29,2],[30,2],[31,2],[32,2],[33,2],[34,2],[35,2],[36,2],[37,2],[38,2],[39,2]]
+  },
+  {
+    "song": "Mission Impossible III",
+    "artist": "Headache (PLZ)",
+    "album": "The Head Hurts but the Heart Knows the Truth",
+    "lines": [
+      "This is the sound of orange juice and milk",
+      "This is the ringing in your ears after you hear me screaming",
+      "This is the fact of your eyes with tears in them",
+      "And your body naked in the pool",
+      "My body is different",
+      "My body is made up of a tiny million little pieces of rope",
+      "And all I need you to do is tie me up again",
+      "I need to move",
+      "I want to hear the ideas that leave you only just enough room to breathe",
+      "This city can hear it all, the lips just want lips",
+      "The face just wants to face the mirror and scream",
+      "But listen, thеre's more than enough hеartbreak going around",
+      "It's all just smoke, the past is dead and it's not nighttime yet",
+      "We are the birds and we are the stars",
+      "We can tell the night to fuck off",
+      "I mean, look at me",
+      "I had the right of way and now I'm dead",
+      "How do you think that makes me feel?",
+      "They had to stop me",
+      "My mind had started to distort reality",
+      "But, baby, if you don't kill me again, I really am going to die",
+      "Just love me",
+      "Who knows? We might both like it",
+      "Remember, you're nobody till somebody loves you",
+      "And there's no blue without the yellow",
+      "Just walk with me, wild thing",
+      "I remember that house",
+      "I used to have some stuff in there",
+      "A hill, a medium-sized lake, a woman, a gun, various drugs",
+      "Various awards given for excellence in literature",
+      "It can't have been that bad If I don't remember anything else, right?",
+      "I can feel it",
+      "This heart is about to start beating",
+      "High energy resolves into smaller structures",
+      "We cannot tile an infinite plane",
+      "Stand back",
+      "I stole the fire and I'm about to start smoking",
+      "I don't talk English, I talk Toyota",
+      "Both when sad and not",
+      "In the clown nursery, it's always time to dance",
+      "We want free drinks and then more free drinks",
+      "The apples will speak for themselves",
+      "And I wasn't talking to you",
+      "I said stay there, it's fine to have all still alive",
+      "Who cares what happens after this?",
+      "The ambassador is on the dance floor, the bride has a headache",
+      "And everyone else has their legs in the air",
+      "There are things that can be done",
+      "After all, we've all been guilty of a few accidents once in a while",
+      "We walked on water, we was yelling, there was glee",
+      "I've spent a little too long squatting naked in the dark",
+      "It's taken me a while to get back up above the clouds and out of the ocean of infinite nonthings",
+      "Now, now I just try to be as bad of a person as possible",
+      "I have a big debt to pay off",
+      "That's how it works, right?",
+      "My soul is like a factory, but all it makes is shit",
+      "A place where light is pain, where my desires fear and my fears desire",
+      "My head hurts, but I know what I have to do",
+      "I know that love is the only thought and pain is the only feeling"
+    ],
+    "quotes": [[0,1],[1,1],[2,1],[3,1],[4,1],[5,1],[6,1],[7,1],[8,1],[9,1],[10,1],[11,1],[12,1],[13,1],[14,1],[15,1],[16,1],[17,1],[18,1],[19,1],[20,1],[21,1],[22,1],[23,1],[24,1],[25,1],[26,1],[27,1],[28,1],[29,1],[30,1],[31,1],[32,1],[33,1],[34,1],[35,1],[36,1],[37,1],[38,1],[39,1],[40,1],[41,1],[42,1],[43,1],[44,1],[45,1],[46,1],[47,1],[48,1],[49,1],[50,1],[51,1],[52,1],[53,1],[54,1],[55,1],[56,1],[0,2],[1,2],[2,2],[3,2],[4,2],[5,2],[6,2],[7,2],[8,2],[9,2],[10,2],[11,2],[12,2],[13,2],[14,2],[15,2],[16,2],[17,2],[18,2],[19,2],[20,2],[21,2],[22,2],[23,2],[24,2],[25,2],[26,2],[27,2],[28,2],[29,2],[30,2],[31,2],[32,2],[33,2],[34,2],[35,2],[36,2],[37,2],[38,2],[39,2],[40,2],[41,2],[42,2],[43,2],[44,2],[45,2],[46,2],[47,2],[48,2],[49,2],[50,2],[51,2],[52,2],[53,2],[54,2],[55,2],[56,2],[57,2]]
+  },
+  {
+    "song": "Most Undo Tomorrow",
+    "artist": "Headache (PLZ)",
+    "album": "Thank You for Almost Everything",
+    "lines": [
+      "Ladies and gentlemen of the jury, I am in the wrong place",
+      "This is the cherished format, this is the true and original copy",
+      "First, you scream, then you grunt, then grab the sexy thing and tell them: \"Hey, cut that out\"",
+      "We don't need to know much to know that",
+      "An obvious lie, over a totally blue sea",
+      "And a green sunset",
+      "Seabirds, gliding high and dry",
+      "The heart going jingle jangle",
+      "We have nothing else to do",
+      "Peel away, and start the scene",
+      "A busy world",
+      "A crowded mirror",
+      "Everything else in its right placе",
+      "A laugh that sounds plausibly like tears",
+      "This is not a question of tastе, but love",
+      "We bite down on the magic, find out it's actually our tongues, and work on that for a change",
+      "We might be mad, what a mess we made and laid down in, what a happy coincidence, what a life",
+      "How about that?",
+      "How about the sudden change in circumstances?",
+      "How about palm trees and wet sand, sensational, real, ready, planning",
+      "I don't want to die, I want to live",
+      "I want a lot of things",
+      "I want to sit here with you alone",
+      "And wait for the world to end",
+      "I want you to need me so much the world ends",
+      "I want to leave a mark",
+      "I just need you to be nicer to me",
+      "I'd like you to be nicer to me",
+      "I'd like you to dream about me",
+      "At least as much as I dream about you",
+      "I finally feel free",
+      "I have everything I need",
+      "Olives, extra-large condoms, cheese",
+      "I don't eat butterflies, so I don't get butterflies",
+      "But an elephant did try to eat me once",
+      "I don't blame her, really",
+      "I was wearing yellow, and I smelled like a banana",
+      "You know, on cloudy days, I sometimes wish she had succeeded",
+      "I sometimes wish she had succeeded",
+      "Which reminds me by the way, of how, when I was younger, I used to say that green was an unnatural colour",
+      "What was I thinking?",
+      "Green is the color of nuclear waste",
+      "These are not cigarettes we smoke",
+      "These are not smokes",
+      "They are a brief spark for our brief lives",
+      "An antidote to our tired souls",
+      "The ashes of childhood dreams",
+      "I was eccentric, but I am now dead",
+      "Sure, I've had harsh days and hardships",
+      "Endured journeys and endless jargon",
+      "I've worn rings",
+      "Went from good to greed",
+      "But I abide the bitter shit",
+      "And weather the hold of winter",
+      "I dare the world to delight in me",
+      "Loudness is my laughter",
+      "And there's always the beauty of blueberries, you know",
+      "There's always fields and shit",
+      "Fairness, disease, age, good moods",
+      "The days can be unendurable, but the world holds",
+      "I've lost friends, and watched their troubled tombs",
+      "I've ate the sweet, and felt the sorry",
+      "I will wait for you, and I will smile again",
+      "But the world holds",
+      "And while my face is pale, it faces the sun"
+    ],
+    "quotes": [[0,1],[1,1],[2,1],[3,1],[4,1],[5,1],[6,1],[7,1],[8,1],[9,1],[10,1],[11,1],[12,1],[13,1],[14,1],[15,1],[16,1],[17,1],[18,1],[19,1],[20,1],[21,1],[22,1],[23,1],[24,1],[25,1],[26,1],[27,1],[28,1],[29,1],[30,1],[31,1],[32,1],[33,1],[34,1],[35,1],[36,1],[37,1],[38,1],[39,1],[40,1],[41,1],[42,1],[43,1],[44,1],[45,1],[46,1],[47,1],[48,1],[49,1],[50,1],[51,1],[52,1],[53,1],[54,1],[55,1],[56,1],[57,1],[58,1],[59,1],[60,1],[61,1],[62,1],[63,1],[64,1],[0,2],[1,2],[2,2],[3,2],[4,2],[5,2],[6,2],[7,2],[8,2],[9,2],[10,2],[11,2],[12,2],[13,2],[14,2],[15,2],[16,2],[17,2],[18,2],[19,2],[20,2],[21,2],[22,2],[23,2],[24,2],[25,2],[26,2],[27,2],[28,2],[29,2],[30,2],[31,2],[32,2],[33,2],[34,2],[35,2],[36,2],[37,2],[38,2],[39,2],[40,2],[41,2],[42,2],[43,2],[44,2],[45,2],[46,2],[47,2],[48,2],[49,2],[50,2],[51,2],[52,2],[53,2],[54,2],[55,2],[56,2],[57,2],[58,2],[59,2],[60,2],[61,2],[62,2],[63,2]]
+  },
+  {
+    "song": "Nineteen Sixty Five",
+    "artist": "Headache (PLZ)",
+    "album": "Thank You for Almost Everything",
+    "lines": [
+      "Good evening",
+      "This is Headache speaking",
+      "Please remember to breathe",
+      "The numbers are: 11, 13, 21, 26, 36, and 108",
+      "The colours are: blue, yellow, red, and purple",
+      "When I was young, the moon used to walk me to school",
+      "And I would eat my cereal with a spoon",
+      "But now that I'm older, I like to eat it with a fork",
+      "Do I have to?",
+      "Do I want to?",
+      "Sometimes life is just hard for no reason",
+      "Sometimes you need to feel the weight of something pointless on your shouldеrs",
+      "Listen to me",
+      "I know how cool it would be if Sunday lastеd the whole damn week",
+      "I know that if you want to know how paradise really feels",
+      "You have to try somehow to be a little like a god",
+      "And if you're still here, remember, I'm not real",
+      "And neither are your dreams",
+      "And I'm sorry to break it to you",
+      "But, if that ever mattered to you at all",
+      "It was over for you from the start",
+      "We smoke 5.2 trillion cigarettes a year",
+      "Are you honestly trying to tell me that we couldn't manage a few more?",
+      "There are 100 trillion synapses in our brains",
+      "30 trillion cells in our lovely bodies",
+      "And there are 400 billion stars in the Milky Way",
+      "There are mad different types of fruit, which are somehow basically all delicious",
+      "There are different styles of insects",
+      "Of flowers, of birds, of bees, of reptiles, of trees, of mountains, of mammals, of rivers, of deserts, of oceans, of jungles, of lakes, of glaciers, of geysers, of volcanoes, and so, so much more",
+      "But quite amazingly, we have 34 thousand distinct emotions",
+      "And I'm currently experiencing one",
+      "What about you?",
+      "I can't tell you mine",
+      "That's for me to know",
+      "And you to try to find out"
+    ],
+    "quotes": [[0,1],[1,1],[2,1],[3,1],[4,1],[5,1],[6,1],[7,1],[8,1],[9,1],[10,1],[11,1],[12,1],[13,1],[14,1],[15,1],[16,1],[17,1],[18,1],[19,1],[20,1],[21,1],[22,1],[23,1],[24,1],[25,1],[26,1],[27,1],[28,1],[29,1],[30,1],[31,1],[32,1],[33,1],[34,1],[0,2],[1,2],[2,2],[3,2],[4,2],[5,2],[6,2],[7,2],[8,2],[9,2],[10,2],[11,2],[12,2],[13,2],[14,2],[15,2],[16,2],[17,2],[18,2],[19,2],[20,2],[21,2],[22,2],[23,2],[24,2],[25,2],[26,2],[29,2],[30,2],[31,2],[32,2],[33,2]]
+  },
+  {
+    "song": "That Thing with the Rabbit",
+    "artist": "Headache (PLZ)",
+    "album": "The Head Hurts but the Heart Knows the Truth",
+    "lines": [
+      "Make some noise right now for the voices in your head",
+      "The thing is I'm not just a nose with legs",
+      "But the desire to fall in is so strong, listen to me",
+      "Do you need some lip balm?",
+      "I shouldn't be responsible for what I say",
+      "Someone else should be responsible for what I say",
+      "There will always be baskets and benches",
+      "The cow is for land and the horse is for water",
+      "But can you really feel the sound of two hundred people eating?",
+      "I was in ancient Egypt with thе rabbit",
+      "I saw the whole thing, I exist likе cocaine",
+      "And I just wish stuff would stop happening so fast",
+      "I just want to catch my breath and feel that I exist in a moment within a moment",
+      "Inside this time right now",
+      "But I know life doesn't work like that",
+      "Everything is changing all the time",
+      "And if I keep eating this delusional garbage, it'll stick to the roof of my mouth",
+      "And I'll be walking along the street trying to go to the bank or something",
+      "And my tongue will be doing bits and my phone will ring",
+      "And it's someone calling themselves grandma, which is weird because all my grandmas are dead",
+      "God rest their souls",
+      "But she's telling me about the fact she's taken a plane to Algeria",
+      "And she doesn't know why",
+      "And I'm so baffled I walk into a lamppost",
+      "And on the other side of the street is the most beautiful woman in the world",
+      "And she's laughing at me",
+      "And everyone is staring at you, but not in a good way",
+      "In that scary way that you sometimes get in those dreams",
+      "Where everyone is looking at you and you look down at your feet",
+      "And you realize they aren't, strictly speaking, feet",
+      "But what are you supposed to do because",
+      "Because you just walked into a fucking lamppost?",
+      "And now you're rolling around on the floor",
+      "And you're still trying to get the dang words out of your mouth, but they're stuck to your tongue",
+      "And the music playing in the car, which the beautiful woman is getting into",
+      "Sounds a lot like an album you used to listen to when you were younger",
+      "That soundtracked some of your first sexual experiences",
+      "And the car is maroon",
+      "And maybe that's actually exactly the same color that your car is",
+      "And you start to get really freaked out because your head has been on the floor for a long time now",
+      "And if it starts to get any longer, there may be some major social and medical implications",
+      "And so you start to feel a little bit funny all over",
+      "And you try to reach down to touch your toes, but your lips start to tingle",
+      "Because they are right there resting up against the pile of all your hopes and dreams",
+      "And there's the ambulance",
+      "And there are some nice concerned-looking faces ready to take you somewhere",
+      "Where stuff will be injected into your central nervous system",
+      "Using techniques which seem to revolve around getting the ghost of your aunt's mother-in-law",
+      "To sing lullabies in a language you don't understand",
+      "Until you really, really start to forget who and what you are",
+      "Knock, knock, who's there? Thanks for watching"
+    ],
+    "quotes": [[0,1],[1,1],[2,1],[3,1],[4,1],[5,1],[6,1],[7,1],[8,1],[9,1],[10,1],[11,1],[12,1],[13,1],[14,1],[15,1],[16,1],[17,1],[18,1],[19,1],[20,1],[21,1],[22,1],[23,1],[24,1],[25,1],[26,1],[27,1],[28,1],[29,1],[30,1],[31,1],[32,1],[33,1],[34,1],[35,1],[36,1],[37,1],[38,1],[39,1],[40,1],[41,1],[42,1],[43,1],[44,1],[45,1],[46,1],[47,1],[48,1],[49,1],[50,1],[0,2],[1,2],[2,2],[3,2],[4,2],[5,2],[6,2],[7,2],[8,2],[9,2],[10,2],[11,2],[12,2],[13,2],[14,2],[15,2],[16,2],[17,2],[18,2],[19,2],[20,2],[21,2],[22,2],[23,2],[24,2],[25,2],[26,2],[27,2],[28,2],[29,2],[30,2],[31,2],[32,2],[33,2],[34,2],[35,2],[36,2],[37,2],[38,2],[39,2],[40,2],[41,2],[42,2],[43,2],[44,2],[45,2],[46,2],[47,2],[48,2],[49,2]]
+  },
+  {
+    "song": "The Beginning of the End",
+    "artist": "Headache (PLZ)",
+    "album": "The Head Hurts but the Heart Knows the Truth",
+    "lines": [
+      "Have you ever woken up and wondered where you are and why you're naked?",
+      "You are now listening to Headache",
+      "I used to take my breakfast off of a mirror",
+      "Now I just walk around and stare at people in the park",
+      "You think I care about what's happening to me?",
+      "Even my demons have demons",
+      "When I last saw Monica, she told me she never wanted to see or speak to me ever again in her life",
+      "She doesn't get it, nobody gets it",
+      "I can't remember the last time I got a good night's sleep",
+      "If you really think about it, life shouldn't feel this strange",
+      "If I could just figure out what the old woman wearing that salmon-pink snakeskin jacket wants from me",
+      "I'd feel a whole lot better",
+      "Doesn't she have a job?",
+      "Do I have a job?",
+      "It's not normal to sit outside someone's apartment the whole night long",
+      "But then again, what is normal?",
+      "Do you think I'm normal?",
+      "Say I'm normal",
+      "Please, for fuck's sake, please say I'm normal",
+      "I don't know what you want from me",
+      "I could never do that contemplation shit",
+      "Someone told me once that if you have more than three major concussions before the age of seven, you're fucked",
+      "I had eight",
+      "And anyway I'm not interested in knowing",
+      "I'm just tired, so tired",
+      "Something went wrong",
+      "Something went really wrong a long way back",
+      "And now I don't know, now I'm just doing this",
+      "One morning, you wake and you want to shave your head because the insects living up there have started to throw parties they aren't inviting you to",
+      "And you tell me I'm crazy?",
+      "I just want to live, I just want to feel something",
+      "Anything, anything",
+      "There's so much shit in the world",
+      "There's good, bad, mad, sad, ugly, happy",
+      "But I just love beauty",
+      "I think about my friends sometimes",
+      "Their lives, their failures",
+      "They don't know where I am",
+      "I wonder if they miss me",
+      "I miss their stories, the stuff they leave unfinished",
+      "The words they leave behind, the good they drag after them",
+      "And the destruction they create",
+      "But above all, above all, I remember the love",
+      "I remember sitting on my uncle Mario's knee",
+      "While he told me about the man he killed in the Embarcadero in August 1999",
+      "I remember the girl with pigtails in her hair asking me why I look so sad when I was supposed to be feeling happy",
+      "I remember climbing on a statue in my grandmother's garden while serious guys in suits walked around talking to each other",
+      "There was a lot of blood around back then",
+      "A lot of laughter, but a lot of blood too",
+      "And I mistook the laughter for love",
+      "I forgot the color where I came from",
+      "Now my taste is me",
+      "And sometimes it's a little too sour",
+      "The streets are so dead",
+      "How is it so easy to leave this world behind?",
+      "It feels like the world's a dream",
+      "Right up until I remember the smell of her hair blowing in the wind",
+      "You aim for my eyes, but you forgot that the heart is where all the action is",
+      "This one goes out to all the ghosts",
+      "I love you"
+    ],
+    "quotes": [[0,1],[1,1],[2,1],[3,1],[4,1],[5,1],[6,1],[7,1],[8,1],[9,1],[10,1],[11,1],[12,1],[13,1],[14,1],[15,1],[16,1],[17,1],[18,1],[19,1],[20,1],[21,1],[22,1],[23,1],[24,1],[25,1],[26,1],[27,1],[28,1],[29,1],[30,1],[31,1],[32,1],[33,1],[34,1],[35,1],[36,1],[37,1],[38,1],[39,1],[40,1],[41,1],[42,1],[43,1],[44,1],[45,1],[46,1],[47,1],[48,1],[49,1],[50,1],[51,1],[52,1],[53,1],[54,1],[55,1],[56,1],[57,1],[58,1],[59,1],[0,2],[1,2],[2,2],[3,2],[4,2],[5,2],[6,2],[7,2],[8,2],[9,2],[10,2],[11,2],[12,2],[13,2],[14,2],[15,2],[16,2],[17,2],[18,2],[19,2],[20,2],[21,2],[22,2],[23,2],[24,2],[25,2],[26,2],[27,2],[28,2],[29,2],[30,2],[31,2],[32,2],[33,2],[34,2],[35,2],[36,2],[37,2],[38,2],[39,2],[40,2],[41,2],[42,2],[43,2],[44,2],[46,2],[47,2],[48,2],[49,2],[50,2],[51,2],[52,2],[53,2],[54,2],[55,2],[56,2],[57,2],[58,2]]
+  },
+  {
+    "song": "The Joy Is Ours",
+    "artist": "Headache (PLZ)",
+    "album": "Thank You for Almost Everything",
+    "lines": [
+      "I'd like to save my skin",
+      "It covers my entire body",
+      "I'll put it this way:",
+      "If I've got to, I've got to",
+      "But if I can’t, I can’t",
+      "Last night, I fell asleep standing up in the corner of a party",
+      "Into the corner runs the hare, as they say",
+      "They do say that, right?",
+      "How easily it all comes apart, what was hardly even together",
+      "When the sky is raining, don't we sit raining too, basically?",
+      "Joy is ours then, along with a little pain as well, of course",
+      "But must always must",
+      "And the way of the world is an open book",
+      "Behind everything, there is some other thing forever",
+      "You ask yourself if one weary mind can weather this shit storm alone",
+      "If one heart can set itself free",
+      "But I've spent so many winters sleeping as Santa",
+      "And they could always swim away those we need, couldn't they?",
+      "And afterwards, it would be almost as if they never were",
+      "That money was a loan",
+      "That line was a quote",
+      "Thank you for almost everything",
+      "It's six in the morning",
+      "I walk into the basement apartment of a city I should not have been born in, slowly",
+      "Since I do not live there",
+      "I sit down, I stand still",
+      "I dig in the trash, wait, and listen",
+      "The worst part of heaven is how long it takes to get there",
+      "You have no idea",
+      "In the haze of concrete stained black by the rain",
+      "I stand still and listen",
+      "Last night, in an alley, I accidentally saw a ghost which tried to rob me",
+      "The Earth is what holds all of us up",
+      "The people who love me fight me in their sleep",
+      "But I forgive them, since I used to do that too",
+      "You can pray for me anytime you want",
+      "People ask me what happened, and who is who?",
+      "I'm not crying because I'm sad",
+      "I'm crying because I don't want to be here",
+      "I want to die at home",
+      "I don't want to die here",
+      "I'm standing still",
+      "I'm not holding anything",
+      "My electricity bill is going up",
+      "And we are all going to die",
+      "I, for one, am going to suck my thumb and go back to sleep",
+      "Thank you, for almost everything",
+      "Forms are temporary",
+      "Feelings are temporary",
+      "Consciousness is temporary",
+      "Remember, you are dust",
+      "And unto dust, you will return"
+    ],
+    "quotes": [[0,1],[1,1],[2,1],[3,1],[4,1],[5,1],[6,1],[7,1],[8,1],[9,1],[10,1],[11,1],[12,1],[13,1],[14,1],[15,1],[16,1],[17,1],[18,1],[19,1],[20,1],[21,1],[22,1],[23,1],[24,1],[25,1],[26,1],[27,1],[28,1],[29,1],[30,1],[31,1],[32,1],[33,1],[34,1],[35,1],[36,1],[37,1],[38,1],[39,1],[40,1],[41,1],[42,1],[43,1],[44,1],[45,1],[46,1],[47,1],[48,1],[49,1],[50,1],[51,1],[0,2],[1,2],[2,2],[3,2],[4,2],[5,2],[6,2],[7,2],[8,2],[9,2],[10,2],[11,2],[12,2],[13,2],[14,2],[15,2],[16,2],[17,2],[18,2],[19,2],[20,2],[21,2],[22,2],[23,2],[24,2],[25,2],[26,2],[27,2],[28,2],[29,2],[30,2],[31,2],[32,2],[33,2],[34,2],[35,2],[36,2],[37,2],[38,2],[39,2],[40,2],[41,2],[42,2],[43,2],[44,2],[45,2],[46,2],[47,2],[48,2],[49,2],[50,2]]
+  },
+  {
+    "song": "The Party that Never Ends",
+    "artist": "Headache (PLZ)",
+    "album": "The Head Hurts but the Heart Knows the Truth",
+    "lines": [
+      "When I was five years old, I fell off a boat in my godmother's lake",
+      "Because I was holding on to the rail too hard",
+      "My older sister says I was underwater for only enough time to just about avoid death by drowning",
+      "But I remember sinking all the way down to the bottom",
+      "Where I saw creatures I still don't recognize to this day",
+      "Some of them spoke to me",
+      "I don't think I was the same thing I was before by the time they pulled me out",
+      "But maybe that's not such a bad thing",
+      "I've rеalized recently that it doеsn't really matter",
+      "I've been running for a long, long time",
+      "I know I can't find what I'm looking for",
+      "And I've wasted so much time",
+      "But I don't regret a thing",
+      "I've changed",
+      "I've done so much, seen so much",
+      "I've slept weeping, and weeping I've waked",
+      "Tears like you wouldn't believe",
+      "But laughter too",
+      "So much laughter, so much love",
+      "I thought my body was different",
+      "I thought I could never die",
+      "But now I know, I know the truth",
+      "My head hurts, but I know the truth",
+      "And I'm ready to dance",
+      "I don't know what happened to me",
+      "But I don't really care anymore",
+      "One day, I was asleep, another awake",
+      "All I've ever wanted was to move to the music",
+      "To be at a party that never ended",
+      "They used to chase me with hammers down the street",
+      "Boo-hoo, right? But I'm okay",
+      "I would have liked to lose it all with you",
+      "I would have liked to lose myself",
+      "Lose myself the way I used to long ago",
+      "Back when I still had some life left in me",
+      "I would close my eyes and be in a great big forest",
+      "Or on an empty beach at sunrise",
+      "Or in some strange and beautiful city",
+      "It's nighttime, but the birds are singing",
+      "The streets are dead, but they look great in the moonlight",
+      "And I'm just walking along them",
+      "I'm looking for something to love, but it's not that big a deal",
+      "It's raining, but I'm alright",
+      "I'm just walking, I'm ready",
+      "I'm ready to move",
+      "I'll always love you",
+      "But I've got to go now",
+      "They're all waiting for me",
+      "It's been real",
+      "My head hurts, but I know the truth",
+      "I know that love is the only thought and pain is the only feeling",
+      "And I'm ready to dance"
+    ],
+    "quotes": [[0,1],[1,1],[2,1],[3,1],[4,1],[5,1],[6,1],[7,1],[8,1],[9,1],[10,1],[11,1],[12,1],[13,1],[14,1],[15,1],[16,1],[17,1],[18,1],[19,1],[20,1],[21,1],[22,1],[23,1],[24,1],[25,1],[26,1],[27,1],[28,1],[29,1],[30,1],[31,1],[32,1],[33,1],[34,1],[35,1],[36,1],[37,1],[38,1],[39,1],[40,1],[41,1],[42,1],[43,1],[44,1],[45,1],[46,1],[47,1],[48,1],[0,2],[1,2],[2,2],[3,2],[4,2],[5,2],[6,2],[7,2],[8,2],[9,2],[10,2],[11,2],[12,2],[13,2],[14,2],[15,2],[16,2],[17,2],[18,2],[19,2],[20,2],[21,2],[49,2],[50,2],[23,2],[24,2],[25,2],[26,2],[27,2],[28,2],[29,2],[30,2],[31,2],[32,2],[33,2],[34,2],[35,2],[36,2],[37,2],[38,2],[39,2],[40,2],[41,2],[42,2],[43,2],[44,2],[45,2],[46,2],[47,2]]
+  },
+  {
+    "song": "The Pavement is my Pillow Talk",
+    "artist": "Headache (PLZ)",
+    "album": "The Head Hurts but the Heart Knows the Truth",
+    "lines": [
+      "Have you ever woken up one day and realised that everything you thought you knew was wrong?",
+      "That every single decision you have ever made in your entire life was also wrong?",
+      "Well, I have",
+      "And it feels really good",
+      "You don't need to sleep in your bed every night, the street is just as comfortable",
+      "Life is not all, you know, funky shit and funny faces that you pull in the mirror",
+      "It's deep, but it's not that deep",
+      "The blue skies are for good vibes",
+      "The grey skies are for when you want to die",
+      "There is nothing darker than the sunlight when your eyes are closed",
+      "Trust me, I know, I wear my sunglasses in the shower",
+      "And I'm starting to feel a whole lot better",
+      "Life gave me love and I made life out of it",
+      "My head hurts, but my heart knows the truth",
+      "I've remembered how to laugh again",
+      "I've become irresistible to the people to whom I want to be irresistible",
+      "I know now that everything will work out for us",
+      "We will occupy spaces",
+      "We will make sound",
+      "We will go absolutely fucking crazy",
+      "We will think thoughts that will be thoughts we would have never imagined we could think",
+      "Not in any past that any thought of ours could ever reach",
+      "But thoughts whispering the first glimpse of the future",
+      "Where somebody, maybe you, maybe not",
+      "But somebody in a high, bright place",
+      "Somebody wondering whether or not to jump",
+      "Decides at last that the only thing left to do",
+      "I've become irresistible to the people to whom I want to be irresistible",
+      "I know that love is the only thought and pain is the only feeling",
+      "I know now that everything will work out for us"
+    ],
+    "quotes": [[0,1],[1,1],[2,1],[3,1],[4,1],[5,1],[6,1],[7,1],[8,1],[9,1],[10,1],[11,1],[12,1],[13,1],[14,1],[15,1],[16,1],[17,1],[18,1],[19,1],[20,1],[21,1],[22,1],[23,1],[24,1],[25,1],[26,1],[0,2],[1,2],[2,2],[3,2],[4,2],[5,2],[6,2],[7,2],[8,2],[9,2],[10,2],[11,2],[12,2],[13,2],[14,2],[27,2],[28,2],[16,2],[17,2],[18,2],[19,2],[20,2],[21,2],[22,2],[23,2],[24,2],[25,2]]
+  },
+  {
+    "song": "Trophy Life",
+    "artist": "Headache (PLZ)",
+    "album": "Thank You for Almost Everything",
+    "lines": [
+      "Eyes, ears, nose, tongue, body, mind",
+      "This is a love and mascara lesson",
+      "This is a make-up session",
+      "If someone is dead, why would you ask them if they are alive?",
+      "This is Headache",
+      "I'll buy you nothing if you want",
+      "I am one of the first people to have neither a heart, or a brain",
+      "All I am is whatever is not up for debate right now",
+      "And all I did to make that happen was make something out of what had already been made of me",
+      "I remember when I was still stuck on stick figures",
+      "When I fell in the ditch and could not find the stars",
+      "I ran through the fog in pride",
+      "Much in the same way that dancers run to rehearsal",
+      "But I should've been having rare and tender beef with my friend",
+      "And making jokes with punchlines like \"Merry Christmas\"",
+      "I put salt in my coffee and said nothing, and then I found the sugar and cried laughing",
+      "And now I have the purple",
+      "Now I have the itch, that is the message enough",
+      "The comic strip life that floats away speaking about Spring",
+      "And the benefits of a high vitamin diet",
+      "Will it come true this year?",
+      "It will only be a half an hour of what exactly waiting",
+      "I will go in the empty room you cannot leave and burn it before it burns us",
+      "I will swim to the nearest floating object and wait there until the water leaves",
+      "I will be louder than actors and children, and let my body grow wherever it wants",
+      "Because I have found the \"you are here now\"",
+      "It was behind the shelf, and not even that far away",
+      "And now that I know where I am, my life is going well",
+      "My life is going well",
+      "People's mouths move in time with what they are saying",
+      "And I love life",
+      "And I don't mind that she makes rags of my favorite t-shirt",
+      "And then blows her nose in my towel",
+      "I love her",
+      "Even when she successfully confuses me about what colour my eyes are, and then tells me about the time she was attacked by a seal on a beach in Cape Town",
+      "And while it is almost impossible to sleep next to someone who is snoring, almost all of the people who complain about the people they sleep with snoring also snore",
+      "Don't worry about the fact that we have inscrutable hair",
+      "And that we live in an inscrutable world",
+      "We are whole, and we are laughing",
+      "That is the message enough"
+    ],
+    "quotes": [[0,1],[1,1],[2,1],[3,1],[4,1],[5,1],[6,1],[7,1],[8,1],[9,1],[10,1],[11,1],[12,1],[13,1],[14,1],[15,1],[16,1],[17,1],[18,1],[19,1],[20,1],[21,1],[22,1],[23,1],[24,1],[25,1],[26,1],[27,1],[28,1],[29,1],[30,1],[31,1],[32,1],[33,1],[34,1],[35,1],[36,1],[37,1],[38,1],[39,1],[0,2],[1,2],[2,2],[3,2],[4,2],[5,2],[6,2],[7,2],[8,2],[9,2],[10,2],[11,2],[12,2],[13,2],[14,2],[15,2],[16,2],[17,2],[18,2],[19,2],[20,2],[21,2],[22,2],[23,2],[24,2],[25,2],[26,2],[27,2],[28,2],[29,2],[30,2],[31,2],[32,2],[33,2],[36,2],[37,2],[38,2]]
+  },
+  {
+    "song": "Truisms 4 Dummies",
+    "artist": "Headache (PLZ)",
+    "album": "The Head Hurts but the Heart Knows the Truth",
+    "lines": [
+      "Beautiful things, beautiful people",
+      "This is what it's all about",
+      "If you think the world looks good",
+      "Guess what, it does",
+      "The arctic tern travels an average of seventy-one thousand kilometres a year",
+      "And though fish are not animals, they do have feeling",
+      "So think about that the next time you take a shit in the sea",
+      "I have no obligation to say I love you if you say you love me",
+      "It's not my fault you love me",
+      "It's not anybody's fault that love is the only thought and pain is the only feeling",
+      "If you ask me, that doesn't sound like such a bad situation",
+      "Existence is innocent, plеase don't try to think otherwise",
+      "So chargе it to the game and blame it on the DJ that fell asleep at the decks",
+      "At this point, I feel like I'm almost one hundred percent pure angel",
+      "My history starts right now and I'm sorry for being late again",
+      "I just didn't know I have to be on time every single time",
+      "I really did love you and I'm sorry that we couldn't make it work",
+      "I wish you all the best in your life and I'm sorry for always trying to see the funny side",
+      "It just made everything in my life easier",
+      "People need to stop trying to be cool and they need to start trying to be hot",
+      "Because, remember, the enemy is yourself posed as a question",
+      "I don't know much about anything really",
+      "But I do know how life makes me feel",
+      "It makes me feel both dead and alive, just not at the same time",
+      "But you know what the weirdest part is?",
+      "Of all the onions in the world, I like spring onions the best",
+      "They give me hope",
+      "Everything I said was true",
+      "Apart from that last part",
+      "And although the head hurts",
+      "The heart knows the truth"
+    ],
+    "quotes": [[0,1],[1,1],[2,1],[3,1],[4,1],[5,1],[6,1],[7,1],[8,1],[9,1],[10,1],[11,1],[12,1],[13,1],[14,1],[15,1],[16,1],[17,1],[18,1],[19,1],[20,1],[21,1],[22,1],[23,1],[24,1],[25,1],[26,1],[27,1],[28,1],[29,1],[30,1],[0,2],[1,2],[2,2],[3,2],[4,2],[5,2],[6,2],[7,2],[8,2],[9,2],[10,2],[11,2],[12,2],[13,2],[14,2],[15,2],[16,2],[17,2],[18,2],[19,2],[20,2],[21,2],[22,2],[23,2],[24,2],[25,2],[26,2],[27,2],[28,2],[29,2]]
+  },
+  {
+    "song": "Wholesale Anthem",
+    "artist": "Headache (PLZ)",
+    "album": "Thank You for Almost Everything",
+    "lines": [
+      "This is me",
+      "I ask the world the price",
+      "And then I multiply that price by 1.5 using this very simple formula",
+      "I hear what I want to hear",
+      "And see what I want to see",
+      "I see two anchovies running towards me",
+      "Two anchovies could never hurt me; they're too delicious",
+      "I pull out a bag from my bag",
+      "Inside of it is a sign that reads: \"cheating is wrong\"",
+      "There's nothing I can't do",
+      "Except what I can't do, or what you don't want me to do",
+      "But sometimes all I want to do is nothing",
+      "Merrill tells us that the least thing our self-love longs for most",
+      "Others instinctively withhold",
+      "And that only when time has slain desire is its wish granted",
+      "To a smiling ghost, neither harmed nor warmed now by the fire",
+      "At a small family-owned beach resort",
+      "I eat a BBLT and drink pond water",
+      "My astrologer calls me and says I will die in a body of water",
+      "That's not a problem for me; I'm an Aquarius",
+      "And isn't the Earth basically a body of water anyway?",
+      "Life is but a place of brief incarceration",
+      "I used to enjoy hearing what I had to say to myself",
+      "It used to make me laugh",
+      "Now it just makes me stare at myself in the mirror",
+      "And do Brazilian dances",
+      "I dry my dishes on my clothes line",
+      "My bug bites take a year to heal",
+      "My favorite meal is sandwiches",
+      "A girl wearing frayed jean shorts asks me how I feel",
+      "I don't answer",
+      "When she walks away, I notice she has \"game over\" tattooed on the back of her thighs in the Tetris font",
+      "Surfers of the world's spirit unite",
+      "You know I walked through Paris while that church burned",
+      "And though I saw an ember in the dirt",
+      "It was actually a flower",
+      "Old women melt in the street and prayed",
+      "And I asked the rain how long the rain would fall",
+      "And nothing changed or answered",
+      "Mayhem is the coming together of friends",
+      "Pandemonium, a perfect, free lunch",
+      "And remember that though your head might hurt",
+      "Your heart still knows the truth",
+      "The dinner plans can always be successfully enlarged",
+      "At the end, they will take me out on my stretcher",
+      "And I will be in good spirits",
+      "Buckle up, you may want to survive this one",
+      "The dinner plans can always be successfully enlarged",
+      "Thank you for almost everything",
+      "At the end, they will take me out on my stretcher"
+    ],
+    "quotes": [[0,1],[1,1],[2,1],[3,1],[4,1],[5,1],[6,1],[7,1],[8,1],[9,1],[10,1],[11,1],[12,1],[13,1],[14,1],[15,1],[16,1],[17,1],[18,1],[19,1],[20,1],[21,1],[22,1],[23,1],[24,1],[25,1],[26,1],[27,1],[28,1],[29,1],[30,1],[31,1],[32,1],[33,1],[34,1],[35,1],[36,1],[37,1],[38,1],[39,1],[40,1],[41,1],[42,1],[43,1],[44,1],[45,1],[46,1],[0,2],[1,2],[2,2],[3,2],[4,2],[5,2],[6,2],[7,2],[8,2],[9,2],[10,2],[11,2],[12,2],[13,2],[14,2],[15,2],[16,2],[17,2],[18,2],[19,2],[20,2],[21,2],[22,2],[23,2],[24,2],[25,2],[26,2],[27,2],[28,2],[29,2],[30,2],[31,2],[32,2],[33,2],[34,2],[35,2],[36,2],[37,2],[38,2],[39,2],[40,2],[41,2],[42,2],[47,2],[48,2],[44,2],[45,2]]
   }
 ];
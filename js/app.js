@@ -6,9 +6,35 @@
   var shuffleBtn = document.getElementById("shuffle-btn");
   var dailyLabel = document.getElementById("daily-label");
 
-  var quotes = window.QUOTES_DATA || [];
+  var songs = window.QUOTES_DATA || [];
   var isDaily = true;
 
+  /**
+   * Each song lists its clean lines once and its quotes as [start, length]
+   * windows into them (see scripts/quote_data.py). Number the quotes in
+   * dataset order, song after song.
+   */
+  var quotes = [];
+  songs.forEach(function (song) {
+    song.quotes.forEach(function (range) {
+      quotes.push({ song: song, start: range[0], length: range[1] });
+    });
+  });
+
+  /**
+   * Expand a quote into its text and credits.
+   */
+  function getQuote(index) {
+    var ref = quotes[index];
+    if (!ref) return null;
+    return {
+      text: ref.song.lines.slice(ref.start, ref.start + ref.length).join(" / "),
+      song: ref.song.song,
+      artist: ref.song.artist,
+      album: ref.song.album
+    };
+  }
+
   /**
    * Simple deterministic hash from a string.
    * Used to pick the "quote of the day" consistently.
@@ -50,7 +76,7 @@
     do {
       idx = Math.floor(Math.random() * quotes.length);
       attempts++;
-    } while (quotes[idx].text === currentText && attempts < 20);
+    } while (getQuote(idx).text === currentText && attempts < 20);
     return idx;
   }
 
@@ -58,7 +84,7 @@
    * Display a quote with a fade-in animation.
    */
   function displayQuote(index) {
-    var quote = quotes[index];
+    var quote = getQuote(index);
     if (!quote) return;
 
     // Fade out
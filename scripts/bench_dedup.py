@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark digest-keyed quote dedup against the old set of lowercased texts.
+
+Also runs the on-disk dedup (external_dedup.py) with --run-size keys per
+sorted run, and checks that every variant keeps the same quotes.
+
+Builds a synthetic catalog of songs (with choruses repeated inside and
+across songs, in varying case), streams its quotes through each dedup, and
+reports throughput and the peak memory the dedup holds. The corpus is
+generated lazily, so the peak is essentially the dedup's own state.
+
+Usage:
+    python scripts/bench_dedup.py [--quotes N] [--song-lines N] [--run-size N]
+"""
+
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+
+from external_dedup import ExternalDedup
+from fetch_lyrics import deduplicate_quotes, quote_digest
+from quote_data import SongLines, windows
+
+WORDS = (
+    "i you we they love night light cold static door window ocean wire glass "
+    "falling never always heart tired again nothing every sound headache "
+    "forever diamonds tomorrow almost everything static river"
+).split()
+
+
+def legacy_dedup(quotes):
+    """The original deduplicate_quotes: a set of the normalized texts."""
+    seen = set()
+    for quote in quotes:
+        key = quote.text.lower().strip()
+        if key not in seen:
+            seen.add(key)
+            yield quote
+
+
+def make_songs(quotes, song_lines, seed=0):
+    """Lazily yield SongLines until they add up to about `quotes` quotes."""
+    rnd = random.Random(seed)
+
+    def line():
+        return " ".join(rnd.choice(WORDS) for _ in range(rnd.randint(3, 12)))
+
+    choruses = [[line() for _ in range(4)] for _ in range(200)]
+    total = 0
+    song = 0
+    while total < quotes:
+        chorus = rnd.choice(choruses)
+        if rnd.random() < 0.3:
+            chorus = [text.upper() for text in chorus]
+        lines = []
+        while len(lines) < song_lines:
+            lines.extend(chorus if rnd.random() < 0.25 else [line(), line()])
+        source = SongLines.make(f"Song {song}", "Artist", "Album", lines)
+        total += 2 * len(lines) - 1  # Lines and couplets
+        song += 1
+        yield source
+
+
+def corpus(args):
+    for source in make_songs(args.quotes, args.song_lines):
+        yield from windows(source)
+
+
+def run(dedup, args):
+    """(hash of the quotes kept, quotes kept, quotes in, seconds)"""
+    seen = 0
+
+    def counted():
+        nonlocal seen
+        for quote in corpus(args):
+            seen += 1
+            yield quote
+
+    start = time.perf_counter()
+    kept = [(quote.song, quote.start, quote.length) for quote in dedup(counted())]
+    return hash(tuple(kept)), len(kept), seen, time.perf_counter() - start
+
+
+def peak_memory(dedup, args):
+    """Peak traced bytes while `dedup` consumes the corpus."""
+    tracemalloc.start()
+    for _ in dedup(corpus(args)):
+        pass
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--quotes", type=int, default=1_000_000)
+    parser.add_argument("--song-lines", type=int, default=40)
+    parser.add_argument("--run-size", type=int, default=100_000)
+    args = parser.parse_args()
+
+    variants = [
+        ("Lowercased texts", legacy_dedup),
+        ("Digests", deduplicate_quotes),
+        ("Digests, verify", lambda quotes: deduplicate_quotes(quotes, verify=True)),
+        (
+            "Sorted runs",
+            lambda quotes: ExternalDedup(quote_digest, args.run_size).filter(quotes),
+        ),
+    ]
+    results = []
+    for name, dedup in variants:
+        result, kept, total, seconds = run(dedup, args)
+        peak = peak_memory(dedup, args)
+        results.append(result)
+        print(
+            f"{name:17} {kept} of {total} kept, {total / seconds / 1000:.0f}k "
+            f"quotes/s, peak {peak / 2**20:.1f} MiB"
+        )
+    print(f"Identical: {len(set(results)) == 1}")
+    if len(set(results)) != 1:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark the compiled line filter against the old per-pattern loop.
+
+Builds a synthetic corpus of lyric-like lines (with the section headers,
+contributor counts, embeds and title lines Genius pages leave behind),
+checks that both filters drop exactly the same lines, and times them.
+
+Usage:
+    python scripts/bench_line_filter.py [--lines N] [--filters PATH]
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+
+from fetch_lyrics import LINE_FILTER
+from line_filter import LineFilter
+
+SONG_LINES = 60  # Lines per song for the batch API
+
+WORDS = (
+    "i you we they love night light cold static door window ocean wire glass "
+    "falling never always heart tired again nothing every sound"
+).split()
+NOISE = [
+    "[Chorus]",
+    "[Verse 2: Vegyn]",
+    "14 Contributors",
+    "1 Contributor",
+    "You might also like",
+    "See Vegyn Live",
+    "Get tickets as low as $45",
+    "Embed",
+    "23Embed",
+    "Translations",
+    "Nothing Lasts ForeverLyrics",
+    "",
+    "ok",
+    "x" * 250,
+]
+
+
+def make_corpus(count, seed=0):
+    rnd = random.Random(seed)
+    lines = []
+    for _ in range(count):
+        if rnd.random() < 0.15:
+            lines.append(rnd.choice(NOISE))
+        else:
+            words = [rnd.choice(WORDS) for _ in range(rnd.randint(1, 12))]
+            lines.append("  " + " ".join(words) + " ")
+    return lines
+
+
+def legacy_filter(line_filter):
+    """The original should_skip_line for the same rules: one regex call per rule."""
+    min_length = line_filter.min_length
+    max_length = line_filter.max_length
+    patterns = [
+        re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+        for _, pattern, ignore_case in line_filter.rules
+    ]
+
+    def should_skip(line):
+        stripped = line.strip()
+        if not stripped:
+            return True
+        if len(stripped) < min_length:
+            return True
+        if len(stripped) > max_length:
+            return True
+        for pattern in patterns:
+            if pattern.match(stripped):
+                return True
+        return False
+
+    return should_skip
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--lines", type=int, default=1_000_000)
+    parser.add_argument("--filters", help="rules file to benchmark instead")
+    args = parser.parse_args()
+
+    line_filter = LINE_FILTER
+    if args.filters:
+        line_filter = LineFilter.from_file(args.filters)
+    should_skip = legacy_filter(line_filter)
+    lines = make_corpus(args.lines)
+    songs = [lines[i : i + SONG_LINES] for i in range(0, len(lines), SONG_LINES)]
+
+    legacy, legacy_time = timed(
+        lambda: [line.strip() for line in lines if not should_skip(line)]
+    )
+    single, single_time = timed(
+        lambda: [line.strip() for line in lines if not line_filter.should_skip(line)]
+    )
+    line_filter.reset()
+    batch, batch_time = timed(
+        lambda: [line for song in songs for line in line_filter.clean_lines(song)]
+    )
+
+    print(f"Lines:            {len(lines)} ({len(songs)} songs)")
+    print(f"Identical:        {legacy == single == batch}")
+    print(f"Per-pattern loop: {legacy_time:.2f}s")
+    print(f"Compiled, single: {single_time:.2f}s ({legacy_time / single_time:.1f}x)")
+    print(f"Compiled, batch:  {batch_time:.2f}s ({legacy_time / batch_time:.1f}x)")
+    print(f"Hits:             {line_filter.summary()}")
+    if not legacy == single == batch:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
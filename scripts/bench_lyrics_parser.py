@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark the streaming lyrics parser against lyricsgenius' scraper.
+
+Runs both on the same recorded Genius song pages, checks that they return
+identical lyrics, and reports parse time and how much of each page the
+streaming parser had to read.
+
+Usage:
+    python scripts/bench_lyrics_parser.py [PAGES_DIR] [--repeat N]
+    python scripts/bench_lyrics_parser.py --record URL [URL ...]
+
+Pages are *.html files; --record downloads song pages into PAGES_DIR
+(default .cache/pages/) for later runs.
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+try:
+    import lyricsgenius
+    import requests
+except ImportError:
+    print("Error: lyricsgenius not installed. Run: pip install lyricsgenius")
+    sys.exit(1)
+
+from lyrics_parser import CHUNK_SIZE, LyricsPageParser, parse_lyrics_chunks
+
+DEFAULT_PAGES_DIR = Path(__file__).parent.parent / ".cache" / "pages"
+
+
+def scrape_with_lyricsgenius(genius, page):
+    """Lyrics as Genius.lyrics() extracts them from a page's HTML."""
+    genius._make_request = lambda path, **kwargs: {"html": page}
+    return genius.lyrics(song_url="https://genius.com/bench-lyrics")
+
+
+def chunked(page):
+    return [page[i : i + CHUNK_SIZE] for i in range(0, len(page), CHUNK_SIZE)]
+
+
+def bytes_read(page):
+    """Characters of a page the streaming parser reads before stopping."""
+    parser = LyricsPageParser()
+    read = 0
+    for chunk in chunked(page):
+        parser.feed(chunk)
+        read += len(chunk)
+        if parser.done:
+            break
+    return read
+
+
+def time_calls(func, pages, repeat):
+    """Best total time over `repeat` passes of func over every page."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for page in pages:
+            func(page)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def record(urls, pages_dir):
+    pages_dir.mkdir(parents=True, exist_ok=True)
+    for url in urls:
+        response = requests.get(url, timeout=30)
+        response.raise_for_status()
+        name = re.sub(r"[^\w-]+", "_", url.rstrip("/").rsplit("/", 1)[-1])
+        path = pages_dir / f"{name}.html"
+        path.write_text(response.text, encoding="utf-8")
+        print(f"Saved {path} ({len(response.text)} chars)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("pages_dir", nargs="?", type=Path, default=DEFAULT_PAGES_DIR)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--record", nargs="+", metavar="URL")
+    args = parser.parse_args()
+
+    if args.record:
+        record(args.record, args.pages_dir)
+        return
+
+    paths = sorted(args.pages_dir.glob("*.html"))
+    if not paths:
+        print(f"Error: No *.html pages in {args.pages_dir}")
+        sys.exit(1)
+    pages = [path.read_text(encoding="utf-8") for path in paths]
+
+    genius = lyricsgenius.Genius("benchmark")
+    genius.verbose = False
+    mismatches = 0
+    for path, page in zip(paths, pages):
+        expected = scrape_with_lyricsgenius(genius, page)
+        actual = parse_lyrics_chunks(chunked(page))
+        if actual != expected:
+            mismatches += 1
+            print(f"  MISMATCH {path.name}")
+
+    old = time_calls(lambda page: scrape_with_lyricsgenius(genius, page), pages, args.repeat)
+    new = time_calls(lambda page: parse_lyrics_chunks(chunked(page)), pages, args.repeat)
+    total = sum(len(page) for page in pages)
+    read = sum(bytes_read(page) for page in pages)
+
+    print(f"Pages:          {len(pages)} ({total / 1024:.0f} KB)")
+    print(f"Identical:      {len(pages) - mismatches} / {len(pages)}")
+    print(f"lyricsgenius:   {old * 1000 / len(pages):.2f} ms/page")
+    print(f"lyrics_parser:  {new * 1000 / len(pages):.2f} ms/page ({old / new:.1f}x)")
+    print(f"Page read:      {read / 1024:.0f} KB ({read / total:.0%})")
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
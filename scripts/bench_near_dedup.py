@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark the MinHash/LSH near-duplicate stage.
+
+Builds synthetic catalogs in which choruses come back with a word swapped,
+punctuation added or case changed, and times NearDuplicates over growing
+corpus sizes to show how it scales. On the first size it also runs the
+quadratic comparison against every kept quote and reports how many of its
+drops LSH found (recall). Every LSH drop is confirmed by the exact
+similarity, so LSH can only miss near-duplicates, not invent them.
+
+Usage:
+    python scripts/bench_near_dedup.py [--sizes N,N,...] [--threshold T]
+"""
+
+import argparse
+import random
+import time
+
+from near_dedup import DEFAULT_THRESHOLD, NearDuplicates, jaccard, shingles
+from quote_data import SongLines, windows
+
+SYLLABLES = "ka lo mi ne su ta ri vo el an or is um ba de fi go".split()
+
+
+def make_quotes(count, seed=0):
+    """About `count` quotes from songs that reuse and mutate choruses."""
+    rnd = random.Random(seed)
+    vocabulary = [
+        "".join(rnd.choice(SYLLABLES) for _ in range(rnd.randint(1, 3)))
+        for _ in range(5000)
+    ]
+
+    def line():
+        return " ".join(rnd.choice(vocabulary) for _ in range(rnd.randint(4, 12)))
+
+    def mutate(text):
+        words = text.split()
+        roll = rnd.random()
+        if roll < 0.4:
+            words[rnd.randrange(len(words))] = rnd.choice(vocabulary)
+        elif roll < 0.7:
+            words[-1] += rnd.choice("!?,.")
+        else:
+            words = [word.capitalize() for word in words]
+        return " ".join(words)
+
+    choruses = [[line() for _ in range(4)] for _ in range(count // 400 + 1)]
+    quotes = []
+    song = 0
+    while len(quotes) < count:
+        lines = []
+        while len(lines) < 40:
+            if rnd.random() < 0.2:
+                lines.extend(mutate(text) for text in rnd.choice(choruses))
+            else:
+                lines.append(line())
+        source = SongLines.make(f"Song {song}", "Artist", "Album", lines)
+        quotes.extend(windows(source))
+        song += 1
+    return quotes[:count]
+
+
+def brute_force(quotes, threshold):
+    """Indexes of the quotes the quadratic comparison drops."""
+    kept = []
+    dropped = set()
+    for index, quote in enumerate(quotes):
+        hashes = shingles(quote.text)
+        if any(jaccard(hashes, other) >= threshold for other in kept):
+            dropped.add(index)
+        else:
+            kept.append(hashes)
+    return dropped
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", default="5000,50000,100000,200000")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    for size in sizes:
+        quotes = make_quotes(size)
+        near_duplicates = NearDuplicates(args.threshold)
+        start = time.perf_counter()
+        kept = {id(quote) for quote in near_duplicates.filter(quotes)}
+        seconds = time.perf_counter() - start
+        print(
+            f"{size:>8} quotes: {seconds:6.1f}s "
+            f"({size / seconds / 1000:.1f}k quotes/s), "
+            f"{near_duplicates.summary()}"
+        )
+        if size == sizes[0]:
+            dropped = {i for i, quote in enumerate(quotes) if id(quote) not in kept}
+            start = time.perf_counter()
+            exact = brute_force(quotes, args.threshold)
+            seconds = time.perf_counter() - start
+            found = len(dropped & exact) / len(exact) if exact else 1.0
+            print(
+                f"{'':>8} quadratic: {seconds:6.1f}s, drops {len(exact)}; "
+                f"LSH found {found:.1%} of them"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""
+The sources fetch_lyrics.py crawls, and when each one is due for a refresh.
+
+The catalog is a JSON or TOML file; the default, catalog.json, is JSON so
+it loads on any Python (TOML needs 3.11+). In TOML:
+
+    refresh_days = 7  # Default refresh interval
+    order = "title"  # Default crawl order
+    primary_artist_ids = []  # Extra primary artists allowed in listings
+
+    [[artists]]
+    name = "Vegyn"  # Listing search name, also the shard name
+    id = 991444  # Genius artist ID
+    max_songs = 200  # Song cap per crawl (default: no cap)
+    priority = 5  # Higher is refreshed first (default: 0)
+    refresh_days = 3  # Overrides the default interval
+    order = "popularity"  # Overrides the default crawl order
+
+    [[collabs]]
+    term = "Headache PLZ Vegyn"  # Search term
+    match = ["headache", "vegyn"]  # Also accept hits whose primary artist
+                                   # name contains all of these
+    priority = 1
+    refresh_days = 7
+
+An artist's songs are downloaded in its crawl order, which is also the
+order of its quotes in the dataset, and a max_songs cap keeps the first
+songs in that order:
+
+    title       listing order, streamed page by page (Genius's title sort)
+    popularity  hot songs first, then by pageviews (from the listing stats)
+    new         songs not in the manifest of earlier runs first, then
+                by popularity
+
+The last two page through the artist's whole listing before downloading
+anything (one request per 50 songs), so a run cut short by --max-runtime
+or a cap has spent its requests on the songs that matter most.
+
+Songs from an artist listing are kept only if their primary artist is one
+of the catalog's artists (or in primary_artist_ids), which drops songs
+where an artist is just a producer or a feature.
+
+Schedule keeps, per source, when it was last refreshed and how many
+requests that took, and picks the sources to refresh in a run: those whose
+refresh interval has passed, highest priority first (most overdue first
+among equals), as long as their estimated requests fit the budget. A source
+with no history is always due and estimated at DEFAULT_REQUEST_ESTIMATE.
+"""
+
+import json
+import time
+from typing import NamedTuple
+
+from data_files import load_config, write_json
+
+DAY = 24 * 60 * 60
+
+DEFAULT_REFRESH_DAYS = 7
+DEFAULT_REQUEST_ESTIMATE = 500  # Requests assumed for a never-crawled source
+CRAWL_ORDERS = ("title", "popularity", "new")
+
+
+class Artist(NamedTuple):
+    name: str
+    id: int
+    max_songs: int = None
+    priority: int = 0
+    refresh_days: float = DEFAULT_REFRESH_DAYS
+    order: str = "title"  # One of CRAWL_ORDERS
+
+
+class Collab(NamedTuple):
+    term: str
+    match: tuple = ()  # Words a hit's primary artist name must all contain
+    priority: int = 0
+    refresh_days: float = DEFAULT_REFRESH_DAYS
+
+    @property
+    def name(self):
+        return self.term
+
+    def matches(self, artist_name):
+        """Whether a search hit by `artist_name` belongs to this collab."""
+        artist_name = artist_name.lower()
+        if self.term.lower() in artist_name:
+            return True
+        return bool(self.match) and all(
+            word.lower() in artist_name for word in self.match
+        )
+
+
+class Catalog:
+    """The artists and collab search terms to crawl, in crawl order."""
+
+    def __init__(self, artists, collabs=(), primary_artist_ids=()):
+        self.artists = tuple(artists)
+        self.collabs = tuple(collabs)
+        self.primary_artist_ids = frozenset(
+            [artist.id for artist in self.artists] + list(primary_artist_ids)
+        )
+        for artist in self.artists:
+            if artist.order not in CRAWL_ORDERS:
+                raise ValueError(
+                    f"unknown crawl order {artist.order!r} for {artist.name}"
+                )
+        names = [source.name.lower() for source in self.sources]
+        if len(set(names)) != len(names):
+            raise ValueError("catalog source names must be unique")
+
+    @classmethod
+    def from_file(cls, path):
+        """Load a catalog from a .json or .toml file."""
+        config = load_config(path)
+        refresh_days = config.get("refresh_days", DEFAULT_REFRESH_DAYS)
+        order = config.get("order", "title")
+        artists = [
+            Artist(
+                entry["name"],
+                entry["id"],
+                entry.get("max_songs"),
+                entry.get("priority", 0),
+                entry.get("refresh_days", refresh_days),
+                entry.get("order", order),
+            )
+            for entry in config.get("artists", [])
+        ]
+        collabs = [
+            Collab(
+                entry["term"],
+                tuple(entry.get("match", ())),
+                entry.get("priority", 0),
+                entry.get("refresh_days", refresh_days),
+            )
+            for entry in config.get("collabs", [])
+        ]
+        return cls(artists, collabs, config.get("primary_artist_ids", ()))
+
+    def with_order(self, order):
+        """This catalog with every artist crawled in `order`."""
+        artists = [artist._replace(order=order) for artist in self.artists]
+        return Catalog(artists, self.collabs, self.primary_artist_ids)
+
+    @property
+    def sources(self):
+        """Artists, then collabs."""
+        return self.artists + self.collabs
+
+
+class Schedule:
+    """When each source was last refreshed, and what that cost, on disk."""
+
+    def __init__(self, path=None):
+        self.path = path
+        self.entries = {}  # Source name -> {"refreshed": time, "requests": N}
+        if path is not None and path.exists():
+            data = json.loads(path.read_text(encoding="utf-8"))
+            self.entries = data["sources"]
+
+    def save(self):
+        if self.path is None:
+            return
+        data = {"sources": dict(sorted(self.entries.items()))}
+        write_json(self.path, data, indent=2)
+
+    def record(self, name, requests, now=None):
+        """Note that source `name` was refreshed with `requests` requests."""
+        refreshed = time.time() if now is None else now
+        self.entries[name] = {"refreshed": refreshed, "requests": requests}
+
+    def estimate(self, name):
+        """Requests a refresh of source `name` is expected to take."""
+        entry = self.entries.get(name)
+        return DEFAULT_REQUEST_ESTIMATE if entry is None else entry["requests"]
+
+    def overdue(self, source, now=None):
+        """Seconds since `source` became due, or None if it isn't due."""
+        now = time.time() if now is None else now
+        entry = self.entries.get(source.name)
+        if entry is None:
+            return float("inf")
+        overdue = now - entry["refreshed"] - source.refresh_days * DAY
+        return overdue if overdue >= 0 else None
+
+    def pick(self, sources, budget=None, now=None):
+        """The due sources to refresh within `budget` requests, in the order
+        they were considered (highest priority, then most overdue first).
+
+        Sources whose estimate doesn't fit what is left of the budget are
+        passed over for cheaper ones. If none fits, the first is picked
+        alone, so that every run makes progress.
+        """
+        due = []
+        for source in sources:
+            overdue = self.overdue(source, now)
+            if overdue is not None:
+                due.append((-source.priority, -overdue, source))
+        due.sort(key=lambda item: item[:2])
+        if budget is None:
+            return [source for _, _, source in due]
+        picked = []
+        left = budget
+        for _, _, source in due:
+            cost = self.estimate(source.name)
+            if cost <= left:
+                picked.append(source)
+                left -= cost
+        if due and not picked:
+            picked.append(due[0][2])
+        return picked
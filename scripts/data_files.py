@@ -0,0 +1,37 @@
+"""
+Config files read and state files written by fetch_lyrics.py and friends.
+
+Config files (the catalog, line filter rules) are JSON or TOML; TOML needs
+tomllib, so Python 3.11+. State files (manifest, failed songs, albums,
+schedule, fixtures) are JSON, written next to their target and renamed
+over it, so an interrupted run never leaves a truncated file behind.
+"""
+
+import json
+from pathlib import Path
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    tomllib = None
+
+
+def load_config(path):
+    """Parse a .json or .toml config file."""
+    path = Path(path)
+    if path.suffix == ".toml":
+        if tomllib is None:
+            raise RuntimeError(f"{path.name}: TOML files need Python 3.11+")
+        return tomllib.loads(path.read_text(encoding="utf-8"))
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def write_json(path, data, indent=None):
+    """Atomically write `data` to `path` as JSON."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(
+        json.dumps(data, indent=indent, ensure_ascii=False), encoding="utf-8"
+    )
+    tmp_path.replace(path)
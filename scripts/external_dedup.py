@@ -0,0 +1,189 @@
+"""
+Sort-based quote dedup on disk, for catalogs whose keys don't fit in memory.
+
+deduplicate_quotes() in fetch_lyrics.py keeps a set of every digest it has
+seen. ExternalDedup keeps at most `run_size` of them instead:
+
+1. Quotes are spilled to a temporary file in arrival order, and each one's
+   (digest, position) key is buffered; every `run_size` keys are sorted and
+   written out as a run file of fixed 16-byte records.
+2. The runs are merged with a heap (heapq.merge), MERGE_FAN_IN files at a
+   time, in as many passes as it takes. In the merged order the first key
+   of each digest is the earliest quote with that text, which is marked in
+   a bitmap of positions (one bit per quote).
+3. The spilled quotes are replayed in order and the marked ones yielded.
+
+So the output is the same as the in-memory dedup with the same digests,
+first occurrence kept and order preserved, but nothing is yielded until the
+input is exhausted. Stdlib only.
+"""
+
+import heapq
+import itertools
+import json
+import tempfile
+from pathlib import Path
+
+from quote_data import Quote, SongLines
+
+DEFAULT_RUN_SIZE = 1_000_000  # Keys sorted in memory at once (~50 MB)
+MERGE_FAN_IN = 64  # Run files merged at once
+READ_SIZE = 64 * 1024  # Bytes per run file read (a multiple of KEY_SIZE)
+KEY_SIZE = 16  # 8-byte digest, 8-byte position
+WRITE_BATCH = 4096  # Keys per write while merging
+
+_POSITION_BITS = 64
+_POSITION_MASK = (1 << _POSITION_BITS) - 1
+
+
+def make_key(digest, position):
+    """Run file key: sorts by digest, then position."""
+    return digest << _POSITION_BITS | position
+
+
+def split_key(key):
+    """(digest, position) of a run file key."""
+    return key >> _POSITION_BITS, key & _POSITION_MASK
+
+
+def write_run(path, keys):
+    """Write sorted keys to `path` as fixed-size big-endian records."""
+    with open(path, "wb") as f:
+        for start in range(0, len(keys), WRITE_BATCH):
+            batch = keys[start : start + WRITE_BATCH]
+            f.write(b"".join(key.to_bytes(KEY_SIZE, "big") for key in batch))
+    return path
+
+
+def read_run(path):
+    """Yield the keys of a run file in order."""
+    with open(path, "rb") as f:
+        while chunk := f.read(READ_SIZE):
+            for offset in range(0, len(chunk), KEY_SIZE):
+                yield int.from_bytes(chunk[offset : offset + KEY_SIZE], "big")
+
+
+class _QuoteSpill:
+    """Quotes written to a JSON-lines file and read back in order.
+
+    A song's lines are written once, as an object, before its first
+    quote; each quote is a [start, length] line referring to them.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "w", encoding="utf-8")
+        self._source = None
+
+    def write(self, quote):
+        if quote.source is not self._source:
+            self._source = quote.source
+            song = quote.source._asdict()
+            song["lines"] = list(song["lines"])
+            self._file.write(json.dumps(song, ensure_ascii=False) + "\n")
+        self._file.write(f"[{quote.start},{quote.length}]\n")
+
+    def close(self):
+        self._file.close()
+
+    def __iter__(self):
+        source = None
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                item = json.loads(line)
+                if isinstance(item, dict):
+                    source = SongLines.make(**item)
+                else:
+                    yield Quote(source, *item)
+
+
+class ExternalDedup:
+    """Drops quotes whose digest was seen before, using sorted runs on disk.
+
+    `digest` maps a quote's text to a 64-bit int (fetch_lyrics.quote_digest).
+    Temporary files go in a directory under `tmp_dir` (default: the system
+    temp dir) and are removed when filter() finishes or is closed.
+    """
+
+    def __init__(self, digest, run_size=DEFAULT_RUN_SIZE, tmp_dir=None):
+        if run_size < 1:
+            raise ValueError("run_size must be at least 1")
+        self.digest = digest
+        self.run_size = run_size
+        self.tmp_dir = tmp_dir
+        self.quotes = 0
+        self.kept = 0
+        self.runs = 0
+        self.merge_passes = 0
+
+    def filter(self, quotes):
+        """Yield the first quote of each digest, in arrival order."""
+        if self.tmp_dir:
+            Path(self.tmp_dir).mkdir(parents=True, exist_ok=True)
+        with tempfile.TemporaryDirectory(prefix="dedup-", dir=self.tmp_dir) as tmp:
+            tmp = Path(tmp)
+            spill = _QuoteSpill(tmp / "quotes.jsonl")
+            try:
+                runs = self._spill(quotes, spill, tmp)
+            finally:
+                spill.close()
+            keep = self._first_positions(runs, tmp)
+            for position, quote in enumerate(spill):
+                if keep[position >> 3] >> (position & 7) & 1:
+                    self.kept += 1
+                    yield quote
+
+    def _spill(self, quotes, spill, tmp):
+        runs = []
+        keys = []
+        digest = self.digest
+        for position, quote in enumerate(quotes):
+            spill.write(quote)
+            keys.append(make_key(digest(quote.text), position))
+            if len(keys) >= self.run_size:
+                keys.sort()
+                runs.append(write_run(tmp / f"run-{len(runs)}", keys))
+                keys = []
+            self.quotes = position + 1
+        if keys:
+            keys.sort()
+            runs.append(write_run(tmp / f"run-{len(runs)}", keys))
+        self.runs = len(runs)
+        return runs
+
+    def _merge(self, runs, tmp):
+        """All keys in order, merging down to MERGE_FAN_IN runs first."""
+        names = itertools.count(len(runs))
+        while len(runs) > MERGE_FAN_IN:
+            self.merge_passes += 1
+            merged = []
+            for start in range(0, len(runs), MERGE_FAN_IN):
+                group = runs[start : start + MERGE_FAN_IN]
+                path = tmp / f"run-{next(names)}"
+                with open(path, "wb") as f:
+                    keys = heapq.merge(*map(read_run, group))
+                    while batch := list(itertools.islice(keys, WRITE_BATCH)):
+                        f.write(b"".join(k.to_bytes(KEY_SIZE, "big") for k in batch))
+                for run in group:
+                    run.unlink()
+                merged.append(path)
+            runs = merged
+        self.merge_passes += 1
+        return heapq.merge(*map(read_run, runs))
+
+    def _first_positions(self, runs, tmp):
+        """Bitmap of the positions that hold the first quote of a digest."""
+        keep = bytearray((self.quotes + 7) // 8)
+        previous = None
+        for key in self._merge(runs, tmp):
+            digest, position = split_key(key)
+            if digest != previous:
+                previous = digest
+                keep[position >> 3] |= 1 << (position & 7)
+        return keep
+
+    def summary(self):
+        return (
+            f"{self.quotes} quotes, {self.kept} kept, {self.runs} sorted runs "
+            f"of up to {self.run_size} keys, {self.merge_passes} merge passes"
+        )
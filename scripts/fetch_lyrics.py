@@ -1,71 +1,159 @@
 #!/usr/bin/env python3
 """
-Fetch lyrics from Genius for Headache, Vegyn, and Headache PLZ & Vegyn,
-then extract individual lines/couplets and save as quotes.json.
+Fetch lyrics from Genius for the artists and collab search terms in
+catalog.json (Headache, Vegyn, and Headache PLZ & Vegyn), then extract
+individual lines/couplets and save as quotes.json.
 
 Usage:
     export GENIUS_API_TOKEN="your_token_here"
-    python scripts/fetch_lyrics.py
+    python scripts/fetch_lyrics.py [--concurrency N] [--cache PATH | --no-cache]
+                                   [--incremental [--manifest PATH]]
+                                   [--max-runtime SECONDS] [--restart]
+                                   [--queue-size N] [--workers N] [--verify-dedup]
+                                   [--external-dedup [--dedup-run-size N]]
+                                   [--near-duplicates [THRESHOLD]]
+                                   [--near-duplicates-report PATH]
+                                   [--filters PATH] [--quote-lines N]
+                                   [--quote-length CHARS] [--output PATH]
+                                   [--genius-url URL] [--record DIR]
+                                   [--state-dir DIR]
+                                   [--catalog PATH] [--crawl-order ORDER]
+                                   [--shards [NAME ...] [--shard-processes N]]
+                                   [--schedule [--request-budget N]]
+
+An interrupted or time-boxed run leaves a checkpoint behind; running the
+script again resumes from the songs it already completed.
+
+--shards builds each artist and collab search term as a separate shard, in
+parallel processes, and merges the shards into the dataset; naming shards
+rebuilds only those and reuses the others (see shards.py). With --schedule,
+the shards rebuilt are those due for a refresh, by priority, within a
+request budget (see catalog.py).
+
+--record and --genius-url record and replay Genius responses offline; see
+genius_standin.py.
+
+Local state (cache, manifest, checkpoint, failed songs, albums, shards)
+lives in .cache. Runs against --genius-url or with another --output keep
+theirs in a directory of their own under .cache/runs instead, so they
+never touch the real dataset's state; --state-dir picks one explicitly.
 
 Get a token at: https://genius.com/api-clients
 """
 
+import argparse
+import asyncio
+import collections
+import contextlib
+import hashlib
+import itertools
 import json
+import multiprocessing
 import os
 import re
 import sys
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
 try:
     import lyricsgenius
+    from lyricsgenius.types import Song
 except ImportError:
     print("Error: lyricsgenius not installed. Run: pip install lyricsgenius")
     sys.exit(1)
 
+from catalog import CRAWL_ORDERS, Catalog, Schedule
+from data_files import write_json
+from genius_cache import DEFAULT_MAX_BYTES, GeniusCache
+from genius_http import CircuitBreaker, RateController, RateLimitedAdapter
+from external_dedup import DEFAULT_RUN_SIZE, ExternalDedup
+from genius_standin import FixtureRecorder
+from line_filter import LineFilter
+from lyrics_parser import read_lyrics_page
+from near_dedup import DEFAULT_THRESHOLD, NearDuplicates
+from quote_data import (
+    DEFAULT_ALBUM,
+    SongLines,
+    count_windows,
+    read_quotes,
+    windows,
+    write_quotes,
+)
+from shards import Shard, merged_quotes, write_shard
+from stage_queue import AsyncStageQueue, QueueStats, ThreadStageQueue
 
-# Artist configurations: (search name, genius artist ID, max_songs)
-ARTISTS = [
-    ("Headache (PLZ)", 3551967, None),  # Small catalog — fetch all
-    ("Vegyn", 991444, 200),  # Large catalog — cap to avoid timeout
-]
-
-# Artists whose songs we want (by Genius artist ID).
-# Used to filter out songs where Vegyn is just a producer/feature.
-ALLOWED_PRIMARY_ARTIST_IDS = {
-    3551967,  # Headache (PLZ)
-    991444,  # Vegyn
-}
-
-# Additional search terms for collaborative projects
-COLLAB_SEARCH_TERMS = [
-    "Headache PLZ Vegyn",
-]
 
-# Section headers to strip from lyrics
-SECTION_HEADER_RE = re.compile(
-    r"^\[.*?\]$"  # e.g. [Chorus], [Verse 1], [Bridge]
-)
+# Artists and collab search terms to crawl; --catalog loads another file
+CATALOG_PATH = Path(__file__).parent / "catalog.json"
 
-# Lines to skip
-SKIP_PATTERNS = [
-    re.compile(r"^\d+\s*Contributors?", re.IGNORECASE),
-    re.compile(r"^You might also like", re.IGNORECASE),
-    re.compile(r"^See .* Live", re.IGNORECASE),
-    re.compile(r"^Get tickets", re.IGNORECASE),
-    re.compile(r"Embed$", re.IGNORECASE),
-    re.compile(r"^\d+Embed$", re.IGNORECASE),
-    re.compile(r"^Translations", re.IGNORECASE),
-    re.compile(r".*Lyrics$"),  # Title line like "Song TitleLyrics"
+# Lines to skip: (rule name, pattern, ignore case), matched in order at the
+# start of each line. --filters loads replacement rules from a file.
+SKIP_RULES = [
+    ("section header", r"^\[.*?\]$", False),  # e.g. [Chorus], [Verse 1], [Bridge]
+    ("contributors", r"^\d+\s*Contributors?", True),
+    ("you might also like", r"^You might also like", True),
+    ("see live", r"^See .* Live", True),
+    ("get tickets", r"^Get tickets", True),
+    ("embed", r"Embed$", True),
+    ("numbered embed", r"^\d+Embed$", True),
+    ("translations", r"^Translations", True),
+    ("title line", r".*Lyrics$", False),  # Title line like "Song TitleLyrics"
 ]
 
 MIN_LINE_LENGTH = 10  # Skip very short lines
 MAX_LINE_LENGTH = 200  # Skip absurdly long lines (probably parsing errors)
 
+LINE_FILTER = LineFilter(SKIP_RULES, MIN_LINE_LENGTH, MAX_LINE_LENGTH)
+
+QUOTE_LINES = 2  # Longest quote, in consecutive lines (2: couplets)
+
+DEFAULT_CONCURRENCY = 1  # Song/lyrics requests kept in flight at once
+DEFAULT_QUEUE_SIZE = 32  # Songs each pipeline queue may hold
+SOURCES_AHEAD = 1  # Sources listing ahead of the one being consumed
+EXTRACT_CHUNK_SIZE = 64  # Songs per task with --workers
+NEAR_DUPLICATE_EXAMPLES = 3  # Clusters (and quotes of each) shown in the summary
+LISTING_PAGE_SIZE = 50  # Max page size of the artist songs endpoint
+ALBUM_TRACKS_TTL = 7 * 24 * 60 * 60  # Seconds before a tracklist is refetched
+DEFAULT_SHARD_PROCESSES = 4  # Shards built at once with --shards
+
+OUTPUT_PATH = Path(__file__).parent.parent / "data" / "quotes.js"
+
+# Local state (HTTP/lyrics cache, manifest) lives here, outside version control
+CACHE_DIR = Path(__file__).parent.parent / ".cache"
+RUNS_DIR = CACHE_DIR / "runs"  # State of stand-in and other-output runs
+
+# Files and directories in the state dir
+CACHE_FILE = "genius.sqlite"
+MANIFEST_FILE = "manifest.json"
+CHECKPOINT_FILE = "checkpoint.jsonl"
+ALBUMS_FILE = "albums.json"
+DEDUP_DIR = "dedup"  # Run files of --external-dedup
+FAILED_FILE = "failed.json"
+SHARD_DIR = "shards"  # Shard files of --shards
+SCHEDULE_FILE = "schedule.json"  # Shard refresh history
+
+# Song fields kept in checkpoints (everything downstream code reads)
+CHECKPOINT_SONG_FIELDS = ("id", "title", "url", "path", "lyrics_state", "album")
 
-def get_genius_client():
-    """Initialize the Genius API client."""
+
+def get_genius_client(
+    controller,
+    concurrency=DEFAULT_CONCURRENCY,
+    cache=None,
+    breaker=None,
+    base_url=None,
+    recorder=None,
+):
+    """Initialize the Genius API client, paced by a shared rate controller.
+
+    `base_url` points it at a genius_standin.py server instead of Genius,
+    and `recorder` saves every response as a fixture for that server.
+    """
     token = os.environ.get("GENIUS_API_TOKEN")
+    if not token and base_url:
+        token = "standin"  # The stand-in doesn't check it
     if not token:
         print("Error: GENIUS_API_TOKEN environment variable not set.")
         print("Get a token at: https://genius.com/api-clients")
@@ -74,7 +162,8 @@ def get_genius_client():
     genius = lyricsgenius.Genius(
         token,
         timeout=30,
-        retries=3,
+        sleep_time=0,  # Pacing is done by the rate controller
+        retries=0,  # Retries are done by the adapter, per request class
         remove_section_headers=False,  # We'll handle this ourselves
         skip_non_songs=True,
         excluded_terms=[
@@ -87,63 +176,438 @@ def get_genius_client():
         ],
     )
     genius.verbose = True
+
+    # One pooled connection per in-flight request
+    adapter = RateLimitedAdapter(
+        controller,
+        cache=cache,
+        breaker=breaker,
+        base_url=base_url,
+        recorder=recorder,
+        pool_connections=2,
+        pool_maxsize=max(concurrency, 10),
+    )
+    genius._session.mount("https://", adapter)
     return genius
 
 
-def fetch_artist_songs(genius, artist_name, artist_id, max_songs=None):
-    """Fetch all songs for a given artist, filtering to primary artist only."""
-    print(f"\n{'=' * 60}")
-    print(f"Fetching songs for: {artist_name} (ID: {artist_id})")
-    if max_songs:
-        print(f"  (limited to {max_songs} songs)")
-    print(f"{'=' * 60}")
+class AlbumResolver:
+    """Album of each song, looked up once per album and remembered on disk.
+
+    Listings and search hits don't say which album a song is on, and the
+    full song payload costs a request per song. Instead, each artist's album
+    list is paged through once per run (it names every album), and each
+    album's tracklist is fetched once per ALBUM_TRACKS_TTL (it maps its
+    songs to the album; albums fill in after their first singles). Both are
+    kept in `path` so later runs only fetch tracklists of new or stale albums.
+
+    If an artist's albums can't be loaded, album_for() falls back to each
+    of its songs' full payload, which names the album, so they are neither
+    written out as singles nor dropped from the dataset.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.names = {}  # album ID -> name
+        self.tracks = {}  # album ID -> song IDs, persisted
+        self.fetched = {}  # album ID -> when its tracks were fetched, persisted
+        self.song_albums = {}  # song ID -> album ID, for artists loaded this run
+        self._artists = {}  # artist ID -> loading task
+        if path is not None and path.exists():
+            data = json.loads(path.read_text(encoding="utf-8"))
+            self.names = {int(k): v for k, v in data["names"].items()}
+            self.tracks = {int(k): v for k, v in data["tracks"].items()}
+            fetched = data.get("fetched", {})  # Files from before the TTL: stale
+            self.fetched = {int(k): v for k, v in fetched.items()}
+
+    def save(self):
+        if self.path is None:
+            return
+        data = {
+            "names": {str(k): v for k, v in sorted(self.names.items())},
+            "tracks": {str(k): v for k, v in sorted(self.tracks.items())},
+            "fetched": {str(k): v for k, v in sorted(self.fetched.items())},
+        }
+        write_json(self.path, data)
+
+    async def album_for(self, ctx, song_info):
+        """{"id", "name"} of the song's album, or None for singles."""
+        album = song_info.get("album")
+        if isinstance(album, dict) and album.get("name"):
+            return album
+
+        artist_id = song_info.get("primary_artist", {}).get("id")
+        if artist_id is None:
+            return None
+        task = self._artists.get(artist_id)
+        if task is None:
+            task = asyncio.ensure_future(self._load_artist(ctx, artist_id))
+            self._artists[artist_id] = task
+        try:
+            await task
+        except Exception:
+            # Already reported by _load_artist; costs a request per song
+            full_info = await ctx.run(ctx.genius.song, song_info["id"])
+            album = full_info["song"].get("album")
+            if isinstance(album, dict) and album.get("name"):
+                return {"id": album.get("id"), "name": album["name"]}
+            return None
+
+        album_id = self.song_albums.get(song_info["id"])
+        if album_id is None:
+            return None
+        return {"id": album_id, "name": self.names[album_id]}
 
+    async def _load_artist(self, ctx, artist_id):
+        try:
+            album_ids = []
+            page = 1
+            while page:
+                response = await ctx.run(
+                    ctx.genius.artist_albums,
+                    artist_id,
+                    per_page=LISTING_PAGE_SIZE,
+                    page=page,
+                )
+                for album in response["albums"]:
+                    self.names[album["id"]] = album["name"]
+                    album_ids.append(album["id"])
+                page = response.get("next_page")
+
+            stale_before = time.time() - ALBUM_TRACKS_TTL
+            await asyncio.gather(
+                *(
+                    self._load_tracks(ctx, album_id)
+                    for album_id in album_ids
+                    if album_id not in self.tracks
+                    or self.fetched.get(album_id, 0) < stale_before
+                )
+            )
+        except Exception as e:
+            ctx.log(
+                f"  Error loading albums of artist {artist_id}: {e}; "
+                "looking up each song's album instead"
+            )
+            raise
+
+        # A song on several albums (e.g. a single and the LP) keeps the first
+        for album_id in album_ids:
+            for song_id in self.tracks.get(album_id, []):
+                self.song_albums.setdefault(song_id, album_id)
+
+    async def _load_tracks(self, ctx, album_id):
+        song_ids = []
+        page = 1
+        while page:
+            response = await ctx.run(
+                ctx.genius.album_tracks,
+                album_id,
+                per_page=LISTING_PAGE_SIZE,
+                page=page,
+            )
+            song_ids.extend(track["song"]["id"] for track in response["tracks"])
+            page = response.get("next_page")
+        self.tracks[album_id] = song_ids
+        self.fetched[album_id] = time.time()
+
+
+class SongRegistry:
+    """Every song download of a crawl, keyed by Genius song ID.
+
+    Artist listings and collab searches often turn up the same song. The
+    first source to ask for an ID starts its download; any later source
+    asking for that ID, whether the download is still in flight or already
+    done, awaits the same task instead of issuing its own requests.
+
+    Once the crawl has handed a song on, release() drops it, so finished
+    songs aren't kept for the whole crawl; later requests for its ID then
+    resolve to None, as the song is already in the output.
+    """
+
+    def __init__(self):
+        self._tasks = {}  # song ID -> task, or None once released
+        self.coalesced = 0  # Requests answered by another source's download
+
+    def fetch(self, ctx, song_id, song_info=None):
+        """Task resolving to the Song for this ID (or None on failure)."""
+        if song_id not in self._tasks:
+            task = asyncio.ensure_future(fetch_song(ctx, song_id, song_info))
+            self._tasks[song_id] = task
+            return task
+        self.coalesced += 1
+        task = self._tasks[song_id]
+        if task is None:
+            task = asyncio.get_running_loop().create_future()
+            task.set_result(None)
+        return task
+
+    def release(self, song_id):
+        """Forget a finished song that has been passed downstream."""
+        self._tasks[song_id] = None
+
+    def released(self, song_id):
+        """Whether this song has already been passed downstream."""
+        return song_id in self._tasks and self._tasks[song_id] is None
+
+
+class FetchContext:
+    """Shared state for one crawl: the Genius client, request slots and cache.
+
+    Songs whose IDs are in `known_ids` are listed but never downloaded; every
+    song looked at during the crawl is recorded in `processed` (ID -> title).
+    `previous_ids` are the songs of earlier runs, which the "new" crawl
+    order puts last.
+    Songs in `checkpoint` are replayed from it instead of downloaded, and no
+    new download starts once `deadline` (a time.monotonic() value) passes.
+    Songs in `retry_queue` (ID -> song info) failed in an earlier run and are
+    downloaded first; songs that fail in this run end up in `failed`, and
+    sources whose listing failed in `source_errors`.
+
+    Each source may run at most `queue_size` downloads ahead of the songs
+    the output stage has taken, and at most `queue_size` finished songs wait
+    for the output stage; `download_stats` and `song_stats` show which side
+    of each of those queues was held up.
+
+    The crawl reports progress through log(), not print(): stream_songs
+    passes those lines to the main thread along with the songs, so they
+    don't run into the extraction progress printed there.
+
+    The crawl covers the sources of `catalog` (default: catalog.json).
+    """
+
+    def __init__(
+        self,
+        genius,
+        concurrency,
+        cache=None,
+        known_ids=frozenset(),
+        checkpoint=None,
+        deadline=None,
+        albums=None,
+        retry_queue=None,
+        queue_size=DEFAULT_QUEUE_SIZE,
+        catalog=None,
+        previous_ids=frozenset(),
+    ):
+        self.genius = genius
+        self.concurrency = concurrency
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.cache = cache
+        self.known_ids = known_ids
+        self.checkpoint = checkpoint
+        self.deadline = deadline
+        self.interrupted = False  # Set when the deadline cut the crawl short
+        self.processed = {}
+        self.registry = SongRegistry()
+        self.albums = albums if albums is not None else AlbumResolver()
+        self.retry_queue = retry_queue or {}
+        self.failed = {}
+        self.source_errors = []
+        self.queue_size = queue_size
+        if catalog is None:
+            catalog = Catalog.from_file(CATALOG_PATH)
+        self.catalog = catalog
+        self.previous_ids = previous_ids
+        self.messages = []  # Lines logged since the crawl last yielded a song
+        self.download_stats = QueueStats(
+            "listing -> downloads", "listing", "downloads", queue_size
+        )
+        self.song_stats = QueueStats(
+            "downloads -> extraction", "downloads", "extraction", queue_size
+        )
+
+    def log(self, message=""):
+        """Queue a line of crawl output for the main thread to print."""
+        self.messages.append(message)
+
+    async def run(self, func, *args, **kwargs):
+        """Run a blocking Genius call in a worker thread, in a request slot."""
+        async with self.semaphore:
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+
+async def fetch_lyrics(ctx, song_id, song_url):
+    """Lyrics for a song, from the cache when possible.
+
+    The page is streamed through lyrics_parser instead of Genius.lyrics(),
+    so only the part of it up to the end of the lyrics is downloaded.
+    """
+    lyrics = ctx.cache.get_lyrics(song_id) if ctx.cache else None
+    if lyrics is None:
+        lyrics = await ctx.run(
+            read_lyrics_page, ctx.genius._session, song_url, ctx.genius.timeout
+        )
+        if ctx.cache:
+            ctx.cache.put_lyrics(song_id, song_url, lyrics)
+    return lyrics
+
+
+async def fetch_song(ctx, song_id, song_info=None):
+    """Download a song's lyrics by Genius song ID.
+
+    `song_info` is the song's entry from an artist listing or a search hit,
+    if we have one. Its URL is all the lyrics download needs, and the album
+    comes from ctx.albums, so the full song payload is only requested when
+    we start from a bare ID.
+    """
+    if ctx.checkpoint is not None and song_id in ctx.checkpoint:
+        song = ctx.checkpoint.song(song_id)
+        ctx.processed[song_id] = song.title
+        return song
+    if ctx.deadline is not None and time.monotonic() >= ctx.deadline:
+        ctx.interrupted = True
+        return None
+
+    song_info = dict(song_info or {})
     try:
-        artist = genius.search_artist(
-            artist_name,
-            artist_id=artist_id,
-            max_songs=max_songs,
-            sort="title",
-            get_full_info=True,
+        if not song_info.get("url"):
+            full_info = await ctx.run(ctx.genius.song, song_id)
+            song_info.update(full_info["song"])
+        lyrics, album = await asyncio.gather(
+            fetch_lyrics(ctx, song_id, song_info["url"]),
+            ctx.albums.album_for(ctx, song_info),
         )
-        if artist and artist.songs:
-            # Filter to only songs where this artist is the primary artist
-            filtered = []
-            for song in artist.songs:
-                primary_id = None
-                if hasattr(song, "_body"):
-                    primary_id = song._body.get("primary_artist", {}).get("id")
-                if primary_id is None or primary_id in ALLOWED_PRIMARY_ARTIST_IDS:
-                    filtered.append(song)
-                else:
-                    print(
-                        f"  Skipping (not primary): {song.title} "
-                        f"(primary artist ID: {primary_id})"
-                    )
-            print(
-                f"Found {len(filtered)} songs for {artist_name} "
-                f"(filtered from {len(artist.songs)})"
-            )
-            return filtered
+    except Exception as e:
+        ctx.log(f"  Error fetching song {song_id}: {e}")
+        ctx.failed[song_id] = slim_song_body(song_info)
+        return None
+    song_info["album"] = album
+    ctx.processed[song_id] = song_info["title"]
+    song = Song(lyrics=lyrics if lyrics is not None else "", body=song_info)
+    if ctx.checkpoint is not None:
+        ctx.checkpoint.record(song)
+    return song
+
+
+def song_popularity(song_info):
+    """(hot, pageviews) of a song, from its listing stats."""
+    stats = song_info.get("stats") or {}
+    return bool(stats.get("hot")), stats.get("pageviews") or 0
+
+
+async def list_artist_songs(ctx, artist_id, max_songs=None, order="title"):
+    """Phase one of an artist crawl: page through the artist's song listing.
+
+    Only listing metadata is requested here. Songs that are not lyrics
+    (lyrics state, `excluded_terms`) or whose primary artist is not one of
+    the catalog's primary artists are dropped before anything is downloaded.
+    Yields the remaining song infos, at most `max_songs` of them, in crawl
+    `order` (see catalog.py): in title order as each page arrives, or once
+    the whole listing is in, most popular first, after songs new since
+    `ctx.previous_ids` for "new".
+    """
+    if order != "title":
+        songs = [song_info async for song_info in list_artist_songs(ctx, artist_id)]
+        if order == "new":
+            previous_ids = ctx.previous_ids
+
+            def priority(song_info):
+                is_new = song_info["id"] not in previous_ids
+                return is_new, song_popularity(song_info)
+
         else:
-            print(f"No songs found for {artist_name}")
-            return []
+            priority = song_popularity
+        songs.sort(key=priority, reverse=True)
+        for song_info in songs[:max_songs]:
+            yield song_info
+        return
+
+    genius = ctx.genius
+    primary_ids = ctx.catalog.primary_artist_ids
+    seen_ids = set()
+    page = 1
+    while page:
+        songs_on_page = await ctx.run(
+            genius.artist_songs,
+            artist_id,
+            per_page=LISTING_PAGE_SIZE,
+            page=page,
+            sort="title",
+        )
+        for song_info in songs_on_page["songs"]:
+            if song_info["id"] in seen_ids:
+                continue
+            if genius.skip_non_songs and not genius._result_is_lyrics(song_info):
+                continue
+            primary_id = song_info.get("primary_artist", {}).get("id")
+            if primary_id is not None and primary_id not in primary_ids:
+                ctx.log(
+                    f"  Skipping (not primary): {song_info['title']} "
+                    f"(primary artist ID: {primary_id})"
+                )
+                continue
+            seen_ids.add(song_info["id"])
+            yield song_info
+            if max_songs is not None and len(seen_ids) >= max_songs:
+                return
+        page = songs_on_page.get("next_page")
+
+
+async def fetch_artist_songs(
+    ctx, channel, artist_name, artist_id, max_songs=None, order="title"
+):
+    """Fetch all songs for a given artist, filtering to primary artist only.
+
+    Each song's download task is put on `channel` as soon as it is listed,
+    in crawl `order`, followed by None once the listing is done. Returns the
+    number of songs listed, or None if the listing failed.
+    """
+    ctx.log(f"\n{'=' * 60}")
+    ctx.log(f"Fetching songs for: {artist_name} (ID: {artist_id})")
+    if max_songs:
+        ctx.log(f"  (limited to {max_songs} songs, by {order})")
+    ctx.log(f"{'=' * 60}")
+
+    # Phase two: download lyrics for the songs that passed the listing
+    # filters, starting each one while later pages are still being listed.
+    listed = 0
+    try:
+        async for song_info in list_artist_songs(ctx, artist_id, max_songs, order):
+            listed += 1
+            if song_info["id"] not in ctx.known_ids:
+                await channel.put(ctx.registry.fetch(ctx, song_info["id"], song_info))
     except Exception as e:
-        print(f"Error fetching {artist_name}: {e}")
-        return []
+        ctx.log(f"Error fetching {artist_name}: {e}")
+        ctx.source_errors.append(artist_name)
+        return None
+    finally:
+        await channel.put(None)
+    return listed
 
 
-def fetch_collab_songs(genius, search_term):
-    """Search for collaborative songs by search term."""
-    print(f"\n{'=' * 60}")
-    print(f"Searching for collaborative songs: {search_term}")
-    print(f"{'=' * 60}")
+async def fetch_collab_song(ctx, song_info):
+    """Fetch a single collab search hit by its song ID."""
+    song_id = song_info["id"]
+    genius = ctx.genius
+    if genius.skip_non_songs and not genius._result_is_lyrics(song_info):
+        ctx.processed[song_id] = song_info.get("title", "")
+        return None
+
+    song = await ctx.registry.fetch(ctx, song_id, song_info)
+    if song is None:
+        return None
+    if genius.skip_non_songs and not song.lyrics:
+        return None
+    ctx.log(f"  Found: {song.title} by {song.artist}")
+    return song
+
+
+async def fetch_collab_songs(ctx, channel, collab):
+    """Search for collaborative songs by the collab's search term.
+
+    Like fetch_artist_songs, puts download tasks on `channel`, then None.
+    """
+    search_term = collab.term
+    ctx.log(f"\n{'=' * 60}")
+    ctx.log(f"Searching for collaborative songs: {search_term}")
+    ctx.log(f"{'=' * 60}")
 
-    songs = []
     page = 1
     while True:
         try:
-            results = genius.search_songs(search_term, per_page=20, page=page)
+            results = await ctx.run(
+                ctx.genius.search_songs, search_term, per_page=20, page=page
+            )
             hits = results.get("hits", [])
             if not hits:
                 break
@@ -153,100 +617,238 @@ def fetch_collab_songs(genius, search_term):
                 artist_name = song_info.get("primary_artist", {}).get("name", "")
 
                 # Only include if the artist matches our search
-                if (
-                    search_term.lower() in artist_name.lower()
-                    or "headache" in artist_name.lower()
-                    and "vegyn" in artist_name.lower()
-                ):
+                if collab.matches(artist_name):
                     song_id = song_info.get("id")
-                    if song_id:
-                        try:
-                            song = genius.search_song(
-                                song_info.get("title", ""),
-                                artist_name,
-                            )
-                            if song:
-                                songs.append(song)
-                                print(f"  Found: {song.title} by {song.artist}")
-                            time.sleep(0.5)  # Rate limiting
-                        except Exception as e:
-                            print(f"  Error fetching song {song_id}: {e}")
+                    if song_id and song_id not in ctx.known_ids:
+                        await channel.put(
+                            asyncio.create_task(fetch_collab_song(ctx, song_info))
+                        )
 
             page += 1
             if page > 5:  # Safety limit
                 break
 
         except Exception as e:
-            print(f"Error searching '{search_term}': {e}")
+            ctx.log(f"Error searching '{search_term}': {e}")
+            ctx.source_errors.append(search_term)
             break
+    await channel.put(None)
 
-    print(f"Found {len(songs)} collab songs for '{search_term}'")
-    return songs
 
+async def crawl(ctx):
+    """Fetch every configured source with up to `ctx.concurrency` requests in flight.
 
-def should_skip_line(line):
-    """Check if a line should be skipped."""
-    stripped = line.strip()
+    Yields songs as their downloads finish, source by source in catalog
+    order (artists, then collabs) and in listing order within a source, so
+    callers see the same ordering as a sequential crawl. A song listed by
+    several sources is yielded at least once. Songs from the retry queue
+    that no source lists again are yielded last.
+    """
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=ctx.concurrency))
 
-    if not stripped:
-        return True
+    # Songs that failed last time go first; sources listing them again
+    # share these downloads through the registry.
+    retried = [
+        (song_id, ctx.registry.fetch(ctx, song_id, song_info))
+        for song_id, song_info in ctx.retry_queue.items()
+        if song_id not in ctx.known_ids
+    ]
 
-    if len(stripped) < MIN_LINE_LENGTH:
-        return True
+    # The source being consumed and up to SOURCES_AHEAD after it list (and
+    # start downloads) at once, so memory and request slots don't grow with
+    # the catalog. Each one hands its download tasks over in listing order
+    # through its own bounded channel, and stops listing while it is full.
+    def artist_source(artist):
+        return lambda channel: fetch_artist_songs(
+            ctx, channel, artist.name, artist.id, artist.max_songs, artist.order
+        )
 
-    if len(stripped) > MAX_LINE_LENGTH:
-        return True
+    def collab_source(collab):
+        return lambda channel: fetch_collab_songs(ctx, channel, collab)
 
-    if SECTION_HEADER_RE.match(stripped):
-        return True
+    pending = collections.deque(
+        [(artist_source(artist), artist.name, False) for artist in ctx.catalog.artists]
+        + [(collab_source(collab), collab.term, True) for collab in ctx.catalog.collabs]
+    )
+    running = collections.deque()
 
-    for pattern in SKIP_PATTERNS:
-        if pattern.match(stripped):
-            return True
+    def start_sources():
+        while pending and len(running) <= SOURCES_AHEAD:
+            make_source, name, collab = pending.popleft()
+            channel = AsyncStageQueue(ctx.download_stats)
+            source = asyncio.create_task(make_source(channel))
+            running.append((channel, source, name, collab))
 
-    return False
+    start_sources()
+    while running:
+        channel, source, name, collab = running.popleft()
+        found = 0
+        while (task := await channel.get()) is not None:
+            start = time.monotonic()
+            song = await task
+            ctx.download_stats.record_get(time.monotonic() - start)
+            if song:
+                found += 1
+                ctx.registry.release(song._body["id"])
+                yield song
 
+        listed = await source
+        if collab:
+            ctx.log(f"Found {found} collab songs for '{name}'")
+        elif listed is None:
+            pass  # Listing failed; already reported
+        elif not found:
+            ctx.log(f"No {'new ' if ctx.known_ids else ''}songs found for {name}")
+        else:
+            ctx.log(f"Found {found} songs for {name} ({listed} listed)")
+        start_sources()
+
+    # They count as processed once downloaded, so they must reach the output
+    for song_id, task in retried:
+        song = await task
+        if song and not ctx.registry.released(song_id):
+            ctx.registry.release(song_id)
+            yield song
+
+
+class CrawlIncomplete(Exception):
+    """The crawl was cut short, so its songs must not replace the dataset."""
 
-def extract_quotes_from_lyrics(lyrics, song_title, artist_name, album_name):
-    """Extract individual lines and couplets from lyrics."""
-    if not lyrics:
-        return []
-
-    quotes = []
-    lines = lyrics.split("\n")
-    clean_lines = []
-
-    # First pass: clean and filter lines
-    for line in lines:
-        stripped = line.strip()
-        if not should_skip_line(stripped):
-            clean_lines.append(stripped)
-
-    # Extract individual lines
-    for line in clean_lines:
-        quotes.append(
-            {
-                "text": line,
-                "song": song_title,
-                "artist": artist_name,
-                "album": album_name or "Single",
-            }
-        )
 
-    # Extract couplets (consecutive pairs)
-    for i in range(len(clean_lines) - 1):
-        couplet = f"{clean_lines[i]} / {clean_lines[i + 1]}"
-        if len(couplet) <= MAX_LINE_LENGTH:
-            quotes.append(
-                {
-                    "text": couplet,
-                    "song": song_title,
-                    "artist": artist_name,
-                    "album": album_name or "Single",
-                }
+def stream_songs(ctx):
+    """Run the crawl in a background event loop and yield its songs as they come.
+
+    The lines the crawl logs are printed here, in the calling thread, just
+    before the song they were logged ahead of. Raises CrawlIncomplete at
+    the end if the deadline passed or a source could not be listed.
+    """
+    songs = ThreadStageQueue(ctx.song_stats)
+    done = object()
+
+    async def put_messages():
+        if ctx.messages:
+            messages, ctx.messages = ctx.messages, []
+            await songs.put_async(messages)
+
+    async def produce():
+        try:
+            async for song in crawl(ctx):
+                await put_messages()
+                await songs.put_async(song)
+        except BaseException as e:
+            await put_messages()
+            await songs.put_async(e)
+        await put_messages()
+        await songs.put_async(done)
+
+    def run():
+        asyncio.run(produce())
+
+    threading.Thread(target=run, name="crawl", daemon=True).start()
+    while (item := songs.get()) is not done:
+        if isinstance(item, BaseException):
+            raise item
+        if isinstance(item, list):
+            for message in item:
+                print(message)
+            continue
+        yield item
+    if ctx.interrupted or ctx.source_errors:
+        raise CrawlIncomplete()
+
+
+def unique_songs(songs):
+    """Drop songs already yielded under the same Genius song ID."""
+    seen_song_ids = set()
+    for song in songs:
+        song_id = song._body["id"]
+        if song_id not in seen_song_ids:
+            seen_song_ids.add(song_id)
+            yield song
+
+
+def song_quotes(
+    songs,
+    workers=0,
+    line_filter=LINE_FILTER,
+    max_lines=QUOTE_LINES,
+    max_length=MAX_LINE_LENGTH,
+):
+    """Extract the quotes of each song in turn.
+
+    Each song's lines are cleaned up front and its quotes, windows of up to
+    `max_lines` lines within `max_length` characters, are made as they are
+    consumed.
+
+    With `workers`, songs are cleaned in chunks of EXTRACT_CHUNK_SIZE on
+    that many processes. At most two chunks per worker are in flight and
+    results are yielded in song order, so the output matches a serial run.
+    The workers' line filter counts are added to `line_filter`.
+    """
+
+    def song_windows(title, source):
+        if source is None:
+            print(f"  Extracted 0 quotes from: {title}")
+            return
+        count = count_windows(source, max_lines, max_length)
+        print(f"  Extracted {count} quotes from: {title}")
+        yield from windows(source, max_lines, max_length)
+
+    if not workers:
+        for song in songs:
+            album = get_album_name(song)
+            source = extract_song_lines(
+                song.lyrics, song.title, song.artist, album, line_filter
             )
+            yield from song_windows(song.title, source)
+        return
+
+    def finish(titles, future):
+        results, lines, hits = future.result()
+        line_filter.add_counts(lines, hits)
+        for title, source in zip(titles, results):
+            yield from song_windows(title, source)
+
+    # Spawned rather than forked: the crawl thread is running by now
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(workers, mp_context=context) as pool:
+        pending = collections.deque()
+        songs = iter(songs)
+        while chunk := list(itertools.islice(songs, EXTRACT_CHUNK_SIZE)):
+            args = [
+                (song.lyrics, song.title, song.artist, get_album_name(song))
+                for song in chunk
+            ]
+            titles = [song.title for song in chunk]
+            future = pool.submit(extract_chunk, args, line_filter)
+            pending.append((titles, future))
+            if len(pending) >= 2 * workers:
+                yield from finish(*pending.popleft())
+        while pending:
+            yield from finish(*pending.popleft())
 
-    return quotes
+
+def extract_chunk(songs, line_filter):
+    """extract_song_lines for each (lyrics, title, artist, album) tuple.
+
+    Returns the SongLines along with the line filter's counts, which would
+    otherwise stay in the worker process.
+    """
+    results = [extract_song_lines(*song, line_filter) for song in songs]
+    return results, line_filter.lines, line_filter.hits
+
+
+def extract_song_lines(
+    lyrics, song_title, artist_name, album_name, line_filter=LINE_FILTER
+):
+    """The clean lines of a song's lyrics as SongLines (None without lyrics)."""
+    if not lyrics:
+        return None
+    clean_lines = line_filter.clean_lines(lyrics.split("\n"))
+    return SongLines.make(
+        song_title, artist_name, album_name or DEFAULT_ALBUM, clean_lines
+    )
 
 
 def get_album_name(song):
@@ -266,75 +868,809 @@ def get_album_name(song):
     return None
 
 
-def deduplicate_quotes(quotes):
-    """Remove duplicate quotes based on text content."""
-    seen = set()
-    unique = []
+def dedup_key(text):
+    """The normalized form two quotes are compared by."""
+    return text.lower().strip()
+
+
+def quote_digest(text):
+    """8-byte blake2b digest of a quote's normalized text, as an int."""
+    digest = hashlib.blake2b(dedup_key(text).encode("utf-8"), digest_size=8)
+    return int.from_bytes(digest.digest(), "little")
+
+
+def deduplicate_quotes(quotes, verify=False):
+    """Yield quotes whose text content hasn't been seen yet.
+
+    Quotes are remembered by digest rather than by their text. Two texts
+    sharing a digest (about 1 in 30 million for a million quotes) would
+    drop the second; with `verify`, the first quote of each digest is kept
+    to compare against, and a colliding quote is reported and yielded.
+    """
+    if not verify:
+        seen = set()
+        for quote in quotes:
+            digest = quote_digest(quote.text)
+            if digest not in seen:
+                seen.add(digest)
+                yield quote
+        return
+
+    seen = {}  # digest -> first quote (or list of quotes, after a collision)
     for quote in quotes:
-        key = quote["text"].lower().strip()
-        if key not in seen:
-            seen.add(key)
-            unique.append(quote)
-    return unique
+        digest = quote_digest(quote.text)
+        first = seen.get(digest)
+        if first is None:
+            seen[digest] = quote
+            yield quote
+            continue
+        same_digest = first if isinstance(first, list) else [first]
+        key = dedup_key(quote.text)
+        if any(dedup_key(other.text) == key for other in same_digest):
+            continue
+        print(f"  Digest collision: {quote.text!r} vs {same_digest[0].text!r}")
+        seen[digest] = same_digest + [quote]
+        yield quote
 
 
-def main():
-    genius = get_genius_client()
-    all_quotes = []
-    seen_song_ids = set()
+def count_artists(quotes, counts):
+    """Pass quotes through, tallying them per artist into `counts`."""
+    for quote in quotes:
+        counts[quote.artist] = counts.get(quote.artist, 0) + 1
+        yield quote
 
-    # Fetch songs for each main artist
-    for artist_name, artist_id, max_songs in ARTISTS:
-        songs = fetch_artist_songs(genius, artist_name, artist_id, max_songs)
-        for song in songs:
-            # breakpoint()
-            if song.title in seen_song_ids:
-                continue
-            seen_song_ids.add(song.title)
 
-            album = get_album_name(song)
-            quotes = extract_quotes_from_lyrics(
-                song.lyrics, song.title, song.artist, album
-            )
-            all_quotes.extend(quotes)
-            print(f"  Extracted {len(quotes)} quotes from: {song.title}")
+def load_manifest(path):
+    """Load the song IDs processed by earlier runs, as {song_id: title}."""
+    if not path.exists():
+        return {}
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return {int(song_id): title for song_id, title in data["songs"].items()}
 
-    # Fetch collaborative songs
-    for search_term in COLLAB_SEARCH_TERMS:
-        songs = fetch_collab_songs(genius, search_term)
-        for song in songs:
-            if song.title in seen_song_ids:
-                continue
-            seen_song_ids.add(song.title)
 
-            album = get_album_name(song)
-            quotes = extract_quotes_from_lyrics(
-                song.lyrics, song.title, song.artist, album
+def save_manifest(path, songs):
+    """Atomically write the {song_id: title} manifest."""
+    data = {"songs": {str(song_id): title for song_id, title in sorted(songs.items())}}
+    write_json(path, data, indent=2)
+
+
+def load_failed(path):
+    """Load the songs that failed in earlier runs, as {song_id: song info}."""
+    if not path.exists():
+        return {}
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return {int(song_id): info for song_id, info in data["songs"].items()}
+
+
+def save_failed(path, songs):
+    """Atomically write the failed-songs queue (removing it when empty)."""
+    if not songs:
+        path.unlink(missing_ok=True)
+        return
+    data = {"songs": {str(song_id): info for song_id, info in sorted(songs.items())}}
+    write_json(path, data, indent=2)
+
+
+def slim_song_body(body):
+    """The parts of a song's API payload that checkpoints need to keep."""
+    slim = {key: body[key] for key in CHECKPOINT_SONG_FIELDS if key in body}
+    primary_artist = body.get("primary_artist") or {}
+    slim["primary_artist"] = {
+        "id": primary_artist.get("id"),
+        "name": primary_artist.get("name"),
+    }
+    if isinstance(slim.get("album"), dict):
+        slim["album"] = {"id": slim["album"].get("id"), "name": slim["album"].get("name")}
+    return slim
+
+
+class Checkpoint:
+    """Append-only journal of the songs completed by an unfinished crawl.
+
+    One JSON line is written (and flushed) per downloaded song, so a crash or
+    a --max-runtime cutoff loses at most the songs still in flight. A rerun
+    replays journaled songs instead of downloading them again. Only each
+    entry's offset is kept in memory; entries are read back when replayed.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._offsets = {}  # song ID -> offset of its line
+        if path.exists():
+            with open(path, "rb") as f:
+                offset = 0
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        break  # Torn last line from a killed run
+                    self._offsets[entry["body"]["id"]] = offset
+                    offset += len(line)
+            # Drop a torn last line so new entries start on a line of their own
+            with open(path, "r+b") as f:
+                f.truncate(offset)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(path, "ab")
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __contains__(self, song_id):
+        return song_id in self._offsets
+
+    def song(self, song_id):
+        with open(self.path, "rb") as f:
+            f.seek(self._offsets[song_id])
+            entry = json.loads(f.readline())
+        return Song(lyrics=entry["lyrics"], body=entry["body"])
+
+    def record(self, song):
+        entry = {"body": slim_song_body(song._body), "lyrics": song.lyrics}
+        self._offsets[entry["body"]["id"]] = self._file.tell()
+        self._file.write(json.dumps(entry, ensure_ascii=False).encode("utf-8") + b"\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+    def clear(self):
+        """Delete the journal once its crawl has completed."""
+        self.close()
+        self.path.unlink(missing_ok=True)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Fetch lyrics from Genius and build data/quotes.js."
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        metavar="N",
+        help="number of Genius requests kept in flight at once "
+        f"(default: {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        metavar="PATH",
+        help="SQLite cache of Genius responses and lyrics "
+        f"(default: {CACHE_FILE} in the state dir)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="always download from Genius, without reading or writing the cache",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=DEFAULT_MAX_BYTES // (1024 * 1024),
+        metavar="MB",
+        help="evict least recently used cache entries beyond this size "
+        f"(default: {DEFAULT_MAX_BYTES // (1024 * 1024)})",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="only fetch songs missing from the manifest and merge their quotes "
+        "into the existing dataset",
+    )
+    parser.add_argument(
+        "--manifest",
+        type=Path,
+        metavar="PATH",
+        help="song IDs processed by earlier runs "
+        f"(default: {MANIFEST_FILE} in the state dir)",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        metavar="PATH",
+        help="journal of completed songs used to resume an unfinished crawl "
+        f"(default: {CHECKPOINT_FILE} in the state dir)",
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="discard any checkpoint left by an unfinished crawl",
+    )
+    parser.add_argument(
+        "--max-runtime",
+        type=float,
+        metavar="SECONDS",
+        help="stop starting new downloads after this long; the checkpoint "
+        "lets the next run carry on",
+    )
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=DEFAULT_QUEUE_SIZE,
+        metavar="N",
+        help="songs each source may download ahead of the output stage, and "
+        f"finished songs that may wait for it (default: {DEFAULT_QUEUE_SIZE})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        metavar="N",
+        help="extract quotes on N processes, for large catalogs "
+        "(default: 0, in this process)",
+    )
+    parser.add_argument(
+        "--verify-dedup",
+        action="store_true",
+        help="check quotes with matching digests against each other before "
+        "dropping one as a duplicate (keeps the first quote of each text)",
+    )
+    parser.add_argument(
+        "--external-dedup",
+        action="store_true",
+        help="deduplicate through sorted run files on disk, holding at most "
+        "--dedup-run-size keys in memory (see external_dedup.py)",
+    )
+    parser.add_argument(
+        "--dedup-run-size",
+        type=int,
+        default=DEFAULT_RUN_SIZE,
+        metavar="N",
+        help=f"keys per sorted run with --external-dedup (default: {DEFAULT_RUN_SIZE})",
+    )
+    parser.add_argument(
+        "--near-duplicates",
+        type=float,
+        nargs="?",
+        const=DEFAULT_THRESHOLD,
+        metavar="THRESHOLD",
+        help="also drop quotes whose shingle similarity to an earlier quote "
+        f"reaches THRESHOLD (default: {DEFAULT_THRESHOLD}; see near_dedup.py)",
+    )
+    parser.add_argument(
+        "--near-duplicates-report",
+        type=Path,
+        metavar="PATH",
+        help="write the near-duplicate clusters that were collapsed to PATH",
+    )
+    parser.add_argument(
+        "--filters",
+        type=Path,
+        metavar="PATH",
+        help="JSON or TOML file of line filter rules to use instead of the "
+        "built-in ones (see line_filter.py)",
+    )
+    parser.add_argument(
+        "--quote-lines",
+        type=int,
+        default=QUOTE_LINES,
+        metavar="N",
+        help="longest quote, in consecutive lines "
+        f"(default: {QUOTE_LINES}, couplets)",
+    )
+    parser.add_argument(
+        "--quote-length",
+        type=int,
+        default=MAX_LINE_LENGTH,
+        metavar="CHARS",
+        help="longest multi-line quote, in characters "
+        f"(default: {MAX_LINE_LENGTH})",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=OUTPUT_PATH,
+        metavar="PATH",
+        help="dataset to write (default: data/quotes.js)",
+    )
+    parser.add_argument(
+        "--genius-url",
+        metavar="URL",
+        help="send all Genius requests to a genius_standin.py server at URL",
+    )
+    parser.add_argument(
+        "--record",
+        type=Path,
+        metavar="DIR",
+        help="save every Genius response as a fixture for genius_standin.py "
+        "(use with --no-cache to record everything)",
+    )
+    parser.add_argument(
+        "--state-dir",
+        type=Path,
+        metavar="DIR",
+        help="directory of the cache, manifest, checkpoint and other local "
+        "state (default: .cache, or a directory under .cache/runs with "
+        "--genius-url or another --output)",
+    )
+    parser.add_argument(
+        "--catalog",
+        type=Path,
+        default=CATALOG_PATH,
+        dest="catalog_path",
+        metavar="PATH",
+        help="JSON or TOML file of the artists and collab search terms to "
+        "crawl (default: scripts/catalog.json; see catalog.py)",
+    )
+    parser.add_argument(
+        "--crawl-order",
+        choices=CRAWL_ORDERS,
+        help="order every artist's songs are downloaded (and capped) in, "
+        "instead of each artist's catalog order: title, popularity, or new "
+        "songs first (see catalog.py)",
+    )
+    parser.add_argument(
+        "--shards",
+        nargs="*",
+        metavar="NAME",
+        help="build each artist and collab search term as a shard in its own "
+        "process, then merge the shards into the dataset; with NAMEs, rebuild "
+        "only those shards and reuse the others (see shards.py)",
+    )
+    parser.add_argument(
+        "--shard-processes",
+        type=int,
+        default=DEFAULT_SHARD_PROCESSES,
+        metavar="N",
+        help="shards built at once with --shards, each with its own "
+        "--concurrency requests in flight and a share of the request rate "
+        f"(default: {DEFAULT_SHARD_PROCESSES})",
+    )
+    parser.add_argument(
+        "--schedule",
+        action="store_true",
+        help="with --shards, rebuild the shards due for a refresh, highest "
+        "priority first, within --request-budget",
+    )
+    parser.add_argument(
+        "--request-budget",
+        type=int,
+        metavar="N",
+        help="Genius requests a --schedule run may plan for, estimated from "
+        "each shard's last build (default: no limit)",
+    )
+    args = parser.parse_args(argv)
+    resolve_state_paths(args)
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    if args.queue_size < 1:
+        parser.error("--queue-size must be at least 1")
+    if args.workers < 0:
+        parser.error("--workers must not be negative")
+    if args.quote_lines < 1:
+        parser.error("--quote-lines must be at least 1")
+    if args.dedup_run_size < 1:
+        parser.error("--dedup-run-size must be at least 1")
+    if args.external_dedup and args.verify_dedup:
+        parser.error("--verify-dedup only applies to the in-memory dedup")
+    if args.near_duplicates is not None and not 0 < args.near_duplicates <= 1:
+        parser.error("--near-duplicates must be between 0 and 1")
+    if args.near_duplicates_report and args.near_duplicates is None:
+        parser.error("--near-duplicates-report needs --near-duplicates")
+    if args.shard_processes < 1:
+        parser.error("--shard-processes must be at least 1")
+    if args.schedule and args.shards != []:
+        parser.error("--schedule picks the shards itself; use it with a bare --shards")
+    if args.request_budget is not None and not args.schedule:
+        parser.error("--request-budget needs --schedule")
+    if args.request_budget is not None and args.request_budget < 1:
+        parser.error("--request-budget must be at least 1")
+    try:
+        args.catalog = Catalog.from_file(args.catalog_path)
+    except (OSError, RuntimeError, ValueError, KeyError, TypeError) as e:
+        parser.error(f"could not load catalog {args.catalog_path}: {e!r}")
+    if args.crawl_order:
+        args.catalog = args.catalog.with_order(args.crawl_order)
+    if args.shards is not None:
+        if args.incremental:
+            parser.error("--shards rebuilds whole shards; use it without --incremental")
+        if args.external_dedup:
+            parser.error("--shards already merges on disk; drop --external-dedup")
+        if args.workers:
+            parser.error("--workers does not apply to --shards")
+        names = [source.name for source in args.catalog.sources]
+        for name in args.shards:
+            if name.lower() not in {known.lower() for known in names}:
+                parser.error(f"unknown shard {name!r} (shards: {', '.join(names)})")
+    return args
+
+
+def default_state_dir(args):
+    """.cache for the real dataset; a directory of its own for any other
+    run, so stand-in data never lands in the real manifest or cache."""
+    output = args.output.resolve()
+    if not args.genius_url and output == OUTPUT_PATH.resolve():
+        return CACHE_DIR
+    name = re.sub(r"[^a-z0-9]+", "-", str(output).lower()).strip("-")
+    if args.genius_url:
+        name = "standin-" + name
+    return RUNS_DIR / name
+
+
+def resolve_state_paths(args):
+    """Fill in the state file paths not given on the command line."""
+    if args.state_dir is None:
+        args.state_dir = default_state_dir(args)
+    state_dir = args.state_dir
+    if args.cache is None:
+        args.cache = state_dir / CACHE_FILE
+    if args.manifest is None:
+        args.manifest = state_dir / MANIFEST_FILE
+    if args.checkpoint is None:
+        args.checkpoint = state_dir / CHECKPOINT_FILE
+    args.albums_path = state_dir / ALBUMS_FILE
+    args.failed_path = state_dir / FAILED_FILE
+    args.dedup_dir = state_dir / DEDUP_DIR
+    args.shard_dir = state_dir / SHARD_DIR
+    args.schedule_path = state_dir / SCHEDULE_FILE
+
+
+def print_request_stats(controller, cache, breaker, adapter_retries, recorder=None):
+    print(f"\nRate limiter: {controller.summary()}")
+    print(f"Retries: {adapter_retries} requests retried")
+    print(f"Circuit breaker: {breaker.summary()}")
+    if cache:
+        print(f"Cache: {cache.summary()}")
+        cache.close()
+    if recorder:
+        print(f"Recorded {recorder.recorded} fixtures to {recorder.fixtures_dir}")
+
+
+def print_near_duplicates(near_duplicates, report_path=None):
+    print(f"Near-duplicates: {near_duplicates.summary()}")
+    clusters = near_duplicates.report()
+    for cluster in clusters[:NEAR_DUPLICATE_EXAMPLES]:
+        dropped = cluster["dropped"]
+        print(f"  {cluster['kept']['text']!r}")
+        for quote in dropped[:NEAR_DUPLICATE_EXAMPLES]:
+            print(f"    {quote['similarity']:.2f} {quote['text']!r}")
+        if len(dropped) > NEAR_DUPLICATE_EXAMPLES:
+            print(f"    ... and {len(dropped) - NEAR_DUPLICATE_EXAMPLES} more")
+    if report_path:
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        report_path.write_text(
+            json.dumps(clusters, indent=2, ensure_ascii=False), encoding="utf-8"
+        )
+        print(f"  Wrote {len(clusters)} clusters to {report_path}")
+
+
+def print_pipeline_stats(ctx):
+    print("Pipeline queues:")
+    for stats in (ctx.download_stats, ctx.song_stats):
+        print(f"  {stats.summary()}")
+
+
+def all_shards(catalog):
+    """One shard per artist and per collab search term, in crawl order."""
+    shards = [Shard(artist.name, artists=(artist,)) for artist in catalog.artists]
+    shards += [Shard(collab.term, collabs=(collab,)) for collab in catalog.collabs]
+    slugs = [shard.slug for shard in shards]
+    if len(set(slugs)) != len(slugs):
+        raise ValueError("catalog source names must differ in letters or digits")
+    return shards
+
+
+def build_shard(shard, args, line_filter, processes=1):
+    """Crawl one shard's sources and write its files, in a worker process.
+
+    The shard gets its own client, rate limiter and circuit breaker, and
+    prints to its log file. Its rate limiter gets a `processes`th of the
+    usual rates, as that many shards run at once. It keeps no checkpoint
+    or retry queue: a shard that was interrupted or had songs fail keeps
+    its previous files and is rebuilt from the cache next time.
+    Returns the quote count (None if the shard is incomplete) and what the
+    parent merges from every shard.
+    """
+    dataset_path, keys_path, log_path = shard.paths(args.shard_dir)
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(log_path, "w", encoding="utf-8") as log, contextlib.redirect_stdout(log):
+        controller = RateController.shared_by(processes)
+        cache = None
+        if not args.no_cache:
+            cache = GeniusCache(args.cache, max_bytes=args.cache_max_mb * 1024 * 1024)
+        breaker = CircuitBreaker()
+        recorder = FixtureRecorder(args.record) if args.record else None
+        genius = get_genius_client(
+            controller, args.concurrency, cache, breaker, args.genius_url, recorder
+        )
+        adapter = genius._session.get_adapter("https://")
+        deadline = None
+        if args.max_runtime is not None:
+            deadline = time.monotonic() + args.max_runtime
+        ctx = FetchContext(
+            genius,
+            args.concurrency,
+            cache,
+            deadline=deadline,
+            albums=AlbumResolver(args.albums_path),
+            queue_size=args.queue_size,
+            catalog=Catalog(
+                shard.artists, shard.collabs, args.catalog.primary_artist_ids
+            ),
+            previous_ids=frozenset(load_manifest(args.manifest)),
+        )
+
+        def complete_songs():
+            yield from stream_songs(ctx)
+            if ctx.failed:
+                raise CrawlIncomplete()
+
+        songs = unique_songs(complete_songs())
+        quotes = song_quotes(songs, 0, line_filter, args.quote_lines, args.quote_length)
+        quotes = deduplicate_quotes(quotes, args.verify_dedup)
+        try:
+            count = write_shard(dataset_path, keys_path, quotes, quote_digest)
+        except CrawlIncomplete:
+            count = None
+        print(f"\nShard {shard.name}: {count} quotes")
+        print_request_stats(controller, cache, breaker, adapter.retries, recorder)
+        print_pipeline_stats(ctx)
+        print(f"Line filter: {line_filter.summary()}")
+    return {
+        "count": count,
+        "requests": controller.requests,
+        "interrupted": ctx.interrupted,
+        "source_errors": ctx.source_errors,
+        "failed": ctx.failed,
+        "processed": ctx.processed,
+        "album_names": ctx.albums.names,
+        "album_tracks": ctx.albums.tracks,
+        "album_fetched": ctx.albums.fetched,
+    }
+
+
+def run_sharded(args):
+    """Build the shards named by --shards (all if none are), plus any that
+    were never built, then merge every shard into the dataset.
+
+    With --schedule, only the shards the schedule picks are built. The
+    dataset is only written once every shard has been built, so a catalog
+    built up over several budgeted runs never replaces it with part of
+    the catalog.
+    """
+    line_filter = LINE_FILTER
+    if args.filters:
+        line_filter = LineFilter.from_file(args.filters)
+    shards = all_shards(args.catalog)
+    shard_dir = args.shard_dir
+    schedule = Schedule(args.schedule_path)
+    if args.schedule:
+        due = schedule.pick(args.catalog.sources, args.request_budget)
+        picked = {source.name for source in due}
+        build = [shard for shard in shards if shard.name in picked]
+    else:
+        names = {name.lower() for name in args.shards}
+        build = [
+            shard
+            for shard in shards
+            if not names
+            or shard.name.lower() in names
+            or not shard.is_built(shard_dir)
+        ]
+    processes = max(min(args.shard_processes, len(build)), 1)
+    print(
+        f"Building {len(build)} of {len(shards)} shards in {shard_dir} "
+        f"({processes} at a time, sharing the request rate)"
+    )
+    if args.schedule:
+        estimate = sum(schedule.estimate(shard.name) for shard in build)
+        print(f"  Scheduled: {', '.join(shard.name for shard in build) or 'none'}")
+        print(f"  Estimated requests: {estimate}")
+
+    albums = AlbumResolver(args.albums_path)
+    processed = {}
+    failed = []
+    errors = False
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(processes, mp_context=context) as pool:
+        futures = {
+            pool.submit(build_shard, shard, args, line_filter, processes): shard
+            for shard in build
+        }
+        for future in futures:
+            shard = futures[future]
+            log_path = shard.paths(shard_dir)[2]
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"  {shard.name}: failed ({e}); see {log_path}")
+                failed.append(shard.name)
+                errors = True
+                continue
+            albums.names.update(result["album_names"])
+            albums.tracks.update(result["album_tracks"])
+            albums.fetched.update(result["album_fetched"])
+            if result["count"] is None:
+                reason = "runtime limit reached"
+                if result["source_errors"]:
+                    reason = f"could not list {', '.join(result['source_errors'])}"
+                    errors = True
+                elif result["failed"]:
+                    reason = f"{len(result['failed'])} songs failed"
+                    errors = True
+                print(f"  {shard.name}: incomplete, {reason}; see {log_path}")
+                failed.append(shard.name)
+                continue
+            processed.update(result["processed"])
+            # A build answered from the cache makes (almost) no requests; a
+            # cold one takes at least a request per song and listing page
+            songs = len(result["processed"])
+            floor = songs + -(-songs // LISTING_PAGE_SIZE)
+            schedule.record(shard.name, max(result["requests"], floor))
+            print(
+                f"  {shard.name}: {result['count']} quotes, "
+                f"{result['requests']} requests"
             )
-            all_quotes.extend(quotes)
-            print(f"  Extracted {len(quotes)} quotes from: {song.title}")
+    albums.save()
+    schedule.save()
+
+    missing = [
+        shard.name
+        for shard in shards
+        if not shard.is_built(shard_dir) and shard.name not in failed
+    ]
+    if missing and args.schedule and not failed:
+        print(f"\nNot built yet: {', '.join(missing)}")
+        print(
+            f"{args.output} was left untouched; it is merged once the schedule "
+            "has built every shard."
+        )
+        return
+    if failed or missing:
+        print(f"\nShards not rebuilt: {', '.join(failed + missing)}")
+        print(f"{args.output} was left untouched.")
+        if errors or missing:
+            sys.exit(1)
+        return
+
+    artists = {}
+    quotes = merged_quotes(shard.paths(shard_dir)[:2] for shard in shards)
+    near_duplicates = None
+    if args.near_duplicates is not None:
+        near_duplicates = NearDuplicates(args.near_duplicates)
+        quotes = near_duplicates.filter(quotes)
+    count = write_quotes(args.output, count_artists(quotes, artists))
+    # Songs of the shards reused as they are stay in the manifest
+    known_songs = {} if len(build) == len(shards) else load_manifest(args.manifest)
+    save_manifest(args.manifest, {**known_songs, **processed})
 
-    # Deduplicate
-    all_quotes = deduplicate_quotes(all_quotes)
+    print(f"\n{'=' * 60}")
+    print(f"Done! Merged {len(shards)} shards into {count} quotes in {args.output}")
+    print(f"{'=' * 60}")
+    if near_duplicates:
+        print_near_duplicates(near_duplicates, args.near_duplicates_report)
+    print("\nQuotes per artist:")
+    for artist, count in sorted(artists.items()):
+        print(f"  {artist}: {count}")
 
-    # Save as a JS file (window.QUOTES_DATA = [...]) so it works with file:// protocol
-    output_path = Path(__file__).parent.parent / "data" / "quotes.js"
-    output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    json_str = json.dumps(all_quotes, indent=2, ensure_ascii=False)
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write("window.QUOTES_DATA = ")
-        f.write(json_str)
-        f.write(";\n")
+def main(argv=None):
+    args = parse_args(argv)
+    if args.state_dir != CACHE_DIR:
+        print(f"Keeping local state in {args.state_dir}")
+    if args.shards is not None:
+        run_sharded(args)
+        return
+    controller = RateController()
+    cache = None
+    if not args.no_cache:
+        cache = GeniusCache(args.cache, max_bytes=args.cache_max_mb * 1024 * 1024)
+    breaker = CircuitBreaker()
+    recorder = FixtureRecorder(args.record) if args.record else None
+    genius = get_genius_client(
+        controller, args.concurrency, cache, breaker, args.genius_url, recorder
+    )
+    adapter = genius._session.get_adapter("https://")
+
+    known_songs = {}
+    existing_quotes = iter(())
+    if args.incremental:
+        known_songs = load_manifest(args.manifest)
+        if not known_songs or not args.output.exists():
+            print("No manifest or existing dataset, doing a full run.")
+            known_songs = {}
+        else:
+            print(f"Incremental run: {len(known_songs)} songs already processed")
+            existing_quotes = read_quotes(args.output)
+
+    if args.restart:
+        args.checkpoint.unlink(missing_ok=True)
+    checkpoint = Checkpoint(args.checkpoint)
+    if len(checkpoint):
+        print(f"Resuming from checkpoint: {len(checkpoint)} songs already fetched")
+    deadline = None
+    if args.max_runtime is not None:
+        deadline = time.monotonic() + args.max_runtime
+    retry_queue = load_failed(args.failed_path)
+    if retry_queue:
+        print(f"Retrying {len(retry_queue)} songs that failed last run first")
+
+    ctx = FetchContext(
+        genius,
+        args.concurrency,
+        cache,
+        frozenset(known_songs),
+        checkpoint,
+        deadline,
+        AlbumResolver(args.albums_path),
+        retry_queue,
+        args.queue_size,
+        args.catalog,
+        frozenset(load_manifest(args.manifest)),
+    )
+
+    # Songs flow from the crawl through extraction and dedup straight into
+    # the output file; it only replaces the dataset if the crawl completes.
+    artists = {}
+    line_filter = LINE_FILTER
+    if args.filters:
+        line_filter = LineFilter.from_file(args.filters)
+    songs = unique_songs(stream_songs(ctx))
+    new_quotes = song_quotes(
+        songs, args.workers, line_filter, args.quote_lines, args.quote_length
+    )
+    quotes = itertools.chain(existing_quotes, new_quotes)
+    external_dedup = None
+    if args.external_dedup:
+        external_dedup = ExternalDedup(
+            quote_digest, args.dedup_run_size, args.dedup_dir
+        )
+        quotes = external_dedup.filter(quotes)
+    else:
+        quotes = deduplicate_quotes(quotes, args.verify_dedup)
+    near_duplicates = None
+    if args.near_duplicates is not None:
+        near_duplicates = NearDuplicates(args.near_duplicates)
+        quotes = near_duplicates.filter(quotes)
+    try:
+        count = write_quotes(args.output, count_artists(quotes, artists))
+    except CrawlIncomplete:
+        count = None
+    finally:
+        ctx.albums.save()
+        still_failed = {
+            song_id: info
+            for song_id, info in retry_queue.items()
+            if song_id not in ctx.processed
+        }
+        save_failed(args.failed_path, {**still_failed, **ctx.failed})
+    if ctx.failed:
+        print(f"\n{len(ctx.failed)} songs failed; the next run retries them first")
+
+    if count is None:
+        checkpoint.close()
+        if ctx.source_errors:
+            print(f"\nCould not list: {', '.join(ctx.source_errors)}")
+        else:
+            print("\nRuntime limit reached")
+        print(
+            f"{len(checkpoint)} songs are checkpointed in {args.checkpoint}. "
+            f"Run again to resume; {args.output} was left untouched."
+        )
+        print_request_stats(controller, cache, breaker, adapter.retries, recorder)
+        print_pipeline_stats(ctx)
+        if ctx.source_errors:
+            sys.exit(1)
+        return
+
+    if ctx.registry.coalesced:
+        print(f"\nShared {ctx.registry.coalesced} downloads between sources")
+
+    save_manifest(args.manifest, {**known_songs, **ctx.processed})
+    checkpoint.clear()
 
     print(f"\n{'=' * 60}")
-    print(f"Done! Saved {len(all_quotes)} quotes to {output_path}")
+    print(f"Done! Saved {count} quotes to {args.output}")
     print(f"{'=' * 60}")
+    print_request_stats(controller, cache, breaker, adapter.retries, recorder)
+    print_pipeline_stats(ctx)
+    print(f"Line filter: {line_filter.summary()}")
+    if external_dedup:
+        print(f"External dedup: {external_dedup.summary()}")
+    if near_duplicates:
+        print_near_duplicates(near_duplicates, args.near_duplicates_report)
 
     # Print summary
-    artists = {}
-    for q in all_quotes:
-        artists[q["artist"]] = artists.get(q["artist"], 0) + 1
     print("\nQuotes per artist:")
     for artist, count in sorted(artists.items()):
         print(f"  {artist}: {count}")
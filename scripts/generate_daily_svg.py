@@ -10,12 +10,13 @@ Usage:
 """
 
 import ctypes
-import json
 import re
 import textwrap
 from datetime import datetime, timezone
 from pathlib import Path
 
+from quote_data import Quote, load_quotes
+
 # ── Configuration ──────────────────────────────────────────────
 
 SVG_WIDTH = 800
@@ -99,12 +100,12 @@ def wrap_quote_text(text: str, width: int) -> list[str]:
     return textwrap.wrap(text, width=width)
 
 
-def generate_svg(quote: dict) -> str:
+def generate_svg(quote: Quote) -> str:
     """Generate an SVG string for a single quote."""
-    text = quote["text"]
-    song = quote["song"]
-    artist = quote["artist"]
-    album = quote.get("album", "")
+    text = quote.text
+    song = quote.song
+    artist = quote.artist
+    album = quote.album
 
     # Wrap the quote text
     lines = wrap_quote_text(text, QUOTE_WRAP_WIDTH)
@@ -178,11 +179,7 @@ def generate_svg(quote: dict) -> str:
 def main():
     # Load quotes
     quotes_path = Path(__file__).parent.parent / "data" / "quotes.js"
-    content = quotes_path.read_text(encoding="utf-8")
-
-    # Strip JS wrapper: "window.QUOTES_DATA = [...];\n"
-    json_str = content.replace("window.QUOTES_DATA = ", "").rstrip().rstrip(";")
-    quotes = json.loads(json_str)
+    quotes = load_quotes(quotes_path)
 
     if not quotes:
         print("Error: No quotes found in data/quotes.js")
@@ -195,9 +192,9 @@ def main():
 
     print(f"Date:  {date_str}")
     print(f"Index: {index} / {len(quotes)}")
-    print(f"Quote: \u201c{quote['text']}\u201d")
-    print(f"Song:  {quote['song']} \u2014 {quote['artist']}")
-    print(f"Album: {quote.get('album', 'N/A')}")
+    print(f"Quote: \u201c{quote.text}\u201d")
+    print(f"Song:  {quote.song} \u2014 {quote.artist}")
+    print(f"Album: {quote.album or 'N/A'}")
 
     # Generate SVG
     svg = generate_svg(quote)
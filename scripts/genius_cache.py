@@ -0,0 +1,278 @@
+"""
+Persistent SQLite cache for fetch_lyrics.py.
+
+Two tables:
+  http    raw GET responses by URL (API and listing JSON), with the
+          ETag / Last-Modified needed to revalidate them once stale.
+  lyrics  scraped lyrics text by Genius song ID, so a warm run skips both
+          the page download and the HTML parsing.
+
+Entries expire by URL class (see TTL_RULES). The least recently used
+entries are evicted once the file holds more than max_bytes of payload.
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+DAY = 24 * 60 * 60
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+LYRICS_TTL = 30 * DAY  # Past songs almost never change
+
+# First matching rule wins; matched against the full request URL
+TTL_RULES = [
+    (re.compile(r"api\.genius\.com/songs/\d+"), 30 * DAY),
+    (re.compile(r"api\.genius\.com/artists/\d+/songs"), DAY // 2),
+    (re.compile(r"api\.genius\.com/artists/\d+"), 7 * DAY),
+    (re.compile(r"genius\.com/api/artists/\d+/albums"), DAY // 2),
+    (re.compile(r"genius\.com/api/albums/\d+/tracks"), DAY // 2),
+    (re.compile(r"/search"), DAY // 2),
+]
+DEFAULT_TTL = 30 * DAY  # Anything else
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS http (
+    url TEXT PRIMARY KEY,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS lyrics (
+    song_id INTEGER PRIMARY KEY,
+    url TEXT,
+    lyrics TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+"""
+
+
+def ttl_for(url):
+    """Time-to-live in seconds for a cached response to this URL."""
+    for pattern, ttl in TTL_RULES:
+        if pattern.search(url):
+            return ttl
+    return DEFAULT_TTL
+
+
+class CachedResponse:
+    """A cached GET response, as stored in the http table."""
+
+    def __init__(self, url, headers, body, etag, last_modified, stored_at):
+        self.url = url
+        self.headers = headers
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = stored_at
+
+    @property
+    def fresh(self):
+        return time.time() - self.stored_at < ttl_for(self.url)
+
+    def conditional_headers(self):
+        """Headers that ask the server to revalidate this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self, request, adapter=None):
+        """Rebuild a requests.Response that lyricsgenius can consume."""
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = self.body
+        response.url = request.url
+        response.request = request
+        response.connection = adapter
+        return response
+
+
+class GeniusCache:
+    """Thread-safe SQLite cache of Genius responses and lyrics."""
+
+    def __init__(self, path, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(SCHEMA)
+        self._size = self._db.execute(
+            "SELECT (SELECT COALESCE(SUM(size), 0) FROM http)"
+            " + (SELECT COALESCE(SUM(size), 0) FROM lyrics)"
+        ).fetchone()[0]
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.http_hits = 0
+        self.http_misses = 0
+        self.revalidated = 0
+        self.evicted = 0
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    # ── Raw HTTP responses ────────────────────────────────────
+
+    def get_response(self, url):
+        """Cached response for a URL, fresh or stale, or None."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT headers, body, etag, last_modified, stored_at"
+                " FROM http WHERE url = ?",
+                (url,),
+            ).fetchone()
+            if row is None:
+                self.http_misses += 1
+                return None
+            self._db.execute(
+                "UPDATE http SET accessed_at = ? WHERE url = ?", (time.time(), url)
+            )
+            headers, body, etag, last_modified, stored_at = row
+            cached = CachedResponse(
+                url, json.loads(headers), body, etag, last_modified, stored_at
+            )
+            if cached.fresh:
+                self.http_hits += 1
+            else:
+                self.http_misses += 1
+        return cached
+
+    def put_response(self, url, response):
+        """Store a 200 response to a GET request."""
+        body = response.content
+        headers = {
+            key: value
+            for key, value in response.headers.items()
+            if key.lower() in ("content-type", "etag", "last-modified")
+        }
+        now = time.time()
+        with self._lock:
+            self._replace(
+                "http",
+                "url",
+                url,
+                "INSERT OR REPLACE INTO http (url, headers, body, etag,"
+                " last_modified, stored_at, accessed_at, size)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    url,
+                    json.dumps(headers),
+                    body,
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                    now,
+                    now,
+                    len(body),
+                ),
+            )
+
+    def refresh_response(self, url):
+        """Mark a stale entry fresh again after a 304 Not Modified."""
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "UPDATE http SET stored_at = ?, accessed_at = ? WHERE url = ?",
+                (now, now, url),
+            )
+            self.revalidated += 1
+
+    # ── Scraped lyrics ────────────────────────────────────────
+
+    def get_lyrics(self, song_id):
+        """Fresh cached lyrics for a song ID, or None."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT lyrics, stored_at FROM lyrics WHERE song_id = ?",
+                (song_id,),
+            ).fetchone()
+            if row is None or time.time() - row[1] >= LYRICS_TTL:
+                self.misses += 1
+                return None
+            self._db.execute(
+                "UPDATE lyrics SET accessed_at = ? WHERE song_id = ?",
+                (time.time(), song_id),
+            )
+            self.hits += 1
+        return row[0]
+
+    def put_lyrics(self, song_id, url, lyrics):
+        lyrics = lyrics or ""
+        now = time.time()
+        with self._lock:
+            self._replace(
+                "lyrics",
+                "song_id",
+                song_id,
+                "INSERT OR REPLACE INTO lyrics (song_id, url, lyrics, stored_at,"
+                " accessed_at, size) VALUES (?, ?, ?, ?, ?, ?)",
+                (song_id, url, lyrics, now, now, len(lyrics.encode("utf-8"))),
+            )
+
+    # ── Size accounting and eviction ──────────────────────────
+
+    def _replace(self, table, key_column, key, sql, params):
+        """Run an INSERT OR REPLACE, keeping the size total up to date."""
+        old = self._db.execute(
+            f"SELECT size FROM {table} WHERE {key_column} = ?", (key,)
+        ).fetchone()
+        self._db.execute(sql, params)
+        self._size += params[-1] - (old[0] if old else 0)
+        if self._size > self.max_bytes:
+            self._evict()
+
+    def _evict(self):
+        """Delete least recently used entries until under max_bytes."""
+        target = self.max_bytes * 0.9  # Leave headroom so we don't evict per insert
+        rows = self._db.execute(
+            "SELECT 'http', url, size, accessed_at FROM http"
+            " UNION ALL SELECT 'lyrics', song_id, size, accessed_at FROM lyrics"
+            " ORDER BY accessed_at"
+        )
+        victims = []
+        size = self._size
+        for table, key, entry_size, _ in rows:
+            if size <= target:
+                break
+            victims.append((table, key))
+            size -= entry_size
+        rows.close()
+        self._db.execute("BEGIN")
+        for table, key in victims:
+            key_column = "url" if table == "http" else "song_id"
+            self._db.execute(f"DELETE FROM {table} WHERE {key_column} = ?", (key,))
+        self._db.execute("COMMIT")
+        self.evicted += len(victims)
+        self._size = size
+
+    def summary(self):
+        return (
+            f"lyrics {self.hits} hits / {self.misses} misses, "
+            f"http {self.http_hits} hits / {self.http_misses} misses "
+            f"({self.revalidated} revalidated), {self.evicted} evicted, "
+            f"{self._size / (1024 * 1024):.1f} MB on disk"
+        )
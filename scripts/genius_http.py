@@ -0,0 +1,362 @@
+"""
+HTTP transport for the Genius client used by fetch_lyrics.py.
+
+Every request lyricsgenius makes goes through a requests session; mounting
+RateLimitedAdapter on that session puts one shared RateController in front
+of all of them, whichever thread or coroutine issued the call. With a
+GeniusCache attached, GET requests are answered from the cache while fresh
+and revalidated with If-None-Match / If-Modified-Since once stale; cache
+hits never take a token. Streamed requests (lyrics pages, which are only
+read up to the end of the lyrics) bypass the HTTP cache.
+
+Failed requests are retried with exponential backoff and full jitter, using
+the RetryPolicy of their request class (listing, api or lyrics). A shared
+CircuitBreaker pauses every request while Genius looks down.
+"""
+
+import random
+import re
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError, Timeout
+
+# ── Rate control defaults ─────────────────────────────────────
+
+INITIAL_RATE = 5.0  # req/s (lyricsgenius' own default sleep is 0.2s)
+MIN_RATE = 0.5  # Never slow down below this
+MAX_RATE = 20.0  # Never speed up beyond this
+BURST = 5  # Tokens the bucket can hold
+ADDITIVE_INCREASE = 1.0  # req/s gained per second of healthy traffic
+MULTIPLICATIVE_DECREASE = 0.5  # Rate factor applied on 429/5xx
+DECREASE_COOLDOWN = 1.0  # s; responses to one burst only cut the rate once
+
+# ── Circuit breaker defaults ──────────────────────────────────
+
+FAILURE_THRESHOLD = 5  # Consecutive failures that open the breaker
+RESET_TIMEOUT = 30.0  # s before the first recovery probe
+MAX_RESET_TIMEOUT = 300.0  # Probe interval doubles up to this
+GIVE_UP_AFTER = 15 * 60.0  # s of downtime after which requests fail fast
+
+
+def is_throttled(status_code):
+    """Whether a response means the API wants us to slow down."""
+    return status_code == 429 or status_code >= 500
+
+
+def parse_retry_after(value):
+    """Parse a Retry-After header (seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter for one class of request."""
+
+    def __init__(self, attempts, base_delay, max_delay):
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt):
+        """Seconds to sleep before retry number `attempt` (0-based)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+
+RETRY_POLICIES = {
+    # A lost listing page loses part of a catalog, so try hardest there
+    "listing": RetryPolicy(attempts=6, base_delay=1.0, max_delay=60.0),
+    "api": RetryPolicy(attempts=4, base_delay=1.0, max_delay=30.0),
+    "lyrics": RetryPolicy(attempts=4, base_delay=2.0, max_delay=30.0),
+}
+
+LISTING_URL_RE = re.compile(r"/(artists/\d+/(songs|albums)|albums/\d+/tracks|search)")
+API_URL_RE = re.compile(r"^https?://(api\.genius\.com/|genius\.com/api/)")
+
+
+def request_class(url):
+    """Which RETRY_POLICIES entry applies to a request URL."""
+    if LISTING_URL_RE.search(url):
+        return "listing"
+    if API_URL_RE.search(url):
+        return "api"
+    return "lyrics"
+
+
+class CircuitOpenError(ConnectionError):
+    """Genius has been unreachable for longer than the breaker waits."""
+
+
+class CircuitBreaker:
+    """Pause all Genius traffic after repeated failures, then probe recovery.
+
+    Closed: requests flow. After FAILURE_THRESHOLD consecutive failures
+    (connection errors, timeouts, 5xx) it opens, and every request blocks
+    until the reset timeout passes. Then one request is let through as a
+    probe (half-open): success closes the breaker, failure reopens it with
+    the timeout doubled. After GIVE_UP_AFTER seconds of downtime requests
+    raise CircuitOpenError instead of waiting.
+    """
+
+    def __init__(
+        self,
+        threshold=FAILURE_THRESHOLD,
+        reset_timeout=RESET_TIMEOUT,
+        max_reset_timeout=MAX_RESET_TIMEOUT,
+        give_up_after=GIVE_UP_AFTER,
+    ):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self.give_up_after = give_up_after
+        self.state = "closed"
+        self._failures = 0
+        self._timeout = reset_timeout
+        self._retry_at = 0.0
+        self._down_since = None
+        self._lock = threading.Lock()
+
+        # Counters
+        self.trips = 0
+        self.paused_time = 0.0  # Total seconds requests spent blocked
+
+    def before_request(self):
+        """Block while the breaker is open; raise once Genius seems gone."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                if self.state == "closed":
+                    break
+                now = time.monotonic()
+                if now - self._down_since > self.give_up_after:
+                    raise CircuitOpenError(
+                        f"Genius unreachable for {now - self._down_since:.0f}s"
+                    )
+                if self.state == "open" and now >= self._retry_at:
+                    self.state = "half-open"  # This request is the probe
+                    break
+                # Others wait for the probe (or the reset timeout)
+                wait = max(self._retry_at - now, 0.0) if self.state == "open" else 0.5
+            wait = min(max(wait, 0.05), 1.0)
+            time.sleep(wait)
+            waited += wait
+        if waited:
+            with self._lock:
+                self.paused_time += waited
+
+    def record_success(self):
+        with self._lock:
+            if self.state != "closed":
+                print("  Genius is reachable again, resuming")
+            self.state = "closed"
+            self._failures = 0
+            self._timeout = self.reset_timeout
+            self._down_since = None
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self.state == "open":
+                return
+            if self.state == "half-open" or self._failures >= self.threshold:
+                now = time.monotonic()
+                if self._down_since is None:
+                    self._down_since = now
+                    self.trips += 1
+                print(f"  Genius looks down, pausing requests for {self._timeout:.0f}s")
+                self.state = "open"
+                self._retry_at = now + self._timeout
+                self._timeout = min(self._timeout * 2, self.max_reset_timeout)
+
+    def summary(self):
+        return f"opened {self.trips} times, paused requests for {self.paused_time:.1f}s"
+
+
+class RateController:
+    """Token bucket shared by all Genius requests, tuned by AIMD.
+
+    Each success adds ADDITIVE_INCREASE / rate to the rate (about
+    ADDITIVE_INCREASE req/s per second), each 429/5xx multiplies it by
+    MULTIPLICATIVE_DECREASE, and a Retry-After header empties the bucket
+    until the given time.
+    """
+
+    def __init__(
+        self,
+        rate=INITIAL_RATE,
+        min_rate=MIN_RATE,
+        max_rate=MAX_RATE,
+        burst=BURST,
+    ):
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.capacity = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()  # In the future while blocked
+        self._last_decrease = float("-inf")
+        self._lock = threading.Lock()
+
+        # Counters
+        self.requests = 0
+        self.waits = 0
+        self.wait_time = 0.0  # Total seconds requests spent waiting for a token
+        self.throttled = 0
+
+    @classmethod
+    def shared_by(cls, processes):
+        """Controller for one of `processes` processes pacing Genius at once.
+
+        Every rate (and the burst) is divided between them, so together
+        they stay within the limits of a single controller.
+        """
+        return cls(
+            INITIAL_RATE / processes,
+            MIN_RATE / processes,
+            MAX_RATE / processes,
+            max(BURST / processes, 1.0),
+        )
+
+    def _refill(self, now):
+        if now > self._updated:
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+
+    def acquire(self):
+        """Block until a token is available; return the time spent waiting."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            delay = max(self._updated - now, 0.0) + max(-self._tokens, 0.0) / self.rate
+            self.requests += 1
+            if delay > 0:
+                self.waits += 1
+                self.wait_time += delay
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def observe(self, status_code, retry_after=None):
+        """Adjust the rate from a response status and Retry-After delay."""
+        with self._lock:
+            now = time.monotonic()
+            if not is_throttled(status_code):
+                self.rate = min(self.max_rate, self.rate + ADDITIVE_INCREASE / self.rate)
+                return
+
+            self.throttled += 1
+            if now - self._last_decrease >= DECREASE_COOLDOWN:
+                self.rate = max(self.min_rate, self.rate * MULTIPLICATIVE_DECREASE)
+                self._last_decrease = now
+            if retry_after:
+                self._refill(now)
+                self._tokens = min(self._tokens, 0.0)
+                self._updated = max(self._updated, now + retry_after)
+
+    def summary(self):
+        return (
+            f"{self.requests} requests, {self.throttled} throttled, "
+            f"{self.waits} waited {self.wait_time:.1f}s for a token, "
+            f"final rate {self.rate:.2f} req/s"
+        )
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """HTTPAdapter that paces, caches and retries Genius requests.
+
+    With a `base_url`, https://<host>/<path> is sent to <base_url>/<host>/<path>
+    instead (see genius_standin.py); a `recorder` is handed every response.
+    """
+
+    def __init__(
+        self,
+        controller,
+        cache=None,
+        breaker=None,
+        base_url=None,
+        recorder=None,
+        **kwargs,
+    ):
+        self.controller = controller
+        self.cache = cache
+        self.breaker = breaker
+        self.base_url = base_url.rstrip("/") if base_url else None
+        self.recorder = recorder
+        self.retries = 0  # Requests sent again after a failure
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        response = self._send_cached(request, **kwargs)
+        if self.recorder is not None:
+            self.recorder.record(request.url, response)
+        return response
+
+    def _send_cached(self, request, **kwargs):
+        # Streamed lyrics pages are read partially; their lyrics are cached instead
+        if self.cache is None or request.method != "GET" or kwargs.get("stream"):
+            return self._send_paced(request, **kwargs)
+
+        cached = self.cache.get_response(request.url)
+        if cached is not None:
+            if cached.fresh:
+                return cached.to_response(request, self)
+            request.headers.update(cached.conditional_headers())
+
+        response = self._send_paced(request, **kwargs)
+        if cached is not None and response.status_code == 304:
+            response.close()
+            self.cache.refresh_response(request.url)
+            return cached.to_response(request, self)
+        if response.status_code == 200:
+            self.cache.put_response(request.url, response)
+        return response
+
+    def _send_paced(self, request, **kwargs):
+        policy = RETRY_POLICIES[request_class(request.url)]
+        if self.base_url:
+            request = request.copy()
+            request.url = f"{self.base_url}/{request.url.split('://', 1)[1]}"
+        attempt = 0
+        while True:
+            if self.breaker:
+                self.breaker.before_request()
+            self.controller.acquire()
+            try:
+                response = super().send(request, **kwargs)
+            except (ConnectionError, Timeout):
+                if self.breaker:
+                    self.breaker.record_failure()
+                if attempt + 1 >= policy.attempts:
+                    raise
+                retry_after = None
+            else:
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                self.controller.observe(response.status_code, retry_after)
+                if self.breaker:
+                    if response.status_code >= 500:
+                        self.breaker.record_failure()
+                    else:
+                        self.breaker.record_success()
+                if not is_throttled(response.status_code) or attempt + 1 >= policy.attempts:
+                    return response
+                response.close()
+
+            # With Retry-After the controller already holds requests back
+            if not retry_after:
+                time.sleep(policy.delay(attempt))
+            attempt += 1
+            self.retries += 1
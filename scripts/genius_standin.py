@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Offline stand-in for the Genius API, for benchmarking fetch_lyrics.py.
+
+Record fixtures once with a real token:
+    python scripts/fetch_lyrics.py --no-cache --record .cache/fixtures
+
+then replay them from a local server with simulated trouble:
+    python scripts/genius_standin.py .cache/fixtures --latency 80 \\
+        --error-rate 0.02 --burst-every 200 --burst-length 10
+    python scripts/fetch_lyrics.py --genius-url http://127.0.0.1:8765 \\
+        --no-cache --output /tmp/quotes.js --concurrency 8
+
+Fixtures are one JSON file per URL (API JSON and full lyrics pages) with
+the status, a few headers and the body. The server answers
+/<host>/<path> with the fixture recorded for https://<host>/<path>, which
+is where RateLimitedAdapter sends requests when given a base URL.
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from data_files import write_json
+
+DEFAULT_FIXTURES_DIR = Path(__file__).parent.parent / ".cache" / "fixtures"
+DEFAULT_PORT = 8765
+
+# Response headers worth replaying (the rest are per-request noise)
+RECORDED_HEADERS = ("content-type", "etag", "last-modified")
+
+
+def fixture_name(url):
+    return hashlib.sha1(url.encode("utf-8")).hexdigest()[:20] + ".json"
+
+
+class FixtureRecorder:
+    """Save every response the Genius client receives as a fixture."""
+
+    def __init__(self, fixtures_dir):
+        self.fixtures_dir = Path(fixtures_dir)
+        self.fixtures_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.recorded = 0
+
+    def record(self, url, response):
+        # Reads the whole body, so streamed pages are recorded in full
+        fixture = {
+            "url": url,
+            "status": response.status_code,
+            "headers": {
+                key: value
+                for key, value in response.headers.items()
+                if key.lower() in RECORDED_HEADERS
+            },
+            "body": response.content.decode("utf-8", errors="replace"),
+        }
+        with self._lock:
+            write_json(self.fixtures_dir / fixture_name(url), fixture)
+            self.recorded += 1
+
+
+def load_fixtures(fixtures_dir):
+    """Recorded fixtures by URL."""
+    fixtures = {}
+    for path in sorted(Path(fixtures_dir).glob("*.json")):
+        fixture = json.loads(path.read_text(encoding="utf-8"))
+        body = fixture["body"].encode("utf-8")
+        headers = dict(fixture["headers"])
+        if not any(key.lower() == "etag" for key in headers):
+            headers["ETag"] = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+        fixtures[fixture["url"]] = (fixture["status"], headers, body)
+    return fixtures
+
+
+class Faults:
+    """Decides how each request to the stand-in misbehaves.
+
+    `latency` ± `jitter` seconds of delay per response; a share
+    `error_rate` of requests get a 503; and every `burst_every` requests
+    the next `burst_length` get 429 with Retry-After `retry_after`.
+    """
+
+    def __init__(
+        self,
+        latency=0.0,
+        jitter=0.0,
+        error_rate=0.0,
+        burst_every=0,
+        burst_length=0,
+        retry_after=1,
+        seed=None,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.burst_every = burst_every
+        self.burst_length = burst_length
+        self.retry_after = retry_after
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._count = 0
+
+    def next(self):
+        """(delay, status or None) for the next request."""
+        with self._lock:
+            self._count += 1
+            delay = max(
+                self.latency + self._random.uniform(-self.jitter, self.jitter), 0.0
+            )
+            if self.burst_every and self._count % self.burst_every < self.burst_length:
+                return delay, 429
+            if self._random.random() < self.error_rate:
+                return delay, 503
+        return delay, None
+
+
+class StandinServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, fixtures, faults):
+        super().__init__(address, StandinHandler)
+        self.fixtures = fixtures
+        self.faults = faults
+        self.stats = {}
+        self._stats_lock = threading.Lock()
+
+    def count(self, status):
+        with self._stats_lock:
+            self.stats[status] = self.stats.get(status, 0) + 1
+
+    def summary(self):
+        total = sum(self.stats.values())
+        by_status = ", ".join(f"{n} x {s}" for s, n in sorted(self.stats.items()))
+        return f"{total} requests ({by_status or 'none'})"
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive, like api.genius.com
+
+    def do_GET(self):
+        delay, fault = self.server.faults.next()
+        if delay:
+            time.sleep(delay)
+        if fault == 429:
+            self._reply(
+                429, {"Retry-After": str(self.server.faults.retry_after)}, b"{}"
+            )
+            return
+        if fault:
+            self._reply(fault, {}, b"{}")
+            return
+
+        url = "https://" + self.path.lstrip("/")
+        fixture = self.server.fixtures.get(url)
+        if fixture is None:
+            self._reply(404, {"Content-Type": "application/json"}, b"{}")
+            return
+        status, headers, body = fixture
+        etag = next((v for k, v in headers.items() if k.lower() == "etag"), None)
+        if status == 200 and etag and self.headers.get("If-None-Match") == etag:
+            self._reply(304, {"ETag": etag}, b"")
+            return
+        self._reply(status, headers, body)
+
+    def _reply(self, status, headers, body):
+        self.server.count(status)
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # Streaming clients hang up once they have the lyrics
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(fixtures_dir, faults, host="127.0.0.1", port=DEFAULT_PORT):
+    """Start a stand-in server in a background thread and return it."""
+    server = StandinServer((host, port), load_fixtures(fixtures_dir), faults)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Replay recorded Genius responses from a local server."
+    )
+    parser.add_argument("fixtures", nargs="?", type=Path, default=DEFAULT_FIXTURES_DIR)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument(
+        "--latency", type=float, default=0.0, metavar="MS", help="mean response delay"
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.0, metavar="MS", help="delay spread (±)"
+    )
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=0.0,
+        metavar="P",
+        help="share of requests answered with 503",
+    )
+    parser.add_argument(
+        "--burst-every",
+        type=int,
+        default=0,
+        metavar="N",
+        help="start a burst of 429s every N requests",
+    )
+    parser.add_argument("--burst-length", type=int, default=0, metavar="N")
+    parser.add_argument(
+        "--retry-after",
+        type=int,
+        default=1,
+        metavar="SECONDS",
+        help="Retry-After sent with 429s (default: 1)",
+    )
+    parser.add_argument("--seed", type=int, help="make errors reproducible")
+    args = parser.parse_args()
+
+    faults = Faults(
+        latency=args.latency / 1000,
+        jitter=args.jitter / 1000,
+        error_rate=args.error_rate,
+        burst_every=args.burst_every,
+        burst_length=args.burst_length,
+        retry_after=args.retry_after,
+        seed=args.seed,
+    )
+    server = serve(args.fixtures, faults, args.host, args.port)
+    host, port = server.server_address[:2]
+    print(f"Replaying {len(server.fixtures)} fixtures on http://{host}:{port}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    server.shutdown()
+    print(f"\nServed {server.summary()}")
+
+
+if __name__ == "__main__":
+    main()
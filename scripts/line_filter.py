@@ -0,0 +1,148 @@
+"""
+Compiled filter for the lyric lines fetch_lyrics.py drops.
+
+All rules are compiled into one regex of named alternatives, so each line
+costs a single match call instead of one per rule. Rules are tried in
+order at the start of the (stripped) line, as re.match would, and a line
+is attributed to the first rule that matches. Length limits are checked
+before any rule.
+
+Rules can be loaded from a JSON or TOML file:
+
+    min_length = 10
+    max_length = 200
+
+    [[rules]]
+    name = "section header"
+    pattern = '^\\[.*?\\]$'
+
+    [[rules]]
+    name = "contributors"
+    pattern = '^\\d+\\s*Contributors?'
+    ignore_case = true
+
+Patterns must not use numbered backreferences or global inline flags,
+since each one becomes a group of the combined regex.
+"""
+
+import re
+
+from data_files import load_config
+
+# Reasons reported for lines dropped by the length limits
+EMPTY = "empty"
+TOO_SHORT = "too short"
+TOO_LONG = "too long"
+
+
+class LineFilter:
+    """Decides which lyric lines to drop, counting hits per rule.
+
+    `rules` is a list of (name, pattern, ignore_case). Lines whose stripped
+    length is outside [min_length, max_length] are dropped before the rules
+    are tried.
+    """
+
+    def __init__(self, rules, min_length, max_length):
+        self.rules = [
+            (name, pattern, bool(ignore_case)) for name, pattern, ignore_case in rules
+        ]
+        self.min_length = min_length
+        self.max_length = max_length
+        self._group_names = {}
+        alternatives = []
+        for index, (name, pattern, ignore_case) in enumerate(self.rules):
+            group = f"rule{index}"
+            self._group_names[group] = name
+            flags = "(?i:" if ignore_case else "(?:"
+            alternatives.append(f"(?P<{group}>{flags}{pattern}))")
+        self._matcher = re.compile("|".join(alternatives) or r"(?!)")
+        self.reset()
+
+    @classmethod
+    def from_file(cls, path):
+        """Load min_length, max_length and rules from a .json or .toml file."""
+        config = load_config(path)
+        rules = [
+            (rule["name"], rule["pattern"], rule.get("ignore_case", False))
+            for rule in config["rules"]
+        ]
+        return cls(rules, config["min_length"], config["max_length"])
+
+    def reset(self):
+        """Zero the hit counters."""
+        self.lines = 0
+        self.hits = dict.fromkeys(
+            [EMPTY, TOO_SHORT, TOO_LONG] + [name for name, _, _ in self.rules], 0
+        )
+
+    # Counters don't travel to worker processes; see add_counts()
+    def __getstate__(self):
+        return self.rules, self.min_length, self.max_length
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+    def classify(self, line):
+        """Name of the rule that drops `line`, or None to keep it."""
+        stripped = line.strip()
+        length = len(stripped)
+        if not length:
+            return EMPTY
+        if length < self.min_length:
+            return TOO_SHORT
+        if length > self.max_length:
+            return TOO_LONG
+        match = self._matcher.match(stripped)
+        return self._group_names[match.lastgroup] if match else None
+
+    def should_skip(self, line):
+        return self.classify(line) is not None
+
+    def clean_lines(self, lines):
+        """The stripped lines to keep out of a whole song's lines, in order.
+
+        Every dropped line is counted against the rule that dropped it.
+        """
+        match = self._matcher.match
+        group_names = self._group_names
+        hits = self.hits
+        min_length = self.min_length
+        max_length = self.max_length
+        clean = []
+        for line in lines:
+            stripped = line.strip()
+            length = len(stripped)
+            if not length:
+                reason = EMPTY
+            elif length < min_length:
+                reason = TOO_SHORT
+            elif length > max_length:
+                reason = TOO_LONG
+            else:
+                matched = match(stripped)
+                if matched is None:
+                    clean.append(stripped)
+                    continue
+                reason = group_names[matched.lastgroup]
+            hits[reason] += 1
+        self.lines += len(lines)
+        return clean
+
+    def add_counts(self, lines, hits):
+        """Merge counters collected by a copy of this filter elsewhere."""
+        self.lines += lines
+        for name, count in hits.items():
+            self.hits[name] = self.hits.get(name, 0) + count
+
+    def summary(self):
+        dropped = sum(self.hits.values())
+        by_rule = ", ".join(
+            f"{name} {count}"
+            for name, count in sorted(self.hits.items(), key=lambda item: -item[1])
+            if count
+        )
+        return (
+            f"{self.lines} lines, {self.lines - dropped} kept, "
+            f"{dropped} dropped ({by_rule or 'none'})"
+        )
@@ -0,0 +1,208 @@
+"""
+Streaming lyrics extractor for Genius song pages.
+
+lyricsgenius downloads the whole song page (a few hundred KB, mostly
+scripts and sidebars) and builds a BeautifulSoup tree of it to read the
+lyrics. Here the page is fed chunk by chunk to an incremental tokenizer
+(html.parser) that only keeps text inside `data-lyrics-container` divs and
+stops reading once the `#lyrics-root` section that holds them has closed.
+
+The text is the same as Genius.lyrics(song_url=...) returns with
+remove_section_headers off: <br> becomes a newline, LyricsHeader divs and
+container children marked data-exclude-from-selection are dropped, and an
+empty container counts as a blank line. Pages without containers fall back
+to the lyrics HTML embedded in the page's preloaded state, like lyricsgenius.
+"""
+
+import json
+import re
+from html.parser import HTMLParser
+
+from lyricsgenius.utils import decode_js_string
+
+CHUNK_SIZE = 16 * 1024
+
+VOID_ELEMENTS = frozenset(
+    "area base br col embed hr img input link meta param source track wbr".split()
+)
+
+# `window.__PRELOADED_STATE__ = JSON.parse('...')`, a single-quoted JS string
+PRELOADED_STATE_RE = re.compile(
+    r"window\.__PRELOADED_STATE__\s*=\s*JSON\.parse\('((?:[^'\\]|\\.)*)'\)", re.S
+)
+
+
+class LyricsPageParser(HTMLParser):
+    """Incremental tokenizer collecting the text of lyrics containers.
+
+    Feed it page text with feed(); once `done` is set the rest of the page
+    can be skipped. `text()` returns the lyrics read so far.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self._stack = []  # Open elements as (tag, role)
+        self._container_depth = None  # Stack length of a container's children
+        self._container_empty = False
+        self._skip = 0  # Open elements whose text is dropped
+        self._parts = []
+        self.containers = 0
+        self.done = False
+
+    def _in_container(self):
+        return self._container_depth is not None and not self._skip
+
+    def _is_direct_child(self):
+        return len(self._stack) == self._container_depth
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        attrs = dict(attrs)
+        header = tag == "div" and "LyricsHeader" in (attrs.get("class") or "")
+        # lyricsgenius removes headers first, so they don't make a container non-empty
+        if self._container_depth is not None and self._is_direct_child() and not header:
+            self._container_empty = False
+        if tag in VOID_ELEMENTS:
+            if tag == "br" and self._in_container():
+                self._parts.append("\n")
+            return
+
+        role = None
+        if header:
+            role = "skip"
+        elif (
+            self._container_depth is not None
+            and self._is_direct_child()
+            and attrs.get("data-exclude-from-selection") == "true"
+        ):
+            role = "skip"
+        elif (
+            tag == "div"
+            and self._container_depth is None
+            and attrs.get("data-lyrics-container") == "true"
+        ):
+            role = "container"
+            self._container_depth = len(self._stack) + 1
+            self._container_empty = True
+            self.containers += 1
+        elif attrs.get("id") == "lyrics-root":
+            role = "root"
+
+        self._stack.append((tag, role))
+        if role == "skip":
+            self._skip += 1
+
+    def handle_endtag(self, tag):
+        if self.done or tag in VOID_ELEMENTS:
+            return
+        # Close up to the matching open element; ignore stray end tags
+        for index in range(len(self._stack) - 1, -1, -1):
+            if self._stack[index][0] == tag:
+                break
+        else:
+            return
+        while len(self._stack) > index:
+            _, role = self._stack.pop()
+            if role == "skip":
+                self._skip -= 1
+            elif role == "container":
+                if self._container_empty:
+                    self._parts.append("\n")
+                self._container_depth = None
+            elif role == "root" and self.containers:
+                self.done = True
+
+    def handle_data(self, data):
+        if self.done or self._container_depth is None:
+            return
+        if self._is_direct_child():
+            self._container_empty = False
+        if not self._skip:
+            self._parts.append(data)
+
+    def handle_comment(self, data):
+        # BeautifulSoup keeps comments that are direct container children
+        if self.done or self._container_depth is None:
+            return
+        if self._is_direct_child():
+            self._container_empty = False
+            if not self._skip:
+                self._parts.append(data)
+
+    def text(self):
+        return "".join(self._parts)
+
+
+class _FragmentText(HTMLParser):
+    """All text of an HTML fragment, with <br> as newlines."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "br":
+            self.parts.append("\n")
+
+    def handle_data(self, data):
+        self.parts.append(data)
+
+
+def preloaded_lyrics(page):
+    """Lyrics from the HTML embedded in a page's preloaded state, or None."""
+    match = PRELOADED_STATE_RE.search(page)
+    if not match:
+        return None
+    try:
+        state = json.loads(decode_js_string(match.group(1)))
+        html = state["songPage"]["lyricsData"]["body"]["html"]
+    except (ValueError, KeyError, TypeError):
+        return None
+    if not isinstance(html, str):
+        return None
+    # Its newlines are only formatting; line breaks come from <br> tags
+    parser = _FragmentText()
+    parser.feed(html.replace("\n", ""))
+    parser.close()
+    lyrics = "".join(parser.parts)
+    return lyrics if lyrics.strip() else None
+
+
+def parse_lyrics_chunks(chunks):
+    """Lyrics from an iterable of page text chunks, or None if there are none.
+
+    Stops consuming `chunks` as soon as the lyrics section has been read.
+    """
+    parser = LyricsPageParser()
+    page = []  # Only kept in case we need the preloaded-state fallback
+    for chunk in chunks:
+        parser.feed(chunk)
+        if parser.done:
+            break
+        if not parser.containers:
+            page.append(chunk)
+    else:
+        parser.close()
+
+    if parser.containers:
+        return parser.text().strip("\n")
+    lyrics = preloaded_lyrics("".join(page))
+    return lyrics.strip("\n") if lyrics is not None else None
+
+
+def read_lyrics_page(session, url, timeout=None):
+    """Stream a Genius song page and return its lyrics, or None.
+
+    The response is closed as soon as the lyrics have been read, so the
+    rest of the page is never downloaded.
+    """
+    with session.get(url, stream=True, timeout=timeout) as response:
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        if response.encoding is None:
+            response.encoding = "utf-8"
+        return parse_lyrics_chunks(
+            response.iter_content(chunk_size=CHUNK_SIZE, decode_unicode=True)
+        )
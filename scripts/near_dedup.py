@@ -0,0 +1,185 @@
+"""
+Near-duplicate quote detection with MinHash signatures and LSH banding.
+
+Exact dedup keeps a chorus line that comes back with one word changed,
+different punctuation or different case. This stage compares quotes by the
+Jaccard similarity of their character shingles (runs of SHINGLE_SIZE
+characters of the text, lowercased with punctuation dropped) and drops a
+quote whose similarity to an earlier kept quote reaches the threshold. The
+earlier quote stands for the cluster, so output order is preserved and the
+first version of a line wins, as with exact dedup.
+
+Comparing every pair is quadratic, so each quote gets a MinHash signature
+and only quotes that agree on all rows of at least one LSH band are
+compared. The number of rows per band is picked from the threshold: pairs
+well below it rarely share a band, pairs above it almost always do.
+Candidates are then checked against the exact shingle similarity, so the
+signatures only affect which near-duplicates are found, never what is
+dropped.
+
+Signatures use one-permutation hashing: each shingle is hashed once and
+lands in one of SIGNATURE_SIZE bins, each bin keeps its minimum, and empty
+bins borrow from the next filled one. That costs one hash per shingle
+rather than one per shingle per permutation, which is what keeps pure
+Python fast enough for hundreds of thousands of quotes.
+
+Stdlib only.
+"""
+
+import re
+import zlib
+
+DEFAULT_THRESHOLD = 0.8
+SHINGLE_SIZE = 5
+SIGNATURE_SIZE = 64  # Bins per signature
+
+_BIN_BITS = SIGNATURE_SIZE.bit_length() - 1
+_VALUE_BITS = 32 - _BIN_BITS
+_VALUE_MASK = (1 << _VALUE_BITS) - 1
+_NOT_WORD = re.compile(r"[^\w\s]+")
+_SPACES = re.compile(r"\s+")
+
+
+def normalize(text):
+    """Lowercased text without punctuation and with single spaces."""
+    return _SPACES.sub(" ", _NOT_WORD.sub("", text.lower())).strip()
+
+
+def shingles(text, size=SHINGLE_SIZE):
+    """The set of hashed character shingles of a quote's normalized text."""
+    data = normalize(text).encode("utf-8")
+    if len(data) <= size:
+        return {zlib.crc32(data)}
+    return {zlib.crc32(data[i : i + size]) for i in range(len(data) - size + 1)}
+
+
+def jaccard(a, b):
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+
+def signature(hashes):
+    """One-permutation MinHash signature of a set of 32-bit shingle hashes."""
+    bins = [None] * SIGNATURE_SIZE
+    for value in hashes:
+        value = (value * 0x9E3779B1) & 0xFFFFFFFF  # Spread crc32 over the bins
+        index = value >> _VALUE_BITS
+        value &= _VALUE_MASK
+        if bins[index] is None or value < bins[index]:
+            bins[index] = value
+    # Densify: an empty bin takes the next filled bin's value (wrapping
+    # around), offset by the distance so it can't pass for that bin
+    filled = [i for i, value in enumerate(bins) if value is not None]
+    if not filled:
+        return tuple(bins)
+    following = filled[0] + SIGNATURE_SIZE
+    for i in range(SIGNATURE_SIZE - 1, -1, -1):
+        if bins[i] is not None:
+            following = i
+        else:
+            distance = following - i
+            source = following % SIGNATURE_SIZE
+            bins[i] = bins[source] + (distance << _VALUE_BITS)
+    return tuple(bins)
+
+
+def lsh_bands(threshold, size=SIGNATURE_SIZE):
+    """(bands, rows) for `threshold`: as many rows as keep the LSH
+    threshold, (1 / bands) ** (1 / rows), at or below it."""
+    best = (size, 1)
+    for rows in range(1, size + 1):
+        bands = size // rows
+        if (1 / bands) ** (1 / rows) <= threshold:
+            best = (bands, rows)
+    return best
+
+
+class NearDuplicates:
+    """Drops quotes that are near-duplicates of an earlier quote.
+
+    Counts what it drops per cluster; see summary() and report().
+    """
+
+    def __init__(self, threshold=DEFAULT_THRESHOLD):
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold must be in (0, 1]")
+        self.threshold = threshold
+        self.bands, self.rows = lsh_bands(threshold)
+        self._buckets = {}  # Band hash -> index of a kept quote, or a list
+        self._kept = []  # Quotes kept so far, by index
+        self.clusters = {}  # Kept index -> [(dropped quote, similarity)]
+        self.quotes = 0
+        self.compared = 0  # Candidate pairs checked exactly
+
+    def _band_keys(self, sig):
+        rows = self.rows
+        return [
+            hash((band,) + sig[band * rows : (band + 1) * rows])
+            for band in range(self.bands)
+        ]
+
+    def _candidates(self, keys):
+        found = set()
+        for key in keys:
+            entry = self._buckets.get(key)
+            if entry is None:
+                continue
+            if isinstance(entry, list):
+                found.update(entry)
+            else:
+                found.add(entry)
+        return sorted(found)
+
+    def filter(self, quotes):
+        """Yield the quotes that aren't near-duplicates of one already yielded."""
+        for quote in quotes:
+            self.quotes += 1
+            hashes = shingles(quote.text)
+            keys = self._band_keys(signature(hashes))
+            match = None
+            for index in self._candidates(keys):
+                self.compared += 1
+                similarity = jaccard(hashes, shingles(self._kept[index].text))
+                if similarity >= self.threshold:
+                    match = index
+                    break
+            if match is not None:
+                self.clusters.setdefault(match, []).append((quote, similarity))
+                continue
+
+            index = len(self._kept)
+            self._kept.append(quote)
+            for key in keys:
+                entry = self._buckets.get(key)
+                if entry is None:
+                    self._buckets[key] = index
+                elif isinstance(entry, list):
+                    entry.append(index)
+                else:
+                    self._buckets[key] = [entry, index]
+            yield quote
+
+    def summary(self):
+        dropped = sum(len(members) for members in self.clusters.values())
+        return (
+            f"{self.quotes} quotes, {dropped} near-duplicates dropped in "
+            f"{len(self.clusters)} clusters (threshold {self.threshold}, "
+            f"{self.bands} bands x {self.rows} rows, "
+            f"{self.compared} pairs compared)"
+        )
+
+    def report(self):
+        """The collapsed clusters, largest first, as JSON-ready dicts."""
+        clusters = []
+        for index, members in self.clusters.items():
+            kept = self._kept[index]
+            clusters.append(
+                {
+                    "kept": kept.to_dict(),
+                    "dropped": [
+                        {**quote.to_dict(), "similarity": round(similarity, 3)}
+                        for quote, similarity in members
+                    ],
+                }
+            )
+        clusters.sort(key=lambda cluster: -len(cluster["dropped"]))
+        return clusters
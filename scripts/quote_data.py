@@ -0,0 +1,326 @@
+"""
+Quote records and the data/quotes.js dataset format.
+
+A quote is a window of consecutive clean lines of one song: a single line,
+a couplet shown as "line / line", or a longer run (see windows()). Quotes
+don't hold their text; they reference the song's lines (SongLines) by start
+and length, and the text is joined on demand. The song, artist and album
+names are interned, so a big catalog holds one copy of each name however
+many quotes share it.
+
+The dataset stores each song's lines once, with its quotes as
+[start, length] pairs into them, in the order they are shown:
+
+    window.QUOTES_DATA = [
+      {
+        "song": "Nothing Lasts Forever",
+        "artist": "Vegyn",
+        "album": "Only Diamonds Cut Diamonds",
+        "lines": [
+          "first clean line",
+          "second clean line"
+        ],
+        "quotes": [[0,1],[1,1],[0,2]]
+      }
+    ];
+
+js/app.js and generate_daily_svg.py number quotes in that order, record
+after record; load_quotes() gets the N-th one without making the others.
+read_quotes() also accepts the older format, a flat array of
+{"text", "song", "artist", "album"} objects.
+
+Stdlib only, so generate_daily_svg.py can import it in CI.
+"""
+
+import array
+import bisect
+import collections.abc
+import itertools
+import json
+import operator
+import sys
+from typing import NamedTuple
+
+DEFAULT_ALBUM = "Single"
+SEPARATOR = " / "  # Between the lines of a multi-line quote
+
+_song_key = operator.attrgetter("song", "artist", "album")
+
+
+class SongLines(NamedTuple):
+    """The clean lines of one song, which quotes point into."""
+
+    song: str
+    artist: str
+    album: str
+    lines: tuple
+
+    @classmethod
+    def make(cls, song, artist, album, lines):
+        """SongLines whose metadata strings are interned."""
+        return cls(
+            sys.intern(song), sys.intern(artist), sys.intern(album), tuple(lines)
+        )
+
+
+class Quote(NamedTuple):
+    """`length` consecutive lines of a song, starting at line `start`."""
+
+    source: SongLines
+    start: int
+    length: int
+
+    @classmethod
+    def from_text(cls, text, song, artist, album):
+        """A Quote for text that isn't part of any song's lines yet."""
+        lines = text.split(SEPARATOR)
+        return cls(SongLines.make(song, artist, album, lines), 0, len(lines))
+
+    @classmethod
+    def from_dict(cls, data):
+        album = data.get("album", DEFAULT_ALBUM)
+        return cls.from_text(data["text"], data["song"], data["artist"], album)
+
+    @property
+    def lines(self):
+        return self.source.lines[self.start : self.start + self.length]
+
+    @property
+    def text(self):
+        return SEPARATOR.join(self.lines)
+
+    @property
+    def song(self):
+        return self.source.song
+
+    @property
+    def artist(self):
+        return self.source.artist
+
+    @property
+    def album(self):
+        return self.source.album
+
+    def to_dict(self):
+        return {
+            "text": self.text,
+            "song": self.song,
+            "artist": self.artist,
+            "album": self.album,
+        }
+
+
+def _window_lengths(lines):
+    """Text length of lines[start : start + length] via prefix sums."""
+    prefix = list(itertools.accumulate(map(len, lines), initial=0))
+    separator = len(SEPARATOR)
+
+    def text_length(start, length):
+        return prefix[start + length] - prefix[start] + (length - 1) * separator
+
+    return text_length
+
+
+def windows(source, max_lines=2, max_length=None):
+    """Lazily yield the quotes of a song, shortest first.
+
+    Every single line, then every run of 2, 3, ... up to `max_lines`
+    consecutive lines whose joined text is at most `max_length` characters
+    (single lines are bounded by the line filter instead).
+    """
+    count = len(source.lines)
+    for start in range(count):
+        yield Quote(source, start, 1)
+    if max_lines < 2:
+        return
+    text_length = _window_lengths(source.lines)
+    for length in range(2, max_lines + 1):
+        for start in range(count - length + 1):
+            if max_length is None or text_length(start, length) <= max_length:
+                yield Quote(source, start, length)
+
+
+def count_windows(source, max_lines=2, max_length=None):
+    """How many quotes windows() yields, without making them."""
+    count = len(source.lines)
+    if max_lines < 2:
+        return count
+    text_length = _window_lengths(source.lines)
+    return count + sum(
+        1
+        for length in range(2, max_lines + 1)
+        for start in range(count - length + 1)
+        if max_length is None or text_length(start, length) <= max_length
+    )
+
+
+class QuoteList(collections.abc.Sequence):
+    """The quotes of a dataset, indexed without expanding them all.
+
+    Holds each song's lines and its windows packed into an array of
+    start, length pairs; a Quote is only made for the index asked for.
+    """
+
+    def __init__(self, records):
+        self._sources = []
+        self._windows = []
+        self._offsets = []  # Index of each record's first quote
+        total = 0
+        for source, song_windows in records:
+            self._sources.append(source)
+            self._windows.append(array.array("I", itertools.chain(*song_windows)))
+            self._offsets.append(total)
+            total += len(song_windows)
+        self._len = total
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._len))]
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("quote index out of range")
+        record = bisect.bisect_right(self._offsets, index) - 1
+        pairs = self._windows[record]
+        offset = 2 * (index - self._offsets[record])
+        return Quote(self._sources[record], pairs[offset], pairs[offset + 1])
+
+
+class _Record:
+    """One song's entry in the dataset, built up quote by quote.
+
+    Each quote's lines are looked up in the lines stored so far and only
+    added when they aren't there yet, so lines shared by several quotes
+    (a line and the couplets around it) are written once.
+    """
+
+    def __init__(self, song, artist, album):
+        self.song = song
+        self.artist = artist
+        self.album = album
+        self.lines = []
+        self.windows = []
+        self._positions = {}  # line -> indexes in self.lines
+
+    def add(self, quote):
+        lines = list(quote.lines)
+        start = self._find(lines)
+        if start is None:
+            start = self._append(lines)
+        self.windows.append([start, len(lines)])
+
+    def _find(self, lines):
+        for start in self._positions.get(lines[0], ()):
+            if self.lines[start : start + len(lines)] == lines:
+                return start
+        return None
+
+    def _append(self, lines):
+        # Reuse the tail of the stored lines when the quote starts with it
+        overlap = min(len(lines) - 1, len(self.lines))
+        while overlap and self.lines[-overlap:] != lines[:overlap]:
+            overlap -= 1
+        start = len(self.lines) - overlap
+        for line in lines[overlap:]:
+            self._positions.setdefault(line, []).append(len(self.lines))
+            self.lines.append(line)
+        return start
+
+    def to_json(self):
+        dumps = json.dumps
+        rows = ",\n    ".join(dumps(line, ensure_ascii=False) for line in self.lines)
+        return (
+            "{\n"
+            f'  "song": {dumps(self.song, ensure_ascii=False)},\n'
+            f'  "artist": {dumps(self.artist, ensure_ascii=False)},\n'
+            f'  "album": {dumps(self.album, ensure_ascii=False)},\n'
+            f'  "lines": [\n    {rows}\n  ],\n'
+            f'  "quotes": {dumps(self.windows, separators=(",", ":"))}\n'
+            "}"
+        )
+
+
+def read_records(path, chunk_size=64 * 1024):
+    """Yield (SongLines, [[start, length], ...]) for each song of a dataset.
+
+    The file is read in chunks; nothing is yielded if it is missing.
+    """
+    if not path.exists():
+        return
+    decoder = json.JSONDecoder()
+    with open(path, encoding="utf-8") as f:
+        buffer = ""
+        while "[" not in buffer:  # Skip "window.QUOTES_DATA = ["
+            more = f.read(chunk_size)
+            if not more:
+                raise ValueError(f"{path} holds no quotes array")
+            buffer += more
+        pos = buffer.index("[") + 1
+        eof = False
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                pos += 1
+            if pos < len(buffer) and buffer[pos] == "]":
+                return
+            try:
+                item, pos = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                more = f.read(chunk_size)
+                eof = not more
+                buffer = buffer[pos:] + more
+                pos = 0
+                continue
+            if "text" in item:  # Older format: one object per quote
+                quote = Quote.from_dict(item)
+                yield quote.source, [[0, quote.length]]
+                continue
+            source = SongLines.make(
+                item["song"], item["artist"], item["album"], item["lines"]
+            )
+            yield source, item["quotes"]
+
+
+def read_quotes(path):
+    """Yield the Quotes of a data/quotes.js file one by one (none if missing)."""
+    for source, song_windows in read_records(path):
+        for start, length in song_windows:
+            yield Quote(source, start, length)
+
+
+def load_quotes(path):
+    """The quotes of a data/quotes.js file as a QuoteList."""
+    return QuoteList(read_records(path))
+
+
+def write_quotes(path, quotes):
+    """Save quotes as a JS file (window.QUOTES_DATA = [...]) so it works with file://
+
+    Consecutive quotes of the same song go into one record. Records are
+    written as they complete, to a temporary file that replaces `path` once
+    `quotes` is exhausted. If it raises instead, `path` is left untouched.
+    Returns the number of quotes written.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    count = 0
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write("window.QUOTES_DATA = [")
+            for key, song_quotes in itertools.groupby(quotes, key=_song_key):
+                record = _Record(*key)
+                for quote in song_quotes:
+                    record.add(quote)
+                f.write(",\n  " if count else "\n  ")
+                f.write(record.to_json().replace("\n", "\n  "))
+                count += len(record.windows)
+            f.write("\n];\n" if count else "];\n")
+        tmp_path.replace(path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return count
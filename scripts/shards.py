@@ -0,0 +1,114 @@
+"""
+Sharded dataset builds: one intermediate file per source, merged at the end.
+
+With --shards, fetch_lyrics.py builds each artist and each collab search
+term as its own shard, in its own process. A shard's quotes, deduplicated
+within the shard, are written as a dataset file (the same format as
+data/quotes.js), and next to it a keys file holding each quote's
+(digest, position) key in sorted order, as the run files of
+external_dedup.py.
+
+merged_quotes() then k-way merges the keys files of every shard with a heap.
+In the merged order the first key of each digest is the earliest quote with
+that text, counting shards in order, so the merged dataset is what a single
+crawl of all the sources in the same order would have kept. Only one bit
+per quote is held in memory while merging.
+
+Rebuilding one shard leaves the other shards' files untouched; the merge
+reads them as they are. Stdlib only.
+"""
+
+import heapq
+import re
+from pathlib import Path
+from typing import NamedTuple
+
+from external_dedup import KEY_SIZE, make_key, read_run, split_key, write_run
+from quote_data import read_quotes, write_quotes
+
+
+class Shard(NamedTuple):
+    """The sources one shard crawls (catalog.Artist and catalog.Collab)."""
+
+    name: str
+    artists: tuple = ()
+    collabs: tuple = ()
+
+    @property
+    def slug(self):
+        return re.sub(r"[^a-z0-9]+", "-", self.name.lower()).strip("-")
+
+    def paths(self, shard_dir):
+        """(dataset, keys file, log) paths of this shard under `shard_dir`."""
+        base = Path(shard_dir) / self.slug
+        return (
+            base.with_suffix(".js"),
+            base.with_suffix(".keys"),
+            base.with_suffix(".log"),
+        )
+
+    def is_built(self, shard_dir):
+        dataset_path, keys_path, _ = self.paths(shard_dir)
+        return dataset_path.exists() and keys_path.exists()
+
+
+def write_shard(dataset_path, keys_path, quotes, digest):
+    """Write `quotes` to a shard's dataset and keys files; returns the count.
+
+    Both files are written next to their targets and only replace them once
+    the quotes are exhausted, so a failed build leaves the previous shard.
+    """
+    keys = []
+
+    def keyed():
+        for position, quote in enumerate(quotes):
+            keys.append(make_key(digest(quote.text), position))
+            yield quote
+
+    keys_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = keys_path.with_suffix(".keys.tmp")
+    try:
+        # write_quotes only replaces the dataset once it has all the quotes
+        count = write_quotes(dataset_path, keyed())
+        keys.sort()
+        write_run(tmp_path, keys)
+        tmp_path.replace(keys_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return count
+
+
+def merged_quotes(shard_files):
+    """Yield the quotes of every shard that don't repeat an earlier one.
+
+    `shard_files` lists each shard's (dataset path, keys path) in shard
+    order. Quotes are yielded in that order, and within a shard in dataset
+    order. Raises ValueError if a dataset doesn't match its keys file.
+    """
+    shard_files = list(shard_files)
+    sizes = [keys_path.stat().st_size // KEY_SIZE for _, keys_path in shard_files]
+    keep = [bytearray((size + 7) // 8) for size in sizes]
+
+    def shard_keys(index, keys_path):
+        for key in read_run(keys_path):
+            digest, position = split_key(key)
+            yield digest, index, position
+
+    previous = None
+    merged = heapq.merge(
+        *(shard_keys(i, keys_path) for i, (_, keys_path) in enumerate(shard_files))
+    )
+    for digest, index, position in merged:
+        if digest != previous:
+            previous = digest
+            keep[index][position >> 3] |= 1 << (position & 7)
+
+    for (dataset_path, keys_path), size, bits in zip(shard_files, sizes, keep):
+        position = -1
+        for position, quote in enumerate(read_quotes(dataset_path)):
+            if position >= size:
+                break
+            if bits[position >> 3] >> (position & 7) & 1:
+                yield quote
+        if position + 1 != size:
+            raise ValueError(f"{dataset_path} does not match {keys_path}")
@@ -0,0 +1,107 @@
+"""
+Bounded queues between the stages of the fetch_lyrics.py pipeline.
+
+    listing --(download tasks)--> downloads --(songs)--> extraction/dedup/write
+
+Each link is a bounded queue: a producer that gets ahead of its consumer
+blocks until there is room again, so a slow stage holds the ones before it
+back instead of letting work pile up in memory. QueueStats records how full
+each queue ran and how long each side spent blocked; a producer that spends
+its time blocked points at a slow consumer, and a consumer that spends its
+time waiting points at a slow producer.
+"""
+
+import asyncio
+import queue
+import threading
+import time
+
+PUT_POLL_INTERVAL = 0.01  # s between put attempts from the event loop
+
+
+class QueueStats:
+    """Depth and blocked-time counters for one link of the pipeline."""
+
+    def __init__(self, name, producer, consumer, maxsize):
+        self.name = name
+        self.producer = producer
+        self.consumer = consumer
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+
+        # Counters
+        self.items = 0
+        self.max_depth = 0
+        self.depth_total = 0  # Sum of the depths seen by each put
+        self.put_blocked = 0.0  # Seconds producers spent on a full queue
+        self.get_blocked = 0.0  # Seconds consumers spent waiting for items
+
+    def record_put(self, depth, blocked):
+        with self._lock:
+            self.items += 1
+            self.max_depth = max(self.max_depth, depth)
+            self.depth_total += depth
+            self.put_blocked += blocked
+
+    def record_get(self, blocked):
+        with self._lock:
+            self.get_blocked += blocked
+
+    def summary(self):
+        mean = self.depth_total / self.items if self.items else 0.0
+        return (
+            f"{self.name}: {self.items} items, depth avg {mean:.1f} / "
+            f"max {self.max_depth} (limit {self.maxsize}), "
+            f"{self.producer} blocked {self.put_blocked:.1f}s, "
+            f"{self.consumer} waited {self.get_blocked:.1f}s"
+        )
+
+
+class AsyncStageQueue(asyncio.Queue):
+    """Bounded asyncio queue between two coroutines, recording into `stats`.
+
+    Several queues may share one QueueStats.
+    """
+
+    def __init__(self, stats):
+        super().__init__(stats.maxsize)
+        self.stats = stats
+
+    async def put(self, item):
+        start = time.monotonic()
+        await super().put(item)
+        self.stats.record_put(self.qsize(), time.monotonic() - start)
+
+    async def get(self):
+        start = time.monotonic()
+        item = await super().get()
+        self.stats.record_get(time.monotonic() - start)
+        return item
+
+
+class ThreadStageQueue(queue.Queue):
+    """Bounded queue from an event loop to a consumer thread.
+
+    The event loop side calls `await put_async()`, which waits without
+    blocking the loop; the consumer thread calls get().
+    """
+
+    def __init__(self, stats):
+        super().__init__(stats.maxsize)
+        self.stats = stats
+
+    async def put_async(self, item):
+        start = time.monotonic()
+        while True:
+            try:
+                self.put_nowait(item)
+                break
+            except queue.Full:
+                await asyncio.sleep(PUT_POLL_INTERVAL)
+        self.stats.record_put(self.qsize(), time.monotonic() - start)
+
+    def get(self, block=True, timeout=None):
+        start = time.monotonic()
+        item = super().get(block, timeout)
+        self.stats.record_get(time.monotonic() - start)
+        return item